@@ -1,10 +1,44 @@
-import asyncio
+import time
 
-from pybattletank.main import run
+STARTED = time.perf_counter()
 
+import sys  # noqa: E402
+from typing import Optional  # noqa: E402
 
-def main() -> None:
-    asyncio.run(run())
+from pybattletank.cli import batch, benchmark, build_parser, replay, simulate  # noqa: E402
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    if args.command == "simulate":
+        sys.exit(simulate(args))
+    if args.command == "replay":
+        sys.exit(replay(args))
+    if args.command == "batch":
+        sys.exit(batch(args))
+    if args.command == "benchmark":
+        sys.exit(benchmark(args))
+
+    import asyncio
+
+    from pybattletank.main import run
+    from pybattletank.ui.startup_report import StartupReport
+
+    startup_report = None
+    if args.startup_report:
+        startup_report = StartupReport(STARTED)
+        startup_report.mark("imports")
+    asyncio.run(
+        run(
+            args.dirty_rects,
+            args.level_cache,
+            args.sim_rate,
+            args.fps,
+            args.record,
+            args.asset_budget,
+            startup_report,
+        )
+    )
 
 
 if __name__ == "__main__":
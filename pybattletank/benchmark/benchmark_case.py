@@ -0,0 +1,48 @@
+from typing import Any, NamedTuple
+
+
+class BenchmarkCaseError(ValueError):
+    def __init__(self, message: str, *args: Any) -> None:
+        self.message = message.format(*args)
+        super().__init__(self.message)
+
+
+class BenchmarkCase(NamedTuple):
+    width: int
+    height: int
+    units: int
+    tanks: int = 0
+    maze: bool = False
+
+    @property
+    def name(self) -> str:
+        name = f"{self.width}x{self.height}:{self.units}"
+        if self.tanks > 0:
+            name += f":{self.tanks}"
+        if self.maze:
+            name += ":maze"
+        return name
+
+    @classmethod
+    def parse(cls, text: str) -> "BenchmarkCase":
+        try:
+            size, units, *options = text.split(":")
+            width, height = size.lower().split("x")
+            maze = len(options) > 0 and options[-1].lower() == "maze"
+            if maze:
+                options.pop()
+            (tanks,) = options or ["0"]
+            return cls(int(width), int(height), int(units), int(tanks), maze)
+        except ValueError:
+            msg = "Invalid benchmark case {}, expected WIDTHxHEIGHT:UNITS[:TANKS][:maze]"
+            raise BenchmarkCaseError(msg, text) from None
+
+
+DEFAULT_CASES = (
+    BenchmarkCase(16, 10, 10),
+    BenchmarkCase(64, 64, 100),
+    BenchmarkCase(256, 256, 1000),
+    BenchmarkCase(1000, 1000, 10000),
+    BenchmarkCase(127, 127, 50, 200, True),
+    BenchmarkCase(511, 511, 200, 1000, True),
+)
@@ -0,0 +1,58 @@
+from typing import Any, NamedTuple
+
+from .benchmark_case import BenchmarkCase
+
+
+class LayerTiming(NamedTuple):
+    layer: str
+    first_frame: float
+    mean_frame: float
+
+
+class TickStats(NamedTuple):
+    ticks: int
+    seconds: float
+    bullets: int
+    collision_candidates: int
+    flow_field_computations: int
+
+
+class BenchmarkResult(NamedTuple):
+    case: BenchmarkCase
+    load_seconds: float
+    cached_load_seconds: float
+    outcome: str
+    ticks: int
+    tick_seconds: float
+    bullets_per_tick: float
+    collision_candidates_per_tick: float
+    flow_field_computations: int
+    layers: list[LayerTiming]
+    peak_memory: int
+
+    @property
+    def ticks_per_second(self) -> float:
+        if self.tick_seconds <= 0:
+            return 0.0
+        return self.ticks / self.tick_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "case": self.case.name,
+            "width": self.case.width,
+            "height": self.case.height,
+            "units": self.case.units,
+            "tanks": self.case.tanks,
+            "maze": self.case.maze,
+            "load_seconds": self.load_seconds,
+            "cached_load_seconds": self.cached_load_seconds,
+            "outcome": self.outcome,
+            "ticks": self.ticks,
+            "tick_seconds": self.tick_seconds,
+            "ticks_per_second": self.ticks_per_second,
+            "bullets_per_tick": self.bullets_per_tick,
+            "collision_candidates_per_tick": self.collision_candidates_per_tick,
+            "flow_field_computations": self.flow_field_computations,
+            "layers": [layer._asdict() for layer in self.layers],
+            "peak_memory": self.peak_memory,
+        }
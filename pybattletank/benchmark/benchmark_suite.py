@@ -0,0 +1,149 @@
+import datetime
+import json
+import os
+import platform
+import time
+import tracemalloc
+from collections.abc import Iterable
+from typing import Any, Optional
+
+import pygame
+
+from pybattletank.layers.theme import Theme
+from pybattletank.modes.play_game_mode import PlayGameMode
+from pybattletank.simulation.random_policy import RandomPolicy
+from pybattletank.state.level_cache import LevelCache
+from pybattletank.state.level_loader import LevelLoader
+
+from .benchmark_case import BenchmarkCase
+from .benchmark_result import BenchmarkResult, LayerTiming, TickStats
+from .level_generator import LevelGenerator
+
+
+class BenchmarkSuite:
+    def __init__(
+        self,
+        theme: Theme,
+        directory: str,
+        ticks: int = 1000,
+        frames: int = 10,
+        bullet_engine: str = "python",
+        seed: int = 0,
+        memory_ticks: int = 100,
+    ) -> None:
+        self.theme = theme
+        self.directory = directory
+        self.ticks = ticks
+        self.frames = max(frames, 1)
+        self.bullet_engine = bullet_engine
+        self.seed = seed
+        self.memory_ticks = memory_ticks
+        self.level_cache = LevelCache(os.path.join(directory, "cache"))
+
+    def run(self, cases: Iterable[BenchmarkCase]) -> list[BenchmarkResult]:
+        return [self.run_case(case) for case in cases]
+
+    def run_case(self, case: BenchmarkCase) -> BenchmarkResult:
+        filename = os.path.join(self.directory, f"benchmark_{case.name.replace(':', '_')}.tmx")
+        LevelGenerator(case.width, case.height, case.units, self.seed, tanks=case.tanks, maze=case.maze).write(filename)
+
+        start = time.perf_counter()
+        LevelLoader(filename).run()
+        load_seconds = time.perf_counter() - start
+
+        LevelLoader(filename, self.level_cache).run()
+        start = time.perf_counter()
+        LevelLoader(filename, self.level_cache).run()
+        cached_load_seconds = time.perf_counter() - start
+
+        mode = self.create_mode(filename)
+        stats = self.run_ticks(mode, self.ticks)
+        outcome = "lost" if not mode.player_unit.alive else "won" if mode.game_over else "timeout"
+        layers = self.render_layers(mode)
+
+        tracemalloc.start()
+        try:
+            mode = self.create_mode(filename)
+            self.run_ticks(mode, self.memory_ticks)
+            self.render_frame(mode, self.create_surface())
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        return BenchmarkResult(
+            case,
+            load_seconds,
+            cached_load_seconds,
+            outcome,
+            stats.ticks,
+            stats.seconds,
+            stats.bullets / stats.ticks if stats.ticks > 0 else 0.0,
+            stats.collision_candidates / stats.ticks if stats.ticks > 0 else 0.0,
+            stats.flow_field_computations,
+            layers,
+            peak_memory,
+        )
+
+    def create_mode(self, filename: str) -> PlayGameMode:
+        mode = PlayGameMode(self.bullet_engine, level_cache=self.level_cache)
+        mode.load_level(self.theme, filename)
+        return mode
+
+    def create_surface(self) -> pygame.Surface:
+        return pygame.Surface((self.theme.default_window_width, self.theme.default_window_height))
+
+    def run_ticks(self, mode: PlayGameMode, ticks: int) -> TickStats:
+        policy = RandomPolicy(self.seed)
+        state = mode.game_state
+        player_unit = mode.player_unit
+        count = 0
+        bullets = 0
+        collision_candidates = 0
+        computations = mode.flow_field.computations
+        start = time.perf_counter()
+        while count < ticks and not mode.game_over:
+            bullets += len(state.bullets)
+            mode.apply_input(policy.next_input(state, player_unit))
+            mode.update()
+            collision_candidates += state.collision_candidates
+            count += 1
+        seconds = time.perf_counter() - start
+        return TickStats(count, seconds, bullets, collision_candidates, mode.flow_field.computations - computations)
+
+    def render_frame(self, mode: PlayGameMode, surface: pygame.Surface) -> list[float]:
+        timings = []
+        for layer in mode.layers:
+            start = time.perf_counter()
+            layer.render(surface)
+            timings.append(time.perf_counter() - start)
+        return timings
+
+    def render_layers(self, mode: PlayGameMode) -> list[LayerTiming]:
+        surface = self.create_surface()
+        frames = [self.render_frame(mode, surface) for _ in range(self.frames)]
+        layers = []
+        for index, layer in enumerate(mode.layers):
+            timings = [frame[index] for frame in frames]
+            steady = timings[1:] or timings
+            layers.append(LayerTiming(type(layer).__name__, timings[0], sum(steady) / len(steady)))
+        return layers
+
+    def metadata(self, label: Optional[str] = None) -> dict[str, Any]:
+        return {
+            "label": label,
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pygame": pygame.version.ver,
+            "bullet_engine": self.bullet_engine,
+            "ticks": self.ticks,
+            "frames": self.frames,
+            "memory_ticks": self.memory_ticks,
+            "seed": self.seed,
+        }
+
+    def write_json(self, filename: str, results: list[BenchmarkResult], label: Optional[str] = None) -> None:
+        report = {**self.metadata(label), "results": [result.to_dict() for result in results]}
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
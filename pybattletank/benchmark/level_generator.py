@@ -0,0 +1,167 @@
+import random
+from typing import Any, Optional
+
+TILESETS = (
+    ("units", 1, 60, 12, 768, 320),
+    ("ground", 61, 256, 16, 1024, 1024),
+    ("walls", 317, 256, 4, 256, 320),
+    ("explosions", 573, 1024, 32, 2048, 2048),
+)
+GROUND_TILES = (82, 82, 82, 82, 82, 82, 83, 84)
+WALL_TILES = (322, 323)
+PLAYER_TILE = 2
+ENEMY_TANK_TILES = (3, 4)
+TOWER_TILES = (13, 25)
+EXPLOSION_TILE = 608
+
+
+class LevelGeneratorError(ValueError):
+    def __init__(self, message: str, *args: Any) -> None:
+        self.message = message.format(*args)
+        super().__init__(self.message)
+
+
+class LevelGenerator:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        units: int,
+        seed: int = 0,
+        wall_density: float = 0.05,
+        safe_radius: int = 6,
+        tanks: int = 0,
+        maze: bool = False,
+    ) -> None:
+        if width <= 0 or height <= 0:
+            msg = "Invalid level size {}x{}"
+            raise LevelGeneratorError(msg, width, height)
+        if units < 1 or tanks < 0 or units + tanks > width * height:
+            msg = "Cannot place {} units in a {}x{} level"
+            raise LevelGeneratorError(msg, units + tanks, width, height)
+        self.width = width
+        self.height = height
+        self.units = units
+        self.seed = seed
+        self.wall_density = wall_density
+        self.safe_radius = safe_radius
+        self.tanks = tanks
+        self.maze = maze
+
+    def generate(self) -> dict[str, list[int]]:
+        rng = random.Random(self.seed)
+        width, height = self.width, self.height
+        cells = width * height
+        player = (height // 2) * width + width // 2
+
+        open_cells = self.carve_maze(rng, player) if self.maze else list(range(cells))
+        towers = self.place_units(rng, player, open_cells, self.units - 1, {player})
+        enemy_tanks = self.place_units(rng, player, open_cells, self.tanks, {player, *towers}) if self.tanks else []
+
+        ground = [rng.choice(GROUND_TILES) for _ in range(cells)]
+        tanks = [0] * cells
+        tanks[player] = PLAYER_TILE
+        tower_layer = [0] * cells
+        for cell in towers:
+            tower_layer[cell] = rng.choice(TOWER_TILES)
+        for cell in enemy_tanks:
+            tanks[cell] = rng.choice(ENEMY_TANK_TILES)
+        walls = [0] * cells
+        if self.maze:
+            passages = set(open_cells)
+            for cell in range(cells):
+                if cell not in passages:
+                    walls[cell] = rng.choice(WALL_TILES)
+        else:
+            for cell in range(cells):
+                if tanks[cell] == 0 and tower_layer[cell] == 0 and rng.random() < self.wall_density:
+                    walls[cell] = rng.choice(WALL_TILES)
+        explosions = [0] * cells
+        explosions[0] = EXPLOSION_TILE
+
+        return {
+            "Ground": ground,
+            "Walls": walls,
+            "Tanks": tanks,
+            "Towers": tower_layer,
+            "Explosions": explosions,
+        }
+
+    def carve_maze(self, rng: random.Random, player: int) -> list[int]:
+        width, height = self.width, self.height
+        is_open = [False] * (width * height)
+        is_open[player] = True
+        stack = [player]
+        while stack:
+            cell = stack[-1]
+            x, y = cell % width, cell // width
+            rooms = [
+                (x + dx, y + dy)
+                for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                if 0 <= x + dx < width and 0 <= y + dy < height and not is_open[(y + dy) * width + x + dx]
+            ]
+            if len(rooms) == 0:
+                stack.pop()
+                continue
+            room_x, room_y = rng.choice(rooms)
+            is_open[((y + room_y) // 2) * width + (x + room_x) // 2] = True
+            is_open[room_y * width + room_x] = True
+            stack.append(room_y * width + room_x)
+        return [cell for cell in range(width * height) if is_open[cell]]
+
+    def place_units(
+        self,
+        rng: random.Random,
+        player: int,
+        cells: list[int],
+        count: int,
+        taken: set[int],
+    ) -> list[int]:
+        width = self.width
+        player_x, player_y = player % width, player // width
+
+        def is_safe(cell: int) -> bool:
+            dx = cell % width - player_x
+            dy = cell // width - player_y
+            return dx * dx + dy * dy > self.safe_radius * self.safe_radius
+
+        candidates = [cell for cell in cells if cell not in taken and is_safe(cell)]
+        if count > len(candidates):
+            candidates = [cell for cell in cells if cell not in taken]
+        if count > len(candidates):
+            msg = "Cannot place {} units in a {}x{} level"
+            raise LevelGeneratorError(msg, count, self.width, self.height)
+        return rng.sample(candidates, count)
+
+    def to_tmx(self, layers: Optional[dict[str, list[int]]] = None) -> str:
+        if layers is None:
+            layers = self.generate()
+        width, height = self.width, self.height
+        lines = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            f'<map version="1.2" tiledversion="1.3.1" orientation="orthogonal" renderorder="left-up" '
+            f'width="{width}" height="{height}" tilewidth="64" tileheight="64" infinite="0" '
+            f'nextlayerid="{len(layers) + 1}" nextobjectid="1">',
+        ]
+        for name, firstgid, tilecount, columns, image_width, image_height in TILESETS:
+            lines.extend([
+                f' <tileset firstgid="{firstgid}" name="{name}" tilewidth="64" tileheight="64" '
+                f'tilecount="{tilecount}" columns="{columns}">',
+                f'  <image source="{name}.png" width="{image_width}" height="{image_height}"/>',
+                " </tileset>",
+            ])
+        for layer_id, (name, tiles) in enumerate(layers.items(), start=1):
+            rows = (",".join(map(str, tiles[y * width : (y + 1) * width])) for y in range(height))
+            lines.extend([
+                f' <layer id="{layer_id}" name="{name}" width="{width}" height="{height}">',
+                '  <data encoding="csv">',
+                ",\n".join(rows),
+                "</data>",
+                " </layer>",
+            ])
+        lines.append("</map>")
+        return "\n".join(lines) + "\n"
+
+    def write(self, filename: str) -> None:
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(self.to_tmx())
@@ -0,0 +1,271 @@
+import argparse
+import contextlib
+import math
+import os
+from typing import TYPE_CHECKING, Optional
+
+from pybattletank.engines.bullet_engines import BULLET_ENGINE_NAMES
+from pybattletank.simulation.policies import POLICY_NAMES
+
+if TYPE_CHECKING:
+    from pybattletank.benchmark.benchmark_case import BenchmarkCase
+
+
+def positive_float(value: str) -> float:
+    number = float(value)
+    if not 0 < number < math.inf:
+        msg = f"must be a positive number: {value}"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        msg = f"must be a positive number: {value}"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        msg = f"must not be negative: {value}"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def benchmark_case(value: str) -> "BenchmarkCase":
+    from pybattletank.benchmark.benchmark_case import BenchmarkCase, BenchmarkCaseError
+
+    try:
+        return BenchmarkCase.parse(value)
+    except BenchmarkCaseError as error:
+        raise argparse.ArgumentTypeError(error.message) from None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="pybattletank")
+    parser.add_argument(
+        "--dirty-rects", action="store_true", help="only redraw and update the screen regions that changed"
+    )
+    parser.add_argument("--level-cache", metavar="DIR", help="directory of compiled levels (default: user cache)")
+    parser.add_argument("--sim-rate", type=positive_float, default=60.0, help="game simulation ticks per second")
+    parser.add_argument(
+        "--fps", type=non_negative_int, default=60, help="maximum frames rendered per second, 0 for no limit"
+    )
+    parser.add_argument("--record", metavar="DIR", help="record a replay of every level played into a directory")
+    parser.add_argument(
+        "--asset-budget",
+        type=positive_int,
+        default=64,
+        metavar="MIB",
+        help="memory budget of the fonts, images and sounds cache",
+    )
+    parser.add_argument(
+        "--startup-report", action="store_true", help="print the time spent in each startup phase to the first frame"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    simulate_parser = subparsers.add_parser("simulate", help="run a level headlessly as fast as possible")
+    simulate_parser.add_argument("level", help="path to a .tmx level")
+    simulate_parser.add_argument("--ticks", type=int, default=10000, help="maximum number of ticks to run")
+    simulate_parser.add_argument("--policy", choices=POLICY_NAMES, default="hunter", help="player input policy")
+    simulate_parser.add_argument("--seed", type=int, default=0, help="seed for the player input policy")
+    simulate_parser.add_argument(
+        "--bullet-engine", choices=BULLET_ENGINE_NAMES, default="python", help="implementation used to move bullets"
+    )
+    simulate_parser.add_argument("--level-cache", metavar="DIR", help="directory of compiled levels to reuse")
+    simulate_parser.add_argument("--record", metavar="FILE", help="record the player inputs to a replay file")
+
+    replay_parser = subparsers.add_parser("replay", help="play a recorded replay headlessly as fast as possible")
+    replay_parser.add_argument("replay", help="path to a replay file")
+    replay_parser.add_argument("--level", help="path to the .tmx level (default: find it by name)")
+    replay_parser.add_argument(
+        "--bullet-engine", choices=BULLET_ENGINE_NAMES, default="python", help="implementation used to move bullets"
+    )
+    replay_parser.add_argument("--level-cache", metavar="DIR", help="directory of compiled levels to reuse")
+
+    batch_parser = subparsers.add_parser("batch", help="play many headless matches in parallel for level balancing")
+    batch_parser.add_argument(
+        "--levels",
+        dest="level_dirs",
+        action="append",
+        metavar="DIR",
+        help="directory of .tmx levels, can be repeated (default: bundled levels)",
+    )
+    batch_parser.add_argument("--seeds", type=int, default=10, help="number of matches per level")
+    batch_parser.add_argument("--first-seed", type=int, default=0, help="seed of the first match of each level")
+    batch_parser.add_argument("--policy", choices=POLICY_NAMES, default="hunter", help="player input policy")
+    batch_parser.add_argument("--ticks", type=int, default=10000, help="maximum number of ticks per match")
+    batch_parser.add_argument("--workers", type=int, help="number of worker processes (default: one per core)")
+    batch_parser.add_argument(
+        "--bullet-engine", choices=BULLET_ENGINE_NAMES, default="python", help="implementation used to move bullets"
+    )
+    batch_parser.add_argument("--level-cache", metavar="DIR", help="directory of compiled levels to reuse")
+    batch_parser.add_argument("--csv", metavar="FILE", help="write one row per match to a CSV file")
+    batch_parser.add_argument("--json", metavar="FILE", help="write per-level summaries and matches to a JSON file")
+
+    benchmark_parser = subparsers.add_parser("benchmark", help="measure performance on generated levels")
+    benchmark_parser.add_argument(
+        "--case",
+        dest="cases",
+        type=benchmark_case,
+        action="append",
+        metavar="WxH:UNITS[:TANKS][:maze]",
+        help="level size, tower and enemy tank counts to generate, can be repeated "
+        "(default: 16x10:10 up to 1000x1000:10000, plus two maze levels)",
+    )
+    benchmark_parser.add_argument("--ticks", type=int, default=1000, help="maximum number of ticks per case")
+    benchmark_parser.add_argument("--frames", type=int, default=10, help="number of frames rendered per case")
+    benchmark_parser.add_argument("--seed", type=int, default=0, help="seed for level generation and input")
+    benchmark_parser.add_argument(
+        "--bullet-engine", choices=BULLET_ENGINE_NAMES, default="python", help="implementation used to move bullets"
+    )
+    benchmark_parser.add_argument("--output", default="benchmark.json", help="JSON file to write results to")
+    benchmark_parser.add_argument("--label", help="name stored with the results, e.g. a commit id")
+
+    return parser
+
+
+def simulate(args: argparse.Namespace) -> int:
+    from pybattletank.replay.replay_header import ReplayHeader
+    from pybattletank.replay.replay_recorder import ReplayRecorder
+    from pybattletank.simulation.policies import create_policy
+    from pybattletank.simulation.simulator import Simulator
+    from pybattletank.state.level_cache import LevelCache
+    from pybattletank.state.level_loader import LoadLevelError
+
+    policy = create_policy(args.policy, args.seed)
+    level_cache = LevelCache(args.level_cache) if args.level_cache else None
+    try:
+        with contextlib.ExitStack() as stack:
+            recorder = None
+            if args.record:
+                file = stack.enter_context(open(args.record, "wb"))
+                recorder = ReplayRecorder(file, ReplayHeader.for_level(args.level))
+            result = Simulator(args.level, policy, args.ticks, args.bullet_engine, level_cache, recorder).run()
+    except (LoadLevelError, OSError) as error:
+        print(error)
+        return 1
+    print(
+        f"{result.level}: {result.outcome} after {result.ticks} ticks "
+        f"in {result.elapsed:.3f}s ({result.ticks_per_second:.1f} ticks/s)"
+    )
+    return 0
+
+
+def find_level(name: str) -> Optional[str]:
+    from pybattletank.finders.directory_level_finder import DirectoryLevelFinder
+    from pybattletank.finders.multisource_level_finder import MultiSourceLevelFinder
+    from pybattletank.finders.packaged_level_finder import PackagedLevelFinder
+
+    level_finder = MultiSourceLevelFinder(PackagedLevelFinder("pybattletank.assets"), DirectoryLevelFinder("./levels"))
+    for level in level_finder.all():
+        if level["name"] == name:
+            return str(level["path"])
+    return None
+
+
+def replay(args: argparse.Namespace) -> int:
+    from pybattletank.replay.replay_error import ReplayError
+    from pybattletank.replay.replay_header import ReplayHeader
+    from pybattletank.replay.replay_player import ReplayPlayer
+    from pybattletank.state.level_cache import LevelCache
+    from pybattletank.state.level_loader import LoadLevelError
+
+    try:
+        with open(args.replay, "rb") as file:
+            header = ReplayHeader.read(file)
+    except (ReplayError, OSError) as error:
+        print(error)
+        return 1
+    level = args.level or find_level(header.level)
+    if level is None:
+        print(f"Level {header.level} not found, use --level")
+        return 1
+
+    level_cache = LevelCache(args.level_cache) if args.level_cache else None
+    try:
+        result = ReplayPlayer(args.replay, level, args.bullet_engine, level_cache).run()
+    except (ReplayError, LoadLevelError, OSError) as error:
+        print(error)
+        return 1
+    print(
+        f"{result.level}: {result.outcome} after {result.ticks} ticks "
+        f"in {result.elapsed:.3f}s ({result.ticks_per_second:.1f} ticks/s), {result.hashes_checked} hashes checked"
+    )
+    if result.divergence_epoch is not None:
+        print(f"Diverged from the recording at tick {result.divergence_epoch}")
+        return 1
+    return 0
+
+
+def batch(args: argparse.Namespace) -> int:
+    from pybattletank.finders.directory_level_finder import DirectoryLevelFinder
+    from pybattletank.finders.level_finder import LevelFinder
+    from pybattletank.finders.multisource_level_finder import MultiSourceLevelFinder
+    from pybattletank.finders.packaged_level_finder import PackagedLevelFinder
+    from pybattletank.simulation.batch_runner import BatchRunner
+
+    level_finder: LevelFinder
+    if args.level_dirs:
+        level_finder = MultiSourceLevelFinder(*(DirectoryLevelFinder(directory) for directory in args.level_dirs))
+    else:
+        level_finder = PackagedLevelFinder("pybattletank.assets")
+    levels = sorted(level_finder.all(), key=lambda level: level["name"])
+    if len(levels) == 0:
+        print("No levels found")
+        return 1
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    runner = BatchRunner(args.policy, seeds, args.ticks, args.bullet_engine, args.workers, args.level_cache)
+    matches = runner.run(levels)
+    errors = {match.level: match.error for match in matches if match.outcome == "error"}
+    for level, error in errors.items():
+        print(f"{level}: {error}")
+    for summary in runner.summarize(matches):
+        print(
+            f"{summary.level}: {summary.matches} matches, won {summary.win_rate:.1%}, lost {summary.loss_rate:.1%}, "
+            f"{summary.timeouts} timeouts, {summary.errors} errors, {summary.mean_ticks:.1f} ticks and {summary.mean_elapsed:.3f}s on average"
+        )
+    if args.csv:
+        runner.write_csv(args.csv, matches)
+    if args.json:
+        runner.write_json(args.json, matches)
+    return 0
+
+
+def benchmark(args: argparse.Namespace) -> int:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    import tempfile
+
+    import pygame
+
+    from pybattletank.benchmark.benchmark_case import DEFAULT_CASES
+    from pybattletank.benchmark.benchmark_suite import BenchmarkSuite
+    from pybattletank.layers.theme import Theme
+    from pybattletank.locators.packaged_asset_locator import PackagedAssetLocator
+
+    cases = args.cases or list(DEFAULT_CASES)
+    pygame.init()
+    theme = Theme(PackagedAssetLocator("pybattletank.assets"), "theme.json")
+    with tempfile.TemporaryDirectory() as directory:
+        suite = BenchmarkSuite(theme, directory, args.ticks, args.frames, args.bullet_engine, args.seed)
+        results = []
+        for case in cases:
+            result = suite.run_case(case)
+            results.append(result)
+            render_seconds = sum(layer.mean_frame for layer in result.layers)
+            print(
+                f"{case.name}: load {result.load_seconds:.3f}s (cached {result.cached_load_seconds:.3f}s), "
+                f"{result.ticks_per_second:.1f} ticks/s, {result.bullets_per_tick:.1f} bullets and "
+                f"{result.collision_candidates_per_tick:.1f} collision candidates per tick, "
+                f"{result.flow_field_computations} flow fields, render {render_seconds * 1000:.2f}ms/frame, "
+                f"peak {result.peak_memory / 1024 / 1024:.1f}MiB"
+            )
+        suite.write_json(args.output, results, args.label)
+    pygame.quit()
+    return 0
@@ -28,9 +28,8 @@ class MoveCommand(Command):
         nx, ny = x + dx, y + dy
         if nx < 0 or nx >= self.state.world_size[0] or ny < 0 or ny >= self.state.world_size[1]:
             return
-        if self.state.walls[ny][nx] is not None:
+        if self.state.is_wall((nx, ny)):
             return
-        for unit in self.state.units:
-            if (nx, ny) == unit.position:
-                return
-        self.unit.position = (nx, ny)
+        if self.state.find_unit((nx, ny)) is not None:
+            return
+        self.state.move_unit(self.unit, (nx, ny))
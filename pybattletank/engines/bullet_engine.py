@@ -0,0 +1,15 @@
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pybattletank.state.game_state import GameState
+
+
+class BulletEngineError(ValueError):
+    def __init__(self, message: str, *args: Any) -> None:
+        self.message = message.format(*args)
+        super().__init__(self.message)
+
+
+class BulletEngine:
+    def move(self, state: "GameState", count: int) -> None:
+        raise NotImplementedError()
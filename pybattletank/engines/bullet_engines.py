@@ -0,0 +1,19 @@
+from .bullet_engine import BulletEngine, BulletEngineError
+
+BULLET_ENGINE_NAMES = ("python", "numpy")
+
+
+def create_bullet_engine(name: str) -> BulletEngine:
+    if name == "python":
+        from .python_bullet_engine import PythonBulletEngine
+
+        return PythonBulletEngine()
+    if name == "numpy":
+        try:
+            from .numpy_bullet_engine import NumpyBulletEngine
+        except ImportError as ex:
+            msg = "The numpy bullet engine requires numpy: {}"
+            raise BulletEngineError(msg, ex) from ex
+        return NumpyBulletEngine()
+    msg = "Unknown bullet engine {}"
+    raise BulletEngineError(msg, name)
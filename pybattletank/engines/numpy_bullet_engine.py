@@ -0,0 +1,103 @@
+from itertools import compress
+
+import numpy as np
+import numpy.typing as npt
+
+from pybattletank.state.bullet import Bullet
+from pybattletank.state.game_state import GameState
+from pybattletank.state.unit import Unit
+
+from .bullet_engine import BulletEngine
+
+
+class NumpyBulletEngine(BulletEngine):
+    def __init__(self) -> None:
+        self.items: list[Bullet] = []
+        self.owners: list[Unit] = []
+        self.positions: npt.NDArray[np.float64] = np.empty((0, 2))
+        self.origins: npt.NDArray[np.float64] = np.empty((0, 2))
+        self.targets: npt.NDArray[np.float64] = np.empty((0, 2))
+        self.directions: npt.NDArray[np.float64] = np.empty((0, 2))
+
+    def clear(self) -> None:
+        self.items = []
+        self.owners = []
+        self.positions = self.origins = self.targets = self.directions = np.empty((0, 2))
+
+    def adopt(self, bullets: list[Bullet]) -> None:
+        positions = np.array([bullet.position for bullet in bullets], dtype=np.float64)
+        origins = np.array([bullet.start_position for bullet in bullets], dtype=np.float64)
+        targets = np.array([bullet.end_position for bullet in bullets], dtype=np.float64)
+
+        directions = targets - origins
+        norms = np.sqrt(directions[:, 0] ** 2 + directions[:, 1] ** 2)
+        short = norms < 1e-4
+        directions[short] = 0.0
+        directions[~short] /= norms[~short, None]
+
+        self.items.extend(bullets)
+        self.owners.extend(bullet.unit for bullet in bullets)
+        self.positions = np.concatenate((self.positions, positions))
+        self.origins = np.concatenate((self.origins, origins))
+        self.targets = np.concatenate((self.targets, targets))
+        self.directions = np.concatenate((self.directions, directions))
+
+    def sync(self, state: GameState, count: int) -> None:
+        adopted = len(self.items)
+        if adopted > count or state.bullets[:adopted] != self.items:
+            self.clear()
+            adopted = 0
+        if adopted < count:
+            self.adopt(state.bullets[adopted:count])
+
+    def move(self, state: GameState, count: int) -> None:
+        self.sync(state, count)
+        if count == 0:
+            return
+
+        directions = self.directions
+        targets = self.targets
+        new_positions = self.positions + directions * state.bullet_speed
+        new_x = new_positions[:, 0]
+        new_y = new_positions[:, 1]
+
+        inside = (new_x >= 0) & (new_x < state.world_size[0]) & (new_y >= 0) & (new_y < state.world_size[1])
+        reached_x = np.where(directions[:, 0] >= 0, new_x >= targets[:, 0], new_x <= targets[:, 0])
+        reached_y = np.where(directions[:, 1] >= 0, new_y >= targets[:, 1], new_y <= targets[:, 1])
+        offsets = new_positions - self.origins
+        out_of_range = np.sqrt(offsets[:, 0] ** 2 + offsets[:, 1] ** 2) > state.bullet_range
+        dead = ~inside | (reached_x & reached_y) | out_of_range
+
+        flying = np.flatnonzero(~dead)
+        cells = (new_positions[flying] + 0.5).astype(np.int64)
+        occupancy = state.occupancy
+        owners = self.owners
+        for index, x, y in zip(flying.tolist(), cells[:, 0].tolist(), cells[:, 1].tolist()):
+            if x >= state.world_size[0] or y >= state.world_size[1]:
+                continue
+            unit = occupancy[y][x]
+            if unit is None:
+                continue
+            state.collision_candidates += 1
+            if unit.alive and unit is not owners[index]:
+                dead[index] = True
+                unit.alive = False
+                state.notify_unit_destroyed(unit)
+
+        alive = ~dead
+        self.positions = new_positions
+        for bullet, position in zip(compress(self.items, alive.tolist()), new_positions[alive].tolist()):
+            bullet.previous_position = bullet.position
+            bullet.position = (position[0], position[1])
+
+        if not dead.any():
+            return
+        for bullet in compress(self.items, dead.tolist()):
+            bullet.alive = False
+        keep = alive.tolist()
+        self.items = list(compress(self.items, keep))
+        self.owners = list(compress(self.owners, keep))
+        self.positions = self.positions[alive]
+        self.origins = self.origins[alive]
+        self.targets = self.targets[alive]
+        self.directions = self.directions[alive]
@@ -2,17 +2,15 @@ from pybattletank.linalg.vector import vector_add, vector_dist, vector_normalize
 from pybattletank.state.bullet import Bullet
 from pybattletank.state.game_state import GameState
 
-from .command import Command
+from .bullet_engine import BulletEngine
 
 
-class MoveBulletCommand(Command):
-    def __init__(self, state: GameState, bullet: Bullet) -> None:
-        self.state = state
-        self.bullet = bullet
+class PythonBulletEngine(BulletEngine):
+    def move(self, state: GameState, count: int) -> None:
+        for bullet in state.bullets[:count]:
+            self.move_bullet(state, bullet)
 
-    def run(self) -> None:
-        bullet = self.bullet
-        state = self.state
+    def move_bullet(self, state: GameState, bullet: Bullet) -> None:
         direction = vector_sub(bullet.end_position, bullet.start_position)
         direction = vector_normalize(direction)
         new_pos = vector_add(bullet.position, direction, state.bullet_speed)
@@ -37,11 +35,14 @@ class MoveBulletCommand(Command):
             return
 
         new_center_pos = vector_add(new_pos, (0.5, 0.5))
-        unit = state.find_live_unit(new_center_pos)
-        if unit is not None and unit != bullet.unit:
+        unit = state.find_unit(new_center_pos)
+        if unit is not None:
+            state.collision_candidates += 1
+        if unit is not None and unit.alive and unit != bullet.unit:
             bullet.alive = False
             unit.alive = False
             state.notify_unit_destroyed(unit)
             return
 
+        bullet.previous_position = bullet.position
         bullet.position = new_pos  # type: ignore[assignment]
@@ -1,16 +1,20 @@
 import pathlib
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 from .level_finder import LevelFinder
+from .level_index import LevelIndex
 
 
 class DirectoryLevelFinder(LevelFinder):
-    def __init__(self, root_dir: Union[str, pathlib.Path]) -> None:
+    def __init__(self, root_dir: Union[str, pathlib.Path], index: Optional[LevelIndex] = None) -> None:
         self.root_dir = pathlib.Path(root_dir)
+        self.index = index
 
     def all(self) -> list[dict[str, Any]]:
         if not self.root_dir.is_dir():
             return []
+        if self.index is not None:
+            return self.index.levels(self.root_dir)
         levels = []
         for file in self.root_dir.glob("*.tmx"):
             levels.append({"name": file.stem, "path": file.resolve()})
@@ -0,0 +1,100 @@
+import json
+import os
+import pathlib
+from typing import Any, Optional, Union
+
+from pybattletank.state.level_cache import LevelCache
+
+
+class LevelIndex:
+    version = 1
+
+    def __init__(self, filename: Union[str, os.PathLike], level_cache: Optional[LevelCache] = None) -> None:
+        self.filename = pathlib.Path(filename)
+        self.level_cache = level_cache
+        self.directories: Optional[dict[str, dict[str, Any]]] = None
+        self.extractions = 0
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        if self.directories is not None:
+            return self.directories
+        self.directories = {}
+        try:
+            with open(self.filename, encoding="utf-8") as file:
+                data = json.load(file)
+            if isinstance(data, dict) and data.get("version") == self.version:
+                self.directories = data["directories"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return self.directories
+
+    def save(self) -> None:
+        data = {"version": self.version, "directories": self.load()}
+        try:
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+            LevelCache.write_file(self.filename, json.dumps(data).encode("utf-8"))
+        except OSError:
+            return
+
+    def extract(self, path: pathlib.Path) -> Optional[dict[str, Any]]:
+        from pybattletank.state.level_loader import LevelLoader
+
+        self.extractions += 1
+        loader = LevelLoader(str(path), self.level_cache)
+        try:
+            loader.run()
+        except Exception as ex:
+            print(ex)
+            return None
+        state = loader.state
+        return {
+            "world_size": list(state.world_size),
+            "tanks": loader.tanks_count,
+            "towers": len(state.units) - loader.tanks_count,
+            "tilesets": {
+                "ground": loader.ground_tileset,
+                "walls": loader.walls_tileset,
+                "units": loader.units_tileset,
+                "explosions": loader.explosions_tileset,
+            },
+        }
+
+    def levels(self, directory: Union[str, os.PathLike], pattern: str = "*.tmx") -> list[dict[str, Any]]:
+        directory = pathlib.Path(directory).resolve()
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        directories = self.load()
+        entry = directories.get(str(directory))
+        changed = entry is None or entry.get("mtime_ns") != mtime_ns
+        cached_files: dict[str, Any] = {} if entry is None else entry.get("files", {})
+        names = sorted(file.name for file in directory.glob(pattern)) if changed else sorted(cached_files)
+
+        files = {}
+        levels = []
+        for name in names:
+            path = directory / name
+            try:
+                stat = path.stat()
+            except OSError:
+                changed = True
+                continue
+            cached = cached_files.get(name)
+            if cached is None or cached.get("mtime_ns") != stat.st_mtime_ns or cached.get("size") != stat.st_size:
+                cached = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "metadata": self.extract(path)}
+                changed = True
+            files[name] = cached
+
+            level = {"name": path.stem, "path": path}
+            metadata = cached.get("metadata")
+            if metadata is not None:
+                level.update(metadata)
+                level["world_size"] = tuple(metadata["world_size"])
+            levels.append(level)
+
+        if changed:
+            directories[str(directory)] = {"mtime_ns": mtime_ns, "files": files}
+            self.save()
+        return levels
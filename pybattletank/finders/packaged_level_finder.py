@@ -1,16 +1,24 @@
 import importlib
 import os
+import pathlib
 from importlib.resources import Package
-from typing import Any
+from typing import Any, Optional
 
 from .level_finder import LevelFinder
+from .level_index import LevelIndex
 
 
 class PackagedLevelFinder(LevelFinder):
-    def __init__(self, anchor: Package) -> None:
+    def __init__(self, anchor: Package, index: Optional[LevelIndex] = None) -> None:
         self.traversable = importlib.resources.files(anchor)
+        self.index = index
 
     def all(self) -> list[dict[str, Any]]:
+        if self.index is not None:
+            items = [item for item in self.traversable.iterdir() if item.name.endswith(".tmx")]
+            if all(isinstance(item, pathlib.Path) for item in items):
+                directories = sorted({pathlib.Path(str(item)).parent for item in items})
+                return [level for directory in directories for level in self.index.levels(directory)]
         levels = []
         for item in self.traversable.iterdir():
             if not item.is_file():
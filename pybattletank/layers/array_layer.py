@@ -1,9 +1,12 @@
+import math
 from typing import Optional
 
 import pygame
 
 from pybattletank.state.game_state import GameState
 
+from .asset_manager import AssetManager
+from .lru_cache import LruCache
 from .theme import Theme
 from .tiled_layer import TiledLayer
 
@@ -16,19 +19,62 @@ class ArrayLayer(TiledLayer):
         state: GameState,
         array: list[list[Optional[tuple[int, int]]]],
         surface_flags: int = pygame.SRCALPHA,
+        chunk_tiles: int = 8,
+        assets: Optional[AssetManager] = None,
     ) -> None:
-        super().__init__(theme, image_filename)
+        super().__init__(theme, image_filename, assets=assets)
         self.state = state
         self.array = array
-        self.surface: Optional[pygame.Surface] = None
         self.surface_flags = surface_flags
+        self.chunk_tiles = chunk_tiles
+        self.chunks = LruCache(0)
+        self.chunks_created = 0
+
+    @property
+    def chunk_size(self) -> tuple[int, int]:
+        return self.chunk_tiles * self.theme.tile_size[0], self.chunk_tiles * self.theme.tile_size[1]
+
+    def chunk_capacity(self, view_size: tuple[int, int]) -> int:
+        chunk_width, chunk_height = self.chunk_size
+        columns = math.ceil(view_size[0] / chunk_width) + 1
+        rows = math.ceil(view_size[1] / chunk_height) + 1
+        return 2 * columns * rows
+
+    def build_chunk(self, chunk: tuple[int, int]) -> pygame.Surface:
+        width, height = self.state.world_size
+        chunk_tiles = self.chunk_tiles
+        min_x = chunk[0] * chunk_tiles
+        min_y = chunk[1] * chunk_tiles
+        max_x = min(min_x + chunk_tiles, width)
+        max_y = min(min_y + chunk_tiles, height)
+        tile_width, tile_height = self.theme.tile_size
+        surface = pygame.Surface(((max_x - min_x) * tile_width, (max_y - min_y) * tile_height), self.surface_flags)
+        tiles = self.tileset.tiles
+        for y in range(min_y, max_y):
+            row = self.array[y]
+            for x in range(min_x, max_x):
+                tile = row[x]
+                if tile is not None:
+                    surface.blit(tiles[tile[1]][tile[0]], ((x - min_x) * tile_width, (y - min_y) * tile_height))
+        self.chunks_created += 1
+        return surface
+
+    def get_chunk(self, chunk: tuple[int, int]) -> pygame.Surface:
+        return self.chunks.get(chunk, lambda: self.build_chunk(chunk), lambda surface: 1)
 
     def render(self, surface: pygame.Surface) -> None:
-        if self.surface is None:
-            self.surface = pygame.Surface(surface.get_size(), self.surface_flags)
-            for y in range(self.state.world_size[1]):
-                for x in range(self.state.world_size[0]):
-                    tile = self.array[y][x]
-                    if tile is not None:
-                        self.draw_tile(self.surface, (x, y), tile)
-        surface.blit(self.surface, (0, 0))
+        view_size = surface.get_size()
+        self.chunks.budget = self.chunk_capacity(view_size)
+        self.chunks.trim()
+        origin_x, origin_y = self.origin
+        chunk_width, chunk_height = self.chunk_size
+        max_column = math.ceil(self.state.world_size[0] / self.chunk_tiles) - 1
+        max_row = math.ceil(self.state.world_size[1] / self.chunk_tiles) - 1
+        min_column = max(origin_x // chunk_width, 0)
+        min_row = max(origin_y // chunk_height, 0)
+        last_column = min((origin_x + view_size[0] - 1) // chunk_width, max_column)
+        last_row = min((origin_y + view_size[1] - 1) // chunk_height, max_row)
+        for row in range(min_row, last_row + 1):
+            for column in range(min_column, last_column + 1):
+                chunk = self.get_chunk((column, row))
+                surface.blit(chunk, (column * chunk_width - origin_x, row * chunk_height - origin_y))
@@ -0,0 +1,107 @@
+import os
+from typing import Any, Callable, Optional, TypeVar, Union
+
+import pygame
+
+from .lru_cache import LruCache
+from .theme import Theme
+from .tileset import Tileset
+
+T = TypeVar("T")
+
+AssetKey = tuple[str, str, Any]
+Color = Union[pygame.Color, tuple[int, int, int]]
+
+
+class AssetManager:
+    def __init__(self, budget: int = 64 * 1024 * 1024, text_budget: int = 4 * 1024 * 1024) -> None:
+        self.cache = LruCache(budget)
+        self.text_cache = LruCache(text_budget)
+
+    @staticmethod
+    def resolve(path: Union[str, os.PathLike]) -> str:
+        return os.path.abspath(os.fspath(path))
+
+    @staticmethod
+    def surface_size(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    @staticmethod
+    def sound_size(sound: pygame.mixer.Sound) -> int:
+        mixer = pygame.mixer.get_init()
+        if mixer is None:
+            return 0
+        frequency, sample_size, channels = mixer
+        return int(sound.get_length() * frequency * channels * abs(sample_size) // 8)
+
+    def get(self, key: AssetKey, load: Callable[[], T], size: Callable[[T], int]) -> T:
+        return self.cache.get(key, load, size)
+
+    def font(self, path: Union[str, os.PathLike], font_size: int) -> pygame.font.Font:
+        resolved = self.resolve(path)
+        return self.get(
+            ("font", resolved, font_size),
+            lambda: pygame.font.Font(resolved, font_size),
+            lambda _: os.path.getsize(resolved),
+        )
+
+    def image(self, path: Union[str, os.PathLike]) -> pygame.Surface:
+        resolved = self.resolve(path)
+
+        def load() -> pygame.Surface:
+            image = pygame.image.load(resolved)
+            if pygame.display.get_init() and pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+            return image
+
+        return self.get(("image", resolved, None), load, self.surface_size)
+
+    def tileset(
+        self,
+        path: Union[str, os.PathLike],
+        tile_size: tuple[int, int],
+        image: Optional[pygame.Surface] = None,
+    ) -> Tileset:
+        resolved = self.resolve(path)
+        return self.get(
+            ("tileset", resolved, tile_size),
+            lambda: Tileset(resolved, tile_size, image),
+            lambda tileset: self.surface_size(tileset.image),
+        )
+
+    def sound(self, path: Union[str, os.PathLike]) -> pygame.mixer.Sound:
+        resolved = self.resolve(path)
+        return self.get(("sound", resolved, None), lambda: pygame.mixer.Sound(resolved), self.sound_size)
+
+    def text(
+        self,
+        path: Union[str, os.PathLike],
+        font_size: int,
+        text: str,
+        color: Color,
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        resolved = self.resolve(path)
+        key = ("text", resolved, (font_size, text, antialias, tuple(pygame.Color(color))))
+        return self.text_cache.get(
+            key,
+            lambda: self.font(resolved, font_size).render(text, antialias, color),
+            self.surface_size,
+        )
+
+    def warm_up_menus(self, theme: Theme) -> None:
+        self.font(theme.title_font, theme.title_size)
+        self.font(theme.menu_font, theme.menu_size)
+        self.font(theme.message_font, theme.message_size)
+        self.image(theme.cursor_image)
+
+    def warm_up(self, theme: Theme, images: Optional[dict[str, pygame.Surface]] = None) -> None:
+        self.warm_up_menus(theme)
+        for tileset in theme.tilesets:
+            image = None if images is None else images.get(self.resolve(tileset))
+            self.tileset(tileset, theme.tile_size, image)
+        if pygame.mixer.get_init() is None:
+            return
+        for sound in (theme.fire_sound, theme.explosion_sound):
+            if sound is not None:
+                self.sound(theme.locate_resource(sound))
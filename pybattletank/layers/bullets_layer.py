@@ -1,19 +1,34 @@
-import pygame
+from typing import Optional
 
 from pybattletank.state.bullet import Bullet
 from pybattletank.state.game_state import GameState
 
+from .asset_manager import AssetManager
+from .rotated_tile_cache import RotatedTileCache
+from .sprite_layer import Sprite, SpriteLayer
 from .theme import Theme
-from .tiled_layer import TiledLayer
 
 
-class BulletsLayer(TiledLayer):
-    def __init__(self, theme: Theme, image_filename: str, state: GameState, bullets: list[Bullet]) -> None:
-        super().__init__(theme, image_filename)
+class BulletsLayer(SpriteLayer):
+    def __init__(
+        self,
+        theme: Theme,
+        image_filename: str,
+        state: GameState,
+        bullets: list[Bullet],
+        rotation_cache: Optional[RotatedTileCache] = None,
+        assets: Optional[AssetManager] = None,
+    ) -> None:
+        super().__init__(theme, image_filename, rotation_cache, assets)
         self.state = state
         self.bullets = bullets
 
-    def render(self, surface: pygame.Surface) -> None:
+    def sprites(self) -> list[Sprite]:
+        sprites: list[Sprite] = []
         for bullet in self.bullets:
-            if bullet.alive:
-                self.draw_tile(surface, bullet.position, bullet.tile, bullet.orientation)
+            if not bullet.alive:
+                continue
+            position = self.interpolate(bullet)
+            if self.is_visible(position):
+                sprites.append((position, bullet.tile, bullet.orientation))
+        return sprites
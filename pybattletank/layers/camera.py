@@ -0,0 +1,53 @@
+import pygame
+
+
+class Camera:
+    def __init__(self, world_size: tuple[int, int], tile_size: tuple[int, int], view_size: tuple[int, int]) -> None:
+        self.world_size = world_size
+        self.tile_size = tile_size
+        self.width, self.height = view_size
+        self.x = 0
+        self.y = 0
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def follow(self, position: tuple[float, float]) -> bool:
+        tile_width, tile_height = self.tile_size
+        max_x = max(self.world_size[0] * tile_width - self.width, 0)
+        max_y = max(self.world_size[1] * tile_height - self.height, 0)
+        x = int((position[0] + 0.5) * tile_width - self.width / 2)
+        y = int((position[1] + 0.5) * tile_height - self.height / 2)
+        x = min(max(x, 0), max_x)
+        y = min(max(y, 0), max_y)
+        if x == self.x and y == self.y:
+            return False
+        self.x = x
+        self.y = y
+        return True
+
+    def visible_cells(self, margin: int = 0) -> tuple[tuple[int, int], tuple[int, int]]:
+        tile_width, tile_height = self.tile_size
+        min_cell = (self.x // tile_width - margin, self.y // tile_height - margin)
+        max_cell = (
+            (self.x + self.width - 1) // tile_width + margin,
+            (self.y + self.height - 1) // tile_height + margin,
+        )
+        return min_cell, max_cell
+
+    def is_visible(self, position: tuple[float, float], margin: float = 1.0) -> bool:
+        tile_width, tile_height = self.tile_size
+        x = position[0] * tile_width
+        y = position[1] * tile_height
+        margin_x = margin * tile_width
+        margin_y = margin * tile_height
+        return (
+            x + tile_width + margin_x > self.x
+            and x - margin_x < self.x + self.width
+            and y + tile_height + margin_y > self.y
+            and y - margin_y < self.y + self.height
+        )
+
+    def to_world(self, position: tuple[float, float]) -> tuple[float, float]:
+        return position[0] + self.x, position[1] + self.y
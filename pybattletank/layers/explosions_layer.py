@@ -1,31 +1,45 @@
 import math
-from typing import Any
-
-import pygame
+from typing import Any, Optional
 
+from pybattletank.state.game_state import GameState
 from pybattletank.state.unit import Unit
 
+from .asset_manager import AssetManager
+from .sprite_layer import Sprite, SpriteLayer
 from .theme import Theme
-from .tiled_layer import TiledLayer
 
 
-class ExplosionsLayer(TiledLayer):
-    def __init__(self, theme: Theme, image_filename: str) -> None:
-        super().__init__(theme, image_filename)
+class ExplosionsLayer(SpriteLayer):
+    def __init__(
+        self,
+        theme: Theme,
+        image_filename: str,
+        state: GameState,
+        assets: Optional[AssetManager] = None,
+    ) -> None:
+        super().__init__(theme, image_filename, assets=assets)
+        self.state = state
         self.explosions: list[dict[str, Any]] = []
         self.max_frame_index = 27
+        self.frames_per_tick = 0.5
 
     def add(self, position: tuple[int, int]) -> None:
-        self.explosions.append({"position": position, "frameIndex": 0.0})
-
-    def render(self, surface: pygame.Surface) -> None:
-        for explosion in self.explosions:
-            frame_index = math.floor(explosion["frameIndex"])
-            position = explosion["position"]
-            self.draw_tile(surface, position, (frame_index, 4))
-            explosion["frameIndex"] += 0.5
-
-        self.explosions = [explosion for explosion in self.explosions if explosion["frameIndex"] < self.max_frame_index]
+        self.explosions.append({"position": position, "epoch": self.state.epoch + 1})
+
+    def frame_index(self, explosion: dict[str, Any]) -> float:
+        start: int = explosion["epoch"]
+        age = self.state.epoch - start + self.interpolation - 1.0
+        return max(age, 0.0) * self.frames_per_tick
+
+    def sprites(self) -> list[Sprite]:
+        self.explosions = [
+            explosion for explosion in self.explosions if self.frame_index(explosion) < self.max_frame_index
+        ]
+        return [
+            (explosion["position"], (math.floor(self.frame_index(explosion)), 4), None)
+            for explosion in self.explosions
+            if self.is_visible(explosion["position"])
+        ]
 
     def unit_destroyed(self, unit: Unit) -> None:
         self.add(unit.position)
@@ -1,13 +1,30 @@
+from typing import Optional
+
 import pygame
 
 from pybattletank.state.game_state_observer import IGameStateObserver
 
+from .camera import Camera
 from .theme import Theme
 
 
 class Layer(IGameStateObserver):
     def __init__(self, theme: Theme) -> None:
         self.theme = theme
+        self.interpolation = 1.0
+        self.camera: Optional[Camera] = None
+
+    @property
+    def origin(self) -> tuple[int, int]:
+        if self.camera is None:
+            return 0, 0
+        return self.camera.x, self.camera.y
 
     def render(self, surface: pygame.Surface) -> None:
         raise NotImplementedError()
+
+    def dirty_rects(self) -> list[pygame.Rect]:
+        return []
+
+    def render_region(self, surface: pygame.Surface, region: pygame.Rect) -> None:
+        self.render(surface)
@@ -0,0 +1,47 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class LruCache:
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        self.entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def get(self, key: Hashable, load: Callable[[], T], size: Callable[[T], int]) -> T:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            value: T = entry[0]
+            return value
+
+        self.misses += 1
+        value = load()
+        value_size = size(value)
+        self.entries[key] = (value, value_size)
+        self.memory += value_size
+        self.trim()
+        return value
+
+    def trim(self) -> None:
+        while self.memory > self.budget and len(self.entries) > 1:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.memory -= evicted_size
+            self.evictions += 1
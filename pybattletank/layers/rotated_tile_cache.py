@@ -0,0 +1,48 @@
+import pygame
+
+from .lru_cache import LruCache
+
+RotatedTile = tuple[pygame.Surface, tuple[int, int]]
+
+
+class RotatedTileCache:
+    def __init__(self, angle_step: float = 1.0, capacity: int = 1024) -> None:
+        self.angle_step = angle_step
+        self.capacity = capacity
+        self.tiles = LruCache(capacity)
+
+    @property
+    def hits(self) -> int:
+        return self.tiles.hits
+
+    @property
+    def misses(self) -> int:
+        return self.tiles.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.tiles.hit_rate
+
+    def quantize(self, angle: float) -> float:
+        if self.angle_step > 0:
+            angle = round(angle / self.angle_step) * self.angle_step
+        return angle % 360
+
+    def get(
+        self,
+        tileset_name: str,
+        tileset: pygame.Surface,
+        tile_rect: pygame.Rect,
+        angle: float,
+    ) -> RotatedTile:
+        angle = self.quantize(angle)
+        key = (tileset_name, (tile_rect.x, tile_rect.y), angle)
+        return self.tiles.get(key, lambda: self.rotate(tileset, tile_rect, angle), lambda rotated: 1)
+
+    @staticmethod
+    def rotate(tileset: pygame.Surface, tile_rect: pygame.Rect, angle: float) -> RotatedTile:
+        tile = tileset.subsurface(tile_rect)
+        rotated_tile = pygame.transform.rotate(tile, angle)
+        offset_x = (rotated_tile.get_width() - tile.get_width()) // 2
+        offset_y = (rotated_tile.get_height() - tile.get_height()) // 2
+        return rotated_tile, (offset_x, offset_y)
@@ -4,24 +4,28 @@ import pygame
 
 from pybattletank.state.unit import Unit
 
+from .asset_manager import AssetManager
 from .layer import Layer
 from .theme import Theme
 
 
 class SoundLayer(Layer):
-    def __init__(self, theme: Theme) -> None:
+    def __init__(self, theme: Theme, assets: Optional[AssetManager] = None) -> None:
         super().__init__(theme)
+        assets = assets if assets is not None else AssetManager()
         self.fire_sound: Optional[pygame.mixer.Sound] = None
         self.explosion_sound: Optional[pygame.mixer.Sound] = None
+        if pygame.mixer.get_init() is None:
+            return
 
         if theme.fire_sound is not None:
             fire_sound_path = theme.locate_resource(theme.fire_sound)
-            self.fire_sound = pygame.mixer.Sound(fire_sound_path)
+            self.fire_sound = assets.sound(fire_sound_path)
             self.fire_sound.set_volume(0.2)
 
         if theme.explosion_sound is not None:
             explosion_sound_path = theme.locate_resource(theme.explosion_sound)
-            self.explosion_sound = pygame.mixer.Sound(explosion_sound_path)
+            self.explosion_sound = assets.sound(explosion_sound_path)
             self.explosion_sound.set_volume(0.2)
 
     def render(self, surface: pygame.Surface) -> None:
@@ -0,0 +1,84 @@
+import math
+from typing import Optional
+
+import pygame
+
+from pybattletank.state.game_item import GameItem
+
+from .asset_manager import AssetManager
+from .rotated_tile_cache import RotatedTileCache
+from .theme import Theme
+from .tiled_layer import TiledLayer
+
+Sprite = Optional[tuple[tuple[float, float], tuple[int, int], Optional[float]]]
+
+
+class SpriteLayer(TiledLayer):
+    def __init__(
+        self,
+        theme: Theme,
+        imagefile: str,
+        rotation_cache: Optional[RotatedTileCache] = None,
+        assets: Optional[AssetManager] = None,
+    ) -> None:
+        super().__init__(theme, imagefile, rotation_cache, assets)
+        self.drawn: list[Sprite] = []
+        self.drawn_rects: list[pygame.Rect] = []
+
+    def sprites(self) -> list[Sprite]:
+        raise NotImplementedError()
+
+    def is_visible(self, position: tuple[float, float]) -> bool:
+        return self.camera is None or self.camera.is_visible(position)
+
+    def interpolate(self, item: GameItem) -> tuple[float, float]:
+        alpha = self.interpolation
+        previous_x, previous_y = item.previous_position
+        x, y = item.position
+        if alpha >= 1.0 or (previous_x == x and previous_y == y):
+            return x, y
+        return previous_x + (x - previous_x) * alpha, previous_y + (y - previous_y) * alpha
+
+    def render(self, surface: pygame.Surface) -> None:
+        for sprite in self.sprites():
+            if sprite is not None:
+                self.draw_tile(surface, *sprite)
+
+    def sprite_rect(self, sprite: Sprite) -> pygame.Rect:
+        if sprite is None:
+            return pygame.Rect(0, 0, 0, 0)
+        position, _, angle = sprite
+        tile_width, tile_height = self.theme.tile_size
+        origin_x, origin_y = self.origin
+        rect = pygame.Rect(
+            int(position[0] * tile_width) - origin_x, int(position[1] * tile_height) - origin_y, tile_width, tile_height
+        )
+        if angle is None:
+            return rect.inflate(2, 2)
+        size = math.ceil(math.hypot(tile_width, tile_height)) + 2
+        return rect.inflate(size - tile_width, size - tile_height)
+
+    def dirty_rects(self) -> list[pygame.Rect]:
+        drawn = self.drawn
+        drawn_rects = self.drawn_rects
+        sprites = self.sprites()
+        rects = [self.sprite_rect(sprite) for sprite in sprites]
+
+        dirty = []
+        for index in range(max(len(sprites), len(drawn))):
+            if index < len(sprites) and index < len(drawn) and sprites[index] == drawn[index]:
+                continue
+            if index < len(drawn):
+                dirty.append(drawn_rects[index])
+            if index < len(sprites):
+                dirty.append(rects[index])
+
+        self.drawn = sprites
+        self.drawn_rects = rects
+        return dirty
+
+    def render_region(self, surface: pygame.Surface, region: pygame.Rect) -> None:
+        for index in region.collidelistall(self.drawn_rects):
+            sprite = self.drawn[index]
+            if sprite is not None:
+                self.draw_tile(surface, *sprite)
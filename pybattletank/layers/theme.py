@@ -14,6 +14,7 @@ class LoadThemeError(RuntimeError):
 class Theme:
     def __init__(self, locator: AssetLocator, filename: str) -> None:
         self.locator = locator
+        self.filename = filename
 
         loc = locator.locate(filename)
         with open(loc, encoding="utf-8") as file:
@@ -62,7 +63,7 @@ class Theme:
             if name not in section_data:
                 return None
             location: str = section_data[name]
-            return location if not os.path.exists(location) else None
+            return location if os.path.exists(locator.locate(location)) else None
 
         self.fire_sound = set_if_exists(data, "sound", "fire")
         self.explosion_sound = set_if_exists(data, "sound", "explosion")
@@ -71,5 +72,15 @@ class Theme:
         self.victory_music = set_if_exists(data, "music", "victory")
         self.fail_music = set_if_exists(data, "music", "fail")
 
+    @property
+    def tilesets(self) -> tuple[str, ...]:
+        return (
+            self.ground_tileset,
+            self.walls_tileset,
+            self.units_tileset,
+            self.bullets_tileset,
+            self.explosions_tileset,
+        )
+
     def locate_resource(self, name: str) -> Union[str, os.PathLike]:
         return self.locator.locate(name)
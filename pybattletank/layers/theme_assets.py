@@ -0,0 +1,9 @@
+from typing import NamedTuple
+
+from .asset_manager import AssetManager
+from .theme import Theme
+
+
+class ThemeAssets(NamedTuple):
+    theme: Theme
+    assets: AssetManager
@@ -0,0 +1,95 @@
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+import pygame
+
+from pybattletank.locators.asset_locator import AssetLocator
+
+from .asset_manager import AssetManager
+from .theme import Theme
+from .theme_assets import ThemeAssets
+
+DecodedTheme = tuple[Theme, dict[str, pygame.Surface]]
+
+
+class ThemeLibrary:
+    def __init__(
+        self,
+        locator: AssetLocator,
+        current: ThemeAssets,
+        budget: int = 64 * 1024 * 1024,
+        threaded: Optional[bool] = None,
+    ) -> None:
+        self.locator = locator
+        self.current = current
+        self.budget = budget
+        if threaded is None:
+            threaded = sys.platform != "emscripten"
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="theme-loader") if threaded else None
+        self.pending: dict[str, Future[DecodedTheme]] = {}
+        self.sets: OrderedDict[str, ThemeAssets] = OrderedDict()
+        self.sets[self.key(current.theme.filename)] = current
+
+    def key(self, filename: str) -> str:
+        return os.path.abspath(os.fspath(self.locator.locate(filename)))
+
+    @staticmethod
+    def decode(locator: AssetLocator, filename: str) -> DecodedTheme:
+        theme = Theme(locator, filename)
+        images = {AssetManager.resolve(tileset): pygame.image.load(tileset) for tileset in theme.tilesets}
+        return theme, images
+
+    def build(self, decoded: DecodedTheme) -> ThemeAssets:
+        theme, images = decoded
+        current = self.current.assets
+        assets = AssetManager(current.cache.budget, current.text_cache.budget)
+        assets.warm_up(theme, images)
+        return ThemeAssets(theme, assets)
+
+    @property
+    def memory(self) -> int:
+        return sum(item.assets.cache.memory for item in self.sets.values() if item is not self.current)
+
+    def trim(self) -> None:
+        for key in list(self.sets):
+            if self.memory <= self.budget:
+                break
+            if self.sets[key] is not self.current:
+                del self.sets[key]
+
+    def prefetch(self, filename: str) -> None:
+        key = self.key(filename)
+        if self.executor is None or key in self.sets or key in self.pending:
+            return
+        self.pending[key] = self.executor.submit(self.decode, self.locator, filename)
+
+    def poll(self) -> None:
+        for key, future in list(self.pending.items()):
+            if not future.done():
+                continue
+            del self.pending[key]
+            if future.exception() is not None:
+                continue
+            self.sets[key] = self.build(future.result())
+            self.trim()
+            return
+
+    def get(self, filename: str) -> ThemeAssets:
+        key = self.key(filename)
+        theme_assets = self.sets.get(key)
+        if theme_assets is None:
+            future = self.pending.pop(key, None)
+            decoded = future.result() if future is not None else self.decode(self.locator, filename)
+            theme_assets = self.sets[key] = self.build(decoded)
+        self.sets.move_to_end(key)
+        self.current = theme_assets
+        self.trim()
+        return theme_assets
+
+    def shutdown(self) -> None:
+        self.pending.clear()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
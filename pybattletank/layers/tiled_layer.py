@@ -2,36 +2,43 @@ from typing import Optional
 
 import pygame
 
+from .asset_manager import AssetManager
 from .layer import Layer
+from .rotated_tile_cache import RotatedTileCache
 from .theme import Theme
 
 
 class TiledLayer(Layer):
-    def __init__(self, theme: Theme, imagefile: str) -> None:
+    def __init__(
+        self,
+        theme: Theme,
+        imagefile: str,
+        rotation_cache: Optional[RotatedTileCache] = None,
+        assets: Optional[AssetManager] = None,
+    ) -> None:
         super().__init__(theme)
-        self.tileset = pygame.image.load(imagefile)
+        self.tileset_name = imagefile
+        assets = assets if assets is not None else AssetManager()
+        self.tileset = assets.tileset(imagefile, theme.tile_size)
+        self.rotation_cache = rotation_cache if rotation_cache is not None else RotatedTileCache()
 
     def draw_tile(
         self,
         surface: pygame.Surface,
-        position: tuple[int, int],
+        position: tuple[float, float],
         tile_coords: tuple[int, int],
         angle: Optional[float] = None,
     ) -> None:
         tile_width = self.theme.tile_size[0]
         tile_height = self.theme.tile_size[1]
-        sprite_x = position[0] * tile_width
-        sprite_y = position[1] * tile_height
-        tile_x = tile_coords[0] * tile_width
-        tile_y = tile_coords[1] * tile_height
-        tile_rect = pygame.Rect(tile_x, tile_y, tile_width, tile_height)
+        origin_x, origin_y = self.origin
+        sprite_x = position[0] * tile_width - origin_x
+        sprite_y = position[1] * tile_height - origin_y
 
         if angle is None:
-            surface.blit(self.tileset, (sprite_x, sprite_y), tile_rect)
+            surface.blit(self.tileset.tile(tile_coords), (sprite_x, sprite_y))
         else:
-            tile = pygame.Surface((tile_width, tile_height), pygame.SRCALPHA)
-            tile.blit(self.tileset, (0, 0), tile_rect)
-            rotated_tile = pygame.transform.rotate(tile, angle)
-            sprite_x -= (rotated_tile.get_width() - tile.get_width()) // 2
-            sprite_y -= (rotated_tile.get_height() - tile.get_height()) // 2
-            surface.blit(rotated_tile, (sprite_x, sprite_y))
+            rotated_tile, (offset_x, offset_y) = self.rotation_cache.get(
+                self.tileset_name, self.tileset.image, self.tileset.rect(tile_coords), angle
+            )
+            surface.blit(rotated_tile, (sprite_x - offset_x, sprite_y - offset_y))
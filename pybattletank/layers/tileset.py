@@ -0,0 +1,28 @@
+from typing import Optional
+
+import pygame
+
+
+class Tileset:
+    def __init__(self, filename: str, tile_size: tuple[int, int], image: Optional[pygame.Surface] = None) -> None:
+        self.filename = filename
+        self.tile_size = tile_size
+        if image is None:
+            image = pygame.image.load(filename)
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        self.image = image
+        tile_width, tile_height = tile_size
+        self.columns = image.get_width() // tile_width
+        self.rows = image.get_height() // tile_height
+        self.tiles = [
+            [image.subsurface((x * tile_width, y * tile_height, tile_width, tile_height)) for x in range(self.columns)]
+            for y in range(self.rows)
+        ]
+
+    def tile(self, coords: tuple[int, int]) -> pygame.Surface:
+        return self.tiles[coords[1]][coords[0]]
+
+    def rect(self, coords: tuple[int, int]) -> pygame.Rect:
+        tile_width, tile_height = self.tile_size
+        return pygame.Rect(coords[0] * tile_width, coords[1] * tile_height, tile_width, tile_height)
@@ -1,28 +1,47 @@
 import math
-
-import pygame
+from typing import Optional
 
 from pybattletank.state.game_state import GameState
 from pybattletank.state.unit import Unit
 
+from .asset_manager import AssetManager
+from .rotated_tile_cache import RotatedTileCache
+from .sprite_layer import Sprite, SpriteLayer
 from .theme import Theme
-from .tiled_layer import TiledLayer
 
 
-class UnitsLayer(TiledLayer):
-    def __init__(self, theme: Theme, image_filename: str, state: GameState, units: list[Unit]) -> None:
-        super().__init__(theme, image_filename)
+class UnitsLayer(SpriteLayer):
+    def __init__(
+        self,
+        theme: Theme,
+        image_filename: str,
+        state: GameState,
+        units: list[Unit],
+        rotation_cache: Optional[RotatedTileCache] = None,
+        assets: Optional[AssetManager] = None,
+    ) -> None:
+        super().__init__(theme, image_filename, rotation_cache, assets)
         self.state = state
         self.units = units
 
-    def render(self, surface: pygame.Surface) -> None:
-        for unit in self.units:
-            self.draw_tile(surface, unit.position, unit.tile, unit.orientation)
+    def visible_units(self) -> list[Unit]:
+        if self.camera is None:
+            return self.units
+        min_cell, max_cell = self.camera.visible_cells(1)
+        return self.state.units_in_box(min_cell, max_cell)
+
+    def sprites(self) -> list[Sprite]:
+        sprites: list[Sprite] = []
+        for unit in self.visible_units():
+            position = self.interpolate(unit)
+            sprites.append((position, unit.tile, unit.orientation))
             if not unit.alive:
+                sprites.append(None)
                 continue
 
             dir_x = unit.weapon_target[0] - unit.position[0]
             dir_y = unit.weapon_target[1] - unit.position[1]
             angle = math.atan2(-dir_x, -dir_y) * 180 / math.pi
 
-            self.draw_tile(surface, unit.position, (4, 1), angle)
+            sprites.append((position, (4, 1), angle))
+        return sprites
@@ -1,34 +1,64 @@
 import os
 import sys
+from typing import Optional
 
 import pygame
 
 from pybattletank.finders.directory_level_finder import DirectoryLevelFinder
 from pybattletank.finders.level_finder import LevelFinder
+from pybattletank.finders.level_index import LevelIndex
 from pybattletank.finders.multisource_level_finder import MultiSourceLevelFinder
 from pybattletank.finders.packaged_level_finder import PackagedLevelFinder
+from pybattletank.layers.asset_manager import AssetManager
 from pybattletank.layers.theme import Theme
 from pybattletank.locators.asset_locator import AssetLocator
 from pybattletank.locators.directory_asset_locator import DirectoryAssetLocator
 from pybattletank.locators.packaged_asset_locator import PackagedAssetLocator
+from pybattletank.state.level_cache import LevelCache
+from pybattletank.ui.startup_report import StartupReport
 from pybattletank.ui.user_interface import UserInterface
 
 os.environ["SDL_VIDEO_CENTERED"] = "1"
 
 
-async def run() -> None:
+async def run(
+    dirty_rendering: bool = False,
+    level_cache_dir: Optional[str] = None,
+    sim_rate: float = 60.0,
+    frame_rate: int = 60,
+    record_dir: Optional[str] = None,
+    asset_budget: int = 64,
+    startup_report: Optional[StartupReport] = None,
+) -> None:
+    level_cache = LevelCache(level_cache_dir or LevelCache.default_directory())
+    level_index = LevelIndex(level_cache.directory / "index.json", level_cache)
+
     locator: AssetLocator
     packaged_level_finder: LevelFinder
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
         locator = DirectoryAssetLocator(os.path.join(sys._MEIPASS, "assets"))
-        packaged_level_finder = DirectoryLevelFinder(os.path.join(sys._MEIPASS, "assets"))
+        packaged_level_finder = DirectoryLevelFinder(os.path.join(sys._MEIPASS, "assets"), level_index)
     else:
         locator = PackagedAssetLocator("pybattletank.assets")
-        packaged_level_finder = PackagedLevelFinder("pybattletank.assets")
+        packaged_level_finder = PackagedLevelFinder("pybattletank.assets", level_index)
 
     theme = Theme(locator, "theme.json")
-    current_dir_level_finder = DirectoryLevelFinder("./levels")
+    if startup_report is not None:
+        startup_report.mark("theme")
+    current_dir_level_finder = DirectoryLevelFinder("./levels", level_index)
     level_finder = MultiSourceLevelFinder(packaged_level_finder, current_dir_level_finder)
-    game = UserInterface(theme, locator, level_finder)
+    assets = AssetManager(asset_budget * 1024 * 1024)
+    game = UserInterface(
+        theme,
+        locator,
+        level_finder,
+        dirty_rendering,
+        level_cache,
+        sim_rate,
+        frame_rate,
+        record_dir,
+        assets,
+        startup_report,
+    )
     await game.run()
     pygame.quit()
@@ -14,6 +14,10 @@ class GameMode:
         for observer in self.observers:
             observer.load_level_requested(filename)
 
+    def notify_prefetch_level_requested(self, filename: str) -> None:
+        for observer in self.observers:
+            observer.prefetch_level_requested(filename)
+
     def notify_show_menu_requested(self, menu_name: str) -> None:
         for observer in self.observers:
             observer.show_menu_requested(menu_name)
@@ -26,6 +30,10 @@ class GameMode:
         for observer in self.observers:
             observer.change_theme_requested(theme_file)
 
+    def notify_prefetch_theme_requested(self, theme_file: str) -> None:
+        for observer in self.observers:
+            observer.prefetch_theme_requested(theme_file)
+
     def notify_show_game_requested(self) -> None:
         for observer in self.observers:
             observer.show_game_requested()
@@ -50,3 +58,9 @@ class GameMode:
 
     def render(self, surface: pygame.Surface) -> None:
         raise NotImplementedError()
+
+    def dirty_rects(self) -> list[pygame.Rect]:
+        return []
+
+    def render_region(self, surface: pygame.Surface, region: pygame.Rect) -> None:
+        self.render(surface)
@@ -2,6 +2,9 @@ class IGameModeObserver:
     def load_level_requested(self, filename: str) -> None:
         pass
 
+    def prefetch_level_requested(self, filename: str) -> None:
+        pass
+
     def show_menu_requested(self, menu_name: str) -> None:
         pass
 
@@ -11,6 +14,9 @@ class IGameModeObserver:
     def change_theme_requested(self, theme_file: str) -> None:
         pass
 
+    def prefetch_theme_requested(self, theme_file: str) -> None:
+        pass
+
     def show_game_requested(self) -> None:
         pass
 
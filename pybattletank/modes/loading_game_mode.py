@@ -0,0 +1,52 @@
+from typing import TYPE_CHECKING, Optional
+
+import pygame
+
+from pybattletank.layers.asset_manager import AssetManager
+from pybattletank.layers.theme import Theme
+
+from .game_mode import GameMode
+
+if TYPE_CHECKING:
+    from pybattletank.state.level_loader import LevelLoader
+
+
+class LoadingGameMode(GameMode):
+    def __init__(self, theme: Theme, title: str, loader: "LevelLoader", assets: Optional[AssetManager] = None) -> None:
+        super().__init__()
+        assets = assets if assets is not None else AssetManager()
+        self.loader = loader
+        self.text_color = pygame.Color(200, 0, 0)
+        self.title_surface = assets.text(theme.message_font, theme.message_size, f"Loading {title}...", self.text_color)
+        self.bar_rect = pygame.Rect(0, 0, 0, 0)
+        self.drawn_progress: Optional[float] = None
+
+    def process_input(self, mouse_x: float, mouse_y: float) -> None:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.notify_quit_requested()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                self.notify_show_menu_requested("play")
+
+    def update(self) -> None:
+        pass
+
+    def render(self, surface: pygame.Surface) -> None:
+        width = surface.get_width() // 2
+        height = self.title_surface.get_height() // 2
+        x = (surface.get_width() - self.title_surface.get_width()) // 2
+        y = (surface.get_height() - self.title_surface.get_height() - height * 2) // 2
+        surface.blit(self.title_surface, (x, y))
+
+        self.bar_rect = pygame.Rect((surface.get_width() - width) // 2, y + height * 3, width, height)
+        progress = self.loader.progress
+        pygame.draw.rect(surface, self.text_color, self.bar_rect, 2)
+        filled = self.bar_rect.inflate(-6, -6)
+        filled.width = int(filled.width * progress)
+        surface.fill(self.text_color, filled)
+        self.drawn_progress = progress
+
+    def dirty_rects(self) -> list[pygame.Rect]:
+        if self.drawn_progress is None or self.drawn_progress == self.loader.progress:
+            return []
+        return [self.bar_rect]
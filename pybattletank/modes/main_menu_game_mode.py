@@ -1,10 +1,13 @@
+from typing import Optional
+
+from pybattletank.layers.asset_manager import AssetManager
 from pybattletank.layers.theme import Theme
 
 from .menu_game_mode import MenuGameMode
 
 
 class MainMenuGameMode(MenuGameMode):
-    def __init__(self, theme: Theme):
+    def __init__(self, theme: Theme, assets: Optional[AssetManager] = None):
         menu_items = [
             {
                 "title": "Play",
@@ -16,4 +19,4 @@ class MainMenuGameMode(MenuGameMode):
             },
             {"title": "Quit", "action": lambda: self.notify_quit_requested()},
         ]
-        super().__init__(theme, menu_items)
+        super().__init__(theme, menu_items, assets)
@@ -1,30 +1,34 @@
+from typing import Optional
+
 import pygame
 
+from pybattletank.layers.asset_manager import AssetManager
 from pybattletank.layers.theme import Theme
 
 from .game_mode import GameMode
 
 
 class MenuGameMode(GameMode):
-    def __init__(self, theme: Theme, menu_items: list[dict]) -> None:
+    def __init__(self, theme: Theme, menu_items: list[dict], assets: Optional[AssetManager] = None) -> None:
         super().__init__()
+        assets = assets if assets is not None else AssetManager()
 
-        title_font_path = theme.title_font
-        menu_font_path = theme.menu_font
-        self.title_font = pygame.font.Font(title_font_path, theme.title_size)
-        self.item_font = pygame.font.Font(menu_font_path, theme.menu_size)
+        self.theme = theme
+        self.assets = assets
 
         self.menu_width = 0
         self.menu_items = menu_items
         self.text_color = pygame.Color(200, 0, 0)
         for item in self.menu_items:
-            surface = self.item_font.render(item["title"], True, self.text_color)
+            surface = assets.text(theme.menu_font, theme.menu_size, item["title"], self.text_color)
             self.menu_width = max(surface.get_width(), self.menu_width)
             item["surface"] = surface
 
         self.current_menu_item = 0
+        self.drawn_menu_item: Optional[int] = None
+        self.cursor_rects: list[pygame.Rect] = []
         menu_cursor_path = theme.cursor_image
-        self.menu_cursor = pygame.image.load(menu_cursor_path)
+        self.menu_cursor = assets.image(menu_cursor_path)
 
     def update(self) -> None:
         pass
@@ -51,19 +55,28 @@ class MenuGameMode(GameMode):
 
     def render(self, surface: pygame.Surface) -> None:
         y = 50
-        title_surface = self.title_font.render("TANK BATTLEGROUNDS !!!", True, self.text_color)
+        theme = self.theme
+        title_surface = self.assets.text(theme.title_font, theme.title_size, "TANK BATTLEGROUNDS !!!", self.text_color)
         x = (surface.get_width() - title_surface.get_width()) // 2
         surface.blit(title_surface, (x, y))
         y += (200 * title_surface.get_height()) // 100
 
         x = (surface.get_width() - self.menu_width) // 2
+        self.cursor_rects = []
         for idx, item in enumerate(self.menu_items):
             item_surface: pygame.Surface = item["surface"]
             surface.blit(item_surface, (x, y))
 
+            cursor_x = x - self.menu_cursor.get_width() - 10
+            cursor_y = y + (item_surface.get_height() - self.menu_cursor.get_height()) // 2
+            self.cursor_rects.append(self.menu_cursor.get_rect(topleft=(cursor_x, cursor_y)))
             if idx == self.current_menu_item:
-                cursor_x = x - self.menu_cursor.get_width() - 10
-                cursor_y = y + (item_surface.get_height() - self.menu_cursor.get_height()) // 2
                 surface.blit(self.menu_cursor, (cursor_x, cursor_y))
 
             y += (120 * item_surface.get_height()) // 100
+        self.drawn_menu_item = self.current_menu_item
+
+    def dirty_rects(self) -> list[pygame.Rect]:
+        if self.drawn_menu_item is None or self.drawn_menu_item == self.current_menu_item:
+            return []
+        return [self.cursor_rects[self.drawn_menu_item], self.cursor_rects[self.current_menu_item]]
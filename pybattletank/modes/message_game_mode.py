@@ -1,21 +1,22 @@
+from typing import Optional
+
 import pygame
 
+from pybattletank.layers.asset_manager import AssetManager
 from pybattletank.layers.theme import Theme
 
 from .game_mode import GameMode
 
 
 class MessageGameMode(GameMode):
-    def __init__(self, theme: Theme, message: str) -> None:
+    def __init__(self, theme: Theme, message: str, assets: Optional[AssetManager] = None) -> None:
         super().__init__()
-        font_path = theme.message_font
-        self.font = pygame.font.Font(font_path, theme.message_size)
-
+        assets = assets if assets is not None else AssetManager()
         width, height = 0, 0
         lines = message.split("\n")
         surfaces = []
         for line in lines:
-            surface = self.font.render(line, True, pygame.Color(200, 0, 0))
+            surface = assets.text(theme.message_font, theme.message_size, line, pygame.Color(200, 0, 0))
             height += surface.get_height()
             width = max(width, surface.get_width())
             surfaces.append(surface)
@@ -25,7 +26,7 @@ class MessageGameMode(GameMode):
         for surface in surfaces:
             x = (main_surface.get_width() - surface.get_width()) // 2
             main_surface.blit(surface, (x, y))
-            y += main_surface.get_height()
+            y += surface.get_height()
         self.surface = main_surface
 
     def process_input(self, mouse_x: float, mouse_y: float) -> None:
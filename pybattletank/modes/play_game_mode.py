@@ -1,55 +1,108 @@
+from typing import Optional
+
 import pygame
 
 from pybattletank.command.command import Command
-from pybattletank.command.delete_destroyed_command import DeleteDestroyedCommand
-from pybattletank.command.move_bullet_command import MoveBulletCommand
 from pybattletank.command.move_command import MoveCommand
 from pybattletank.command.shoot_command import ShootCommand
 from pybattletank.command.target_command import TargetCommand
+from pybattletank.engines.bullet_engines import create_bullet_engine
 from pybattletank.layers.array_layer import ArrayLayer
+from pybattletank.layers.asset_manager import AssetManager
 from pybattletank.layers.bullets_layer import BulletsLayer
+from pybattletank.layers.camera import Camera
 from pybattletank.layers.explosions_layer import ExplosionsLayer
+from pybattletank.layers.layer import Layer
+from pybattletank.layers.rotated_tile_cache import RotatedTileCache
 from pybattletank.layers.sound_layer import SoundLayer
 from pybattletank.layers.theme import Theme
 from pybattletank.layers.units_layer import UnitsLayer
-from pybattletank.linalg.vector import vector_dist
+from pybattletank.replay.replay_recorder import ReplayRecorder
+from pybattletank.state.flow_field import FlowField
+from pybattletank.state.game_state import GameState
+from pybattletank.state.level_cache import LevelCache
 from pybattletank.state.level_loader import LevelLoader
+from pybattletank.systems.chase_system import ChaseSystem
+from pybattletank.systems.cleanup_system import CleanupSystem
+from pybattletank.systems.firing_system import FiringSystem
+from pybattletank.systems.targeting_system import TargetingSystem
 
 from .game_mode import GameMode
+from .player_input import PlayerInput
 
 
 class PlayGameMode(GameMode):
-    def load_level(self, theme: Theme, filename: str) -> None:
+    def __init__(
+        self,
+        bullet_engine: str = "python",
+        rotation_step: float = 1.0,
+        level_cache: Optional[LevelCache] = None,
+        assets: Optional[AssetManager] = None,
+    ) -> None:
+        super().__init__()
+        self.level_cache = level_cache
+        self.assets = assets if assets is not None else AssetManager()
+        self.bullet_engine = create_bullet_engine(bullet_engine)
+        self.rotation_cache = RotatedTileCache(rotation_step)
+        self.recorder: Optional[ReplayRecorder] = None
+        self.layers: list[Layer] = []
+
+    def load_level(self, theme: Theme, filename: str, state: Optional[GameState] = None) -> None:
+        if state is None:
+            loader = LevelLoader(filename, self.level_cache)
+            loader.run()
+            state = loader.state
+
+        self.load_state(state)
+        self.layers = []
+        self.set_theme(theme)
+
+    def set_theme(self, theme: Theme, assets: Optional[AssetManager] = None) -> None:
         self.theme = theme
+        if assets is not None:
+            self.assets = assets
+        state = self.game_state
+        for layer in self.layers:
+            state.remove_observer(layer)
 
-        loader = LevelLoader(filename)
-        loader.run()
-
-        self.game_state = state = loader.state
         self.tile_width = theme.tile_size[0]
         self.tile_height = theme.tile_size[1]
 
-        self.render_width = state.world_size[0] * self.tile_width
-        self.render_height = state.world_size[1] * self.tile_height
+        self.render_width = min(state.world_size[0] * self.tile_width, theme.default_window_width)
+        self.render_height = min(state.world_size[1] * self.tile_height, theme.default_window_height)
+        self.camera = Camera(state.world_size, theme.tile_size, (self.render_width, self.render_height))
+        self.camera_moved = False
+        self.interpolation = 1.0
         self.rescaled_x = 0
         self.rescaled_y = 0
         self.rescaled_scale_x = 1.0
         self.rescaled_scale_y = 1.0
 
+        assets = self.assets
         self.layers = [
-            ArrayLayer(theme, theme.ground_tileset, state, state.ground, 0),
-            ArrayLayer(theme, theme.walls_tileset, state, state.walls),
-            UnitsLayer(theme, theme.units_tileset, state, state.units),
-            BulletsLayer(theme, theme.bullets_tileset, state, state.bullets),
-            ExplosionsLayer(theme, theme.explosions_tileset),
-            SoundLayer(theme),
+            ArrayLayer(theme, theme.ground_tileset, state, state.ground, 0, assets=assets),
+            ArrayLayer(theme, theme.walls_tileset, state, state.walls, assets=assets),
+            UnitsLayer(theme, theme.units_tileset, state, state.units, self.rotation_cache, assets),
+            BulletsLayer(theme, theme.bullets_tileset, state, state.bullets, self.rotation_cache, assets),
+            ExplosionsLayer(theme, theme.explosions_tileset, state, assets),
+            SoundLayer(theme, assets),
         ]
 
         for layer in self.layers:
-            self.game_state.add_observer(layer)
+            layer.camera = self.camera
+            state.add_observer(layer)
+        self.update_camera()
 
-        self.player_unit = self.game_state.units[0]
+    def load_state(self, state: GameState) -> None:
+        self.game_state = state
+        self.player_unit = state.units[0]
         self.commands: list[Command] = []
+        self.flow_field = FlowField(state)
+        self.chase_system = ChaseSystem(self.player_unit, self.flow_field)
+        self.targeting_system = TargetingSystem(self.player_unit)
+        self.firing_system = FiringSystem(self.player_unit)
+        self.cleanup_system = CleanupSystem()
+        self.recorder = None
         self.game_over = False
 
     def process_input(self, mouse_x: float, mouse_y: float) -> None:
@@ -76,39 +129,50 @@ class PlayGameMode(GameMode):
         if self.game_over:
             return
 
+        world_x, world_y = self.camera.to_world((mouse_x, mouse_y))
+        target_cell = (
+            world_x / self.tile_width - 0.5,
+            world_y / self.tile_height - 0.5,
+        )
+        self.apply_input(PlayerInput((dx, dy), target_cell, mouse_clicked))
+
+    def apply_input(self, player_input: PlayerInput) -> None:
+        if self.game_over:
+            return
+        if self.recorder is not None:
+            self.recorder.record_input(player_input)
+
         state = self.game_state
         player_unit = self.player_unit
+        dx, dy = player_input.move
         if dx != 0 or dy != 0:
             self.commands.append(MoveCommand(state, player_unit, (dx, dy)))
 
-        target_cell = (
-            mouse_x / self.tile_width - 0.5,
-            mouse_y / self.tile_height - 0.5,
-        )
-        self.commands.append(TargetCommand(state, player_unit, target_cell))
-
-        self.commands.extend([
-            TargetCommand(state, unit, player_unit.position) for unit in state.units if unit != player_unit
-        ])
-        self.commands.extend([
-            ShootCommand(state, unit)
-            for unit in state.units
-            if unit != player_unit and vector_dist(unit.position, player_unit.position) <= state.bullet_range
-        ])
-
-        if mouse_clicked:
-            self.commands.append(ShootCommand(state, player_unit))
+        self.commands.append(TargetCommand(state, player_unit, player_input.target))
 
-        for bullet in state.bullets:
-            self.commands.append(MoveBulletCommand(state, bullet))
-
-        self.commands.append(DeleteDestroyedCommand(state.bullets))
+        if player_input.fire:
+            self.commands.append(ShootCommand(state, player_unit))
 
     def update(self) -> None:
+        state = self.game_state
+        state.settle_moved_units()
+        state.collision_candidates = 0
+        moving_bullets = len(state.bullets)
+        if not self.game_over:
+            self.chase_system.run(state)
+            self.targeting_system.run(state)
+            self.firing_system.run(state)
+
         for command in self.commands:
             command.run()
         self.commands.clear()
-        self.game_state.epoch += 1
+
+        if not self.game_over:
+            self.bullet_engine.move(state, moving_bullets)
+            self.cleanup_system.run(state)
+        state.epoch += 1
+        if self.recorder is not None:
+            self.recorder.record_tick(state)
 
         if not self.player_unit.alive:
             self.game_over = True
@@ -117,6 +181,34 @@ class PlayGameMode(GameMode):
             self.game_over = True
             self.notify_game_won()
 
+    def set_interpolation(self, alpha: float) -> None:
+        self.interpolation = alpha
+        for layer in self.layers:
+            layer.interpolation = alpha
+
+    def update_camera(self) -> None:
+        player_unit = self.player_unit
+        alpha = self.interpolation
+        previous_x, previous_y = player_unit.previous_position
+        x, y = player_unit.position
+        position = (previous_x + (x - previous_x) * alpha, previous_y + (y - previous_y) * alpha)
+        if self.camera.follow(position):
+            self.camera_moved = True
+
     def render(self, surface: pygame.Surface) -> None:
+        self.update_camera()
+        self.camera_moved = False
         for layer in self.layers:
             layer.render(surface)
+
+    def dirty_rects(self) -> list[pygame.Rect]:
+        self.update_camera()
+        rects = [rect for layer in self.layers for rect in layer.dirty_rects()]
+        if self.camera_moved:
+            self.camera_moved = False
+            return [pygame.Rect(0, 0, self.camera.width, self.camera.height)]
+        return rects
+
+    def render_region(self, surface: pygame.Surface, region: pygame.Rect) -> None:
+        for layer in self.layers:
+            layer.render_region(surface, region)
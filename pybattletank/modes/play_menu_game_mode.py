@@ -1,16 +1,20 @@
+from typing import Optional
+
 from pybattletank.finders.level_finder import LevelFinder
+from pybattletank.layers.asset_manager import AssetManager
 from pybattletank.layers.theme import Theme
 
 from .menu_game_mode import MenuGameMode
 
 
 class PlayMenuGameMode(MenuGameMode):
-    def __init__(self, theme: Theme, level_finder: LevelFinder):
+    def __init__(self, theme: Theme, level_finder: LevelFinder, assets: Optional[AssetManager] = None):
         menu_items = []
         levels = level_finder.all()
         for level in levels:
             menu_items.append({
                 "title": level["name"],
+                "file": str(level["path"]),
                 "action": lambda file=str(level["path"]): self.notify_load_level_requested(file),
             })
         menu_items.append(
@@ -19,4 +23,14 @@ class PlayMenuGameMode(MenuGameMode):
                 "action": lambda: self.notify_show_menu_requested("main"),
             },
         )
-        super().__init__(theme, menu_items)
+        super().__init__(theme, menu_items, assets)
+        self.prefetched_menu_item: Optional[int] = None
+
+    def process_input(self, mouse_x: float, mouse_y: float) -> None:
+        super().process_input(mouse_x, mouse_y)
+        if self.prefetched_menu_item == self.current_menu_item:
+            return
+        self.prefetched_menu_item = self.current_menu_item
+        filename = self.menu_items[self.current_menu_item].get("file")
+        if filename is not None:
+            self.notify_prefetch_level_requested(filename)
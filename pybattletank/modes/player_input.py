@@ -0,0 +1,7 @@
+from typing import NamedTuple
+
+
+class PlayerInput(NamedTuple):
+    move: tuple[int, int] = (0, 0)
+    target: tuple[float, float] = (0.0, 0.0)
+    fire: bool = False
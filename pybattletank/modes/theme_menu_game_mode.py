@@ -1,21 +1,24 @@
 import importlib
 import os
+from typing import Optional
 
+from pybattletank.layers.asset_manager import AssetManager
 from pybattletank.layers.theme import Theme
 
 from .menu_game_mode import MenuGameMode
 
 
 class ThemeMenuGameMode(MenuGameMode):
-    def __init__(self, theme: Theme):
+    def __init__(self, theme: Theme, assets: Optional[AssetManager] = None):
         menu_items = []
-        for file in os.listdir("."):
-            name, ext = os.path.splitext(file)
+        for item in importlib.resources.files("pybattletank.assets").iterdir():
+            name, ext = os.path.splitext(item.name)
             if ext != ".json":
                 continue
             menu_items.append({
                 "title": name,
-                "action": lambda file=file: self.notify_change_theme_requested(self.get_theme_path(file)),
+                "file": self.get_theme_path(item.name),
+                "action": lambda file=item.name: self.notify_change_theme_requested(self.get_theme_path(file)),
             })
         menu_items.append(
             {
@@ -23,7 +26,16 @@ class ThemeMenuGameMode(MenuGameMode):
                 "action": lambda: self.notify_show_menu_requested("main"),
             },
         )
-        super().__init__(theme, menu_items)
+        super().__init__(theme, menu_items, assets)
+        self.prefetched = False
+
+    def process_input(self, mouse_x: float, mouse_y: float) -> None:
+        if not self.prefetched:
+            self.prefetched = True
+            for item in self.menu_items:
+                if "file" in item:
+                    self.notify_prefetch_theme_requested(item["file"])
+        super().process_input(mouse_x, mouse_y)
 
     def get_theme_path(self, filename: str) -> str:
         level_path = importlib.resources.files("pybattletank.assets").joinpath(filename)
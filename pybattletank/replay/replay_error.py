@@ -0,0 +1,7 @@
+from typing import Any
+
+
+class ReplayError(ValueError):
+    def __init__(self, message: str, *args: Any) -> None:
+        self.message = message.format(*args)
+        super().__init__(self.message)
@@ -0,0 +1,50 @@
+import hashlib
+import os
+import struct
+from typing import BinaryIO, NamedTuple
+
+from .replay_error import ReplayError
+
+HEADER = struct.Struct("<4sHI32sH")
+MAGIC = b"PBTR"
+VERSION = 1
+
+
+class ReplayHeader(NamedTuple):
+    level: str
+    level_digest: bytes
+    hash_interval: int
+
+    @classmethod
+    def for_level(cls, filename: str, hash_interval: int = 60) -> "ReplayHeader":
+        with open(filename, "rb") as file:
+            digest = hashlib.sha256(file.read()).digest()
+        level = os.path.splitext(os.path.basename(filename))[0]
+        return cls(level, digest, hash_interval)
+
+    def matches_level(self, filename: str) -> bool:
+        return ReplayHeader.for_level(filename, self.hash_interval).level_digest == self.level_digest
+
+    def write(self, file: BinaryIO) -> None:
+        level = self.level.encode("utf-8")
+        file.write(HEADER.pack(MAGIC, VERSION, self.hash_interval, self.level_digest, len(level)))
+        file.write(level)
+
+    @classmethod
+    def read(cls, file: BinaryIO) -> "ReplayHeader":
+        data = file.read(HEADER.size)
+        if len(data) != HEADER.size:
+            msg = "Truncated replay header"
+            raise ReplayError(msg)
+        magic, version, hash_interval, digest, length = HEADER.unpack(data)
+        if magic != MAGIC:
+            msg = "Not a replay file"
+            raise ReplayError(msg)
+        if version != VERSION:
+            msg = "Unsupported replay version {}"
+            raise ReplayError(msg, version)
+        level = file.read(length)
+        if len(level) != length:
+            msg = "Truncated replay header"
+            raise ReplayError(msg)
+        return cls(level.decode("utf-8"), digest, hash_interval)
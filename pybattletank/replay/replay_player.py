@@ -0,0 +1,76 @@
+import time
+from typing import Optional
+
+from pybattletank.modes.game_mode_observer import IGameModeObserver
+from pybattletank.modes.play_game_mode import PlayGameMode
+from pybattletank.state.level_cache import LevelCache
+from pybattletank.state.level_loader import LevelLoader
+
+from .replay_error import ReplayError
+from .replay_header import ReplayHeader
+from .replay_record import ReplayRecord
+from .replay_result import ReplayResult
+from .state_hash import state_hash
+
+
+class ReplayPlayer(IGameModeObserver):
+    def __init__(
+        self,
+        filename: str,
+        level_filename: str,
+        bullet_engine: str = "python",
+        level_cache: Optional[LevelCache] = None,
+    ) -> None:
+        self.filename = filename
+        self.level_filename = level_filename
+        self.bullet_engine = bullet_engine
+        self.level_cache = level_cache
+        self.outcome: Optional[str] = None
+
+    def game_won(self) -> None:
+        self.outcome = "won"
+
+    def game_lost(self) -> None:
+        self.outcome = "lost"
+
+    def run(self) -> ReplayResult:
+        with open(self.filename, "rb") as file:
+            header = ReplayHeader.read(file)
+            if not header.matches_level(self.level_filename):
+                msg = "Replay was recorded on a different version of level {}"
+                raise ReplayError(msg, header.level)
+
+            loader = LevelLoader(self.level_filename, self.level_cache)
+            loader.run()
+            mode = PlayGameMode(self.bullet_engine)
+            mode.add_observer(self)
+            mode.load_state(loader.state)
+            state = mode.game_state
+
+            self.outcome = None
+            ticks = 0
+            hashes_checked = 0
+            divergence_epoch = None
+            last_target = (0.0, 0.0)
+            start = time.perf_counter()
+            while True:
+                entry = ReplayRecord.read(file, last_target)
+                if entry is None:
+                    break
+                record, last_target = entry
+                if record.player_input is not None:
+                    mode.apply_input(record.player_input)
+                if not record.end_of_tick:
+                    continue
+                mode.update()
+                ticks += 1
+                if record.state_hash is not None:
+                    hashes_checked += 1
+                    if state_hash(state) != record.state_hash:
+                        divergence_epoch = state.epoch
+                        break
+            elapsed = time.perf_counter() - start
+
+        return ReplayResult(
+            header.level, self.outcome or "unfinished", ticks, elapsed, hashes_checked, divergence_epoch
+        )
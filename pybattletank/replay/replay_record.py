@@ -0,0 +1,86 @@
+import struct
+from typing import BinaryIO, NamedTuple, Optional
+
+from pybattletank.modes.player_input import PlayerInput
+
+from .replay_error import ReplayError
+
+TARGET = struct.Struct("<dd")
+HASH_SIZE = 8
+
+NO_INPUT = 0x0F
+FIRE = 0x10
+TARGET_FOLLOWS = 0x20
+HASH_FOLLOWS = 0x40
+CONTINUED = 0x80
+
+
+class ReplayRecord(NamedTuple):
+    player_input: Optional[PlayerInput]
+    end_of_tick: bool = True
+    state_hash: Optional[bytes] = None
+
+    @staticmethod
+    def encode_move(move: tuple[int, int]) -> int:
+        dx, dy = move
+        if dx not in (-1, 0, 1) or dy not in (-1, 0, 1):
+            msg = "Cannot record move {}"
+            raise ReplayError(msg, move)
+        return (dx + 1) * 3 + dy + 1
+
+    @staticmethod
+    def decode_move(code: int) -> tuple[int, int]:
+        if code > 8:
+            msg = "Invalid move code {}"
+            raise ReplayError(msg, code)
+        return code // 3 - 1, code % 3 - 1
+
+    def write(self, file: BinaryIO, last_target: Optional[tuple[float, float]]) -> Optional[tuple[float, float]]:
+        player_input = self.player_input
+        flags = NO_INPUT
+        target = b""
+        if player_input is not None:
+            flags = self.encode_move(player_input.move)
+            if player_input.fire:
+                flags |= FIRE
+            if player_input.target != last_target:
+                flags |= TARGET_FOLLOWS
+                target = TARGET.pack(*player_input.target)
+                last_target = player_input.target
+        if not self.end_of_tick:
+            flags |= CONTINUED
+        state_hash = b""
+        if self.state_hash is not None:
+            flags |= HASH_FOLLOWS
+            state_hash = self.state_hash
+        file.write(bytes((flags,)) + target + state_hash)
+        return last_target
+
+    @classmethod
+    def read(
+        cls, file: BinaryIO, last_target: tuple[float, float]
+    ) -> Optional[tuple["ReplayRecord", tuple[float, float]]]:
+        data = file.read(1)
+        if len(data) == 0:
+            return None
+        flags = data[0]
+
+        player_input = None
+        if flags & NO_INPUT != NO_INPUT:
+            if flags & TARGET_FOLLOWS:
+                last_target = TARGET.unpack(cls.read_exactly(file, TARGET.size))
+            move = cls.decode_move(flags & NO_INPUT)
+            player_input = PlayerInput(move, last_target, bool(flags & FIRE))
+
+        state_hash = None
+        if flags & HASH_FOLLOWS:
+            state_hash = cls.read_exactly(file, HASH_SIZE)
+        return cls(player_input, not flags & CONTINUED, state_hash), last_target
+
+    @staticmethod
+    def read_exactly(file: BinaryIO, size: int) -> bytes:
+        data = file.read(size)
+        if len(data) != size:
+            msg = "Truncated replay record"
+            raise ReplayError(msg)
+        return data
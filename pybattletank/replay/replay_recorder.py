@@ -0,0 +1,36 @@
+from typing import BinaryIO, Optional
+
+from pybattletank.modes.player_input import PlayerInput
+from pybattletank.state.game_state import GameState
+
+from .replay_header import ReplayHeader
+from .replay_record import ReplayRecord
+from .state_hash import state_hash
+
+
+class ReplayRecorder:
+    def __init__(self, file: BinaryIO, header: ReplayHeader) -> None:
+        self.file = file
+        self.header = header
+        self.pending: list[PlayerInput] = []
+        self.last_target: Optional[tuple[float, float]] = None
+        self.ticks = 0
+        header.write(file)
+
+    def record_input(self, player_input: PlayerInput) -> None:
+        self.pending.append(player_input)
+
+    def record_tick(self, state: GameState) -> None:
+        interval = self.header.hash_interval
+        tick_hash = state_hash(state) if interval > 0 and state.epoch % interval == 0 else None
+
+        inputs: list[Optional[PlayerInput]] = [*self.pending] if self.pending else [None]
+        last = len(inputs) - 1
+        for index, player_input in enumerate(inputs):
+            record = ReplayRecord(player_input, index == last, tick_hash if index == last else None)
+            self.last_target = record.write(self.file, self.last_target)
+        self.pending.clear()
+        self.ticks += 1
+
+    def close(self) -> None:
+        self.file.close()
@@ -0,0 +1,16 @@
+from typing import NamedTuple, Optional
+
+
+class ReplayResult(NamedTuple):
+    level: str
+    outcome: str
+    ticks: int
+    elapsed: float
+    hashes_checked: int
+    divergence_epoch: Optional[int]
+
+    @property
+    def ticks_per_second(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return self.ticks / self.elapsed
@@ -0,0 +1,25 @@
+import hashlib
+import sys
+from array import array
+
+from pybattletank.state.game_state import GameState
+
+from .replay_record import HASH_SIZE
+
+
+def state_hash(state: GameState) -> bytes:
+    values = array("d", (state.epoch, len(state.units), len(state.bullets)))
+    for unit in state.units:
+        values.extend((
+            unit.position[0],
+            unit.position[1],
+            unit.alive,
+            unit.weapon_target[0],
+            unit.weapon_target[1],
+            unit.last_bullet_epoch,
+        ))
+    for bullet in state.bullets:
+        values.extend((bullet.position[0], bullet.position[1], bullet.end_position[0], bullet.end_position[1]))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return hashlib.blake2b(values.tobytes(), digest_size=HASH_SIZE).digest()
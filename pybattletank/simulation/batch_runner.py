@@ -0,0 +1,81 @@
+import csv
+import json
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
+
+from .level_summary import LevelSummary
+from .match_job import MatchJob
+from .match_result import MatchResult
+
+
+class BatchRunner:
+    def __init__(
+        self,
+        policy: str,
+        seeds: Iterable[int],
+        max_ticks: int,
+        bullet_engine: str = "python",
+        workers: Optional[int] = None,
+        level_cache_dir: Optional[str] = None,
+    ) -> None:
+        self.policy = policy
+        self.seeds = list(seeds)
+        self.max_ticks = max_ticks
+        self.bullet_engine = bullet_engine
+        self.workers = workers or os.cpu_count() or 1
+        self.level_cache_dir = level_cache_dir
+
+    def jobs(self, levels: list[dict[str, Any]]) -> list[MatchJob]:
+        return [
+            MatchJob(
+                level["name"],
+                str(level["path"]),
+                self.policy,
+                seed,
+                self.max_ticks,
+                self.bullet_engine,
+                self.level_cache_dir,
+            )
+            for level in levels
+            for seed in self.seeds
+        ]
+
+    def run(self, levels: list[dict[str, Any]]) -> list[MatchResult]:
+        jobs = self.jobs(levels)
+        if self.workers == 1 or len(jobs) <= 1:
+            return [job.run() for job in jobs]
+        chunksize = max(1, len(jobs) // (self.workers * 4))
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(MatchJob.run, jobs, chunksize=chunksize))
+
+    @staticmethod
+    def summarize(matches: list[MatchResult]) -> list[LevelSummary]:
+        levels: dict[str, list[MatchResult]] = {}
+        for match in matches:
+            levels.setdefault(match.level, []).append(match)
+        return [LevelSummary.from_matches(level, level_matches) for level, level_matches in levels.items()]
+
+    @staticmethod
+    def write_csv(filename: str, matches: list[MatchResult]) -> None:
+        with open(filename, "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(MatchResult._fields)
+            writer.writerows(matches)
+
+    def write_json(self, filename: str, matches: list[MatchResult]) -> None:
+        report = {
+            "policy": self.policy,
+            "seeds": self.seeds,
+            "max_ticks": self.max_ticks,
+            "bullet_engine": self.bullet_engine,
+            "levels": [
+                {**summary._asdict(), "win_rate": summary.win_rate, "loss_rate": summary.loss_rate}
+                for summary in self.summarize(matches)
+            ],
+            "matches": [match._asdict() for match in matches],
+        }
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
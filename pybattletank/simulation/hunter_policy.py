@@ -0,0 +1,44 @@
+import random
+from typing import Optional
+
+from pybattletank.linalg.vector import vector_dist
+from pybattletank.modes.player_input import PlayerInput
+from pybattletank.state.game_state import GameState
+from pybattletank.state.unit import Unit
+
+from .input_policy import InputPolicy
+
+
+class HunterPolicy(InputPolicy):
+    moves = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+    def __init__(self, seed: int = 0, move_interval: int = 15) -> None:
+        self.random = random.Random(seed)
+        self.move_interval = move_interval
+        self.last_position: Optional[tuple[int, int]] = None
+
+    def find_target(self, state: GameState, unit: Unit) -> Optional[Unit]:
+        enemies = state.nearest_units(unit.position, 1, exclude=unit)
+        if len(enemies) == 0:
+            return None
+        return enemies[0]
+
+    def next_input(self, state: GameState, unit: Unit) -> PlayerInput:
+        enemy = self.find_target(state, unit)
+        if enemy is None:
+            return PlayerInput(target=unit.weapon_target)
+
+        target = (float(enemy.position[0]), float(enemy.position[1]))
+        if vector_dist(enemy.position, unit.position) <= state.bullet_range:
+            return PlayerInput(target=target, fire=True)
+
+        move = (0, 0)
+        if state.epoch % self.move_interval == 0:
+            if self.last_position == unit.position:
+                move = self.random.choice(self.moves)
+            else:
+                dx = enemy.position[0] - unit.position[0]
+                dy = enemy.position[1] - unit.position[1]
+                move = ((dx > 0) - (dx < 0), 0) if abs(dx) >= abs(dy) else (0, (dy > 0) - (dy < 0))
+            self.last_position = unit.position
+        return PlayerInput(move, target)
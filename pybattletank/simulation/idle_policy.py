@@ -0,0 +1,10 @@
+from pybattletank.modes.player_input import PlayerInput
+from pybattletank.state.game_state import GameState
+from pybattletank.state.unit import Unit
+
+from .input_policy import InputPolicy
+
+
+class IdlePolicy(InputPolicy):
+    def next_input(self, state: GameState, unit: Unit) -> PlayerInput:
+        return PlayerInput(target=unit.weapon_target)
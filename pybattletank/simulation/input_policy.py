@@ -0,0 +1,17 @@
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pybattletank.modes.player_input import PlayerInput
+    from pybattletank.state.game_state import GameState
+    from pybattletank.state.unit import Unit
+
+
+class InputPolicyError(ValueError):
+    def __init__(self, message: str, *args: Any) -> None:
+        self.message = message.format(*args)
+        super().__init__(self.message)
+
+
+class InputPolicy:
+    def next_input(self, state: "GameState", unit: "Unit") -> "PlayerInput":
+        raise NotImplementedError()
@@ -0,0 +1,37 @@
+from typing import NamedTuple
+
+from .match_result import MatchResult
+
+
+class LevelSummary(NamedTuple):
+    level: str
+    matches: int
+    wins: int
+    losses: int
+    timeouts: int
+    errors: int
+    mean_ticks: float
+    mean_elapsed: float
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.matches if self.matches > 0 else 0.0
+
+    @property
+    def loss_rate(self) -> float:
+        return self.losses / self.matches if self.matches > 0 else 0.0
+
+    @classmethod
+    def from_matches(cls, level: str, matches: list[MatchResult]) -> "LevelSummary":
+        count = len(matches)
+        outcomes = [match.outcome for match in matches]
+        return cls(
+            level,
+            count,
+            outcomes.count("won"),
+            outcomes.count("lost"),
+            outcomes.count("timeout"),
+            outcomes.count("error"),
+            sum(match.ticks for match in matches) / count if count > 0 else 0.0,
+            sum(match.elapsed for match in matches) / count if count > 0 else 0.0,
+        )
@@ -0,0 +1,30 @@
+import time
+from typing import NamedTuple, Optional
+
+from pybattletank.state.level_cache import LevelCache
+
+from .match_result import MatchResult
+from .policies import create_policy
+from .simulator import Simulator
+
+
+class MatchJob(NamedTuple):
+    level: str
+    path: str
+    policy: str
+    seed: int
+    max_ticks: int
+    bullet_engine: str = "python"
+    level_cache_dir: Optional[str] = None
+
+    def run(self) -> MatchResult:
+        start = time.perf_counter()
+        policy = create_policy(self.policy, self.seed)
+        level_cache = LevelCache(self.level_cache_dir) if self.level_cache_dir else None
+        try:
+            result = Simulator(self.path, policy, self.max_ticks, self.bullet_engine, level_cache).run()
+        except Exception as error:
+            total_elapsed = time.perf_counter() - start
+            return MatchResult(self.level, self.seed, "error", 0, 0.0, total_elapsed, str(error))
+        total_elapsed = time.perf_counter() - start
+        return MatchResult(self.level, self.seed, result.outcome, result.ticks, result.elapsed, total_elapsed)
@@ -0,0 +1,11 @@
+from typing import NamedTuple
+
+
+class MatchResult(NamedTuple):
+    level: str
+    seed: int
+    outcome: str
+    ticks: int
+    elapsed: float
+    total_elapsed: float
+    error: str = ""
@@ -0,0 +1,20 @@
+from .input_policy import InputPolicy, InputPolicyError
+
+POLICY_NAMES = ("idle", "random", "hunter")
+
+
+def create_policy(name: str, seed: int = 0) -> InputPolicy:
+    if name == "idle":
+        from .idle_policy import IdlePolicy
+
+        return IdlePolicy()
+    if name == "random":
+        from .random_policy import RandomPolicy
+
+        return RandomPolicy(seed)
+    if name == "hunter":
+        from .hunter_policy import HunterPolicy
+
+        return HunterPolicy(seed)
+    msg = "Unknown policy {}"
+    raise InputPolicyError(msg, name)
@@ -0,0 +1,28 @@
+import random
+
+from pybattletank.modes.player_input import PlayerInput
+from pybattletank.state.game_state import GameState
+from pybattletank.state.unit import Unit
+
+from .input_policy import InputPolicy
+
+
+class RandomPolicy(InputPolicy):
+    moves = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+    def __init__(self, seed: int = 0, move_interval: int = 15, fire_probability: float = 0.05) -> None:
+        self.random = random.Random(seed)
+        self.move_interval = move_interval
+        self.fire_probability = fire_probability
+        self.target = (0.0, 0.0)
+
+    def next_input(self, state: GameState, unit: Unit) -> PlayerInput:
+        move = (0, 0)
+        if state.epoch % self.move_interval == 0:
+            move = self.random.choice(self.moves)
+            self.target = (
+                self.random.uniform(0, state.world_size[0] - 1),
+                self.random.uniform(0, state.world_size[1] - 1),
+            )
+        fire = self.random.random() < self.fire_probability
+        return PlayerInput(move, self.target, fire)
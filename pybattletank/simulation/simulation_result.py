@@ -0,0 +1,14 @@
+from typing import NamedTuple
+
+
+class SimulationResult(NamedTuple):
+    level: str
+    outcome: str
+    ticks: int
+    elapsed: float
+
+    @property
+    def ticks_per_second(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return self.ticks / self.elapsed
@@ -0,0 +1,61 @@
+import os
+import time
+from typing import Optional
+
+from pybattletank.modes.game_mode_observer import IGameModeObserver
+from pybattletank.modes.play_game_mode import PlayGameMode
+from pybattletank.replay.replay_recorder import ReplayRecorder
+from pybattletank.state.level_cache import LevelCache
+from pybattletank.state.level_loader import LevelLoader
+
+from .input_policy import InputPolicy
+from .simulation_result import SimulationResult
+
+
+class Simulator(IGameModeObserver):
+    def __init__(
+        self,
+        filename: str,
+        policy: InputPolicy,
+        max_ticks: int,
+        bullet_engine: str = "python",
+        level_cache: Optional[LevelCache] = None,
+        recorder: Optional[ReplayRecorder] = None,
+    ) -> None:
+        self.filename = filename
+        self.policy = policy
+        self.max_ticks = max_ticks
+        self.bullet_engine = bullet_engine
+        self.level_cache = level_cache
+        self.recorder = recorder
+        self.outcome: Optional[str] = None
+
+    def game_won(self) -> None:
+        self.outcome = "won"
+
+    def game_lost(self) -> None:
+        self.outcome = "lost"
+
+    def run(self) -> SimulationResult:
+        loader = LevelLoader(self.filename, self.level_cache)
+        loader.run()
+
+        mode = PlayGameMode(self.bullet_engine)
+        mode.add_observer(self)
+        mode.load_state(loader.state)
+        mode.recorder = self.recorder
+        state = mode.game_state
+        player_unit = mode.player_unit
+        policy = self.policy
+
+        self.outcome = None
+        ticks = 0
+        start = time.perf_counter()
+        while ticks < self.max_ticks and self.outcome is None:
+            mode.apply_input(policy.next_input(state, player_unit))
+            mode.update()
+            ticks += 1
+        elapsed = time.perf_counter() - start
+
+        name = os.path.splitext(os.path.basename(self.filename))[0]
+        return SimulationResult(name, self.outcome or "timeout", ticks, elapsed)
@@ -3,6 +3,8 @@ from .unit import Unit
 
 
 class Bullet(GameItem):
+    __slots__ = ("end_position", "start_position", "unit")
+
     def __init__(self, unit: Unit) -> None:
         super().__init__(unit.position, (2, 1))
         self.unit = unit
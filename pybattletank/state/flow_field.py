@@ -0,0 +1,72 @@
+from typing import Optional
+
+from .game_state import GameState
+
+MOVES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+UNREACHED = -1
+BLOCKED = -2
+
+
+class FlowField:
+    def __init__(self, state: GameState) -> None:
+        self.state = state
+        self.target: Optional[tuple[int, int]] = None
+        self.blank = [BLOCKED if wall else UNREACHED for wall in state.wall_mask]
+        self.distances: list[int] = []
+        self.computations = 0
+
+    def update(self, target: tuple[int, int]) -> bool:
+        if target == self.target:
+            return False
+        self.compute(target)
+        return True
+
+    def compute(self, target: tuple[int, int]) -> None:
+        width = self.state.world_size[0]
+        size = len(self.blank)
+        last_column = width - 1
+        distances = self.blank.copy()
+        start = target[1] * width + target[0]
+        distances[start] = 0
+        frontier = [start]
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier: list[int] = []
+            append = next_frontier.append
+            for cell in frontier:
+                x = cell % width
+                if x > 0 and distances[cell - 1] == UNREACHED:
+                    distances[cell - 1] = distance
+                    append(cell - 1)
+                if x < last_column and distances[cell + 1] == UNREACHED:
+                    distances[cell + 1] = distance
+                    append(cell + 1)
+                if cell >= width and distances[cell - width] == UNREACHED:
+                    distances[cell - width] = distance
+                    append(cell - width)
+                if cell + width < size and distances[cell + width] == UNREACHED:
+                    distances[cell + width] = distance
+                    append(cell + width)
+            frontier = next_frontier
+        self.target = target
+        self.distances = distances
+        self.computations += 1
+
+    def distance(self, position: tuple[int, int]) -> int:
+        if self.target is None:
+            return UNREACHED
+        return max(self.distances[position[1] * self.state.world_size[0] + position[0]], UNREACHED)
+
+    def moves(self, position: tuple[int, int]) -> list[tuple[int, int]]:
+        distance = self.distance(position)
+        if distance <= 0:
+            return []
+        width, height = self.state.world_size
+        x, y = position
+        moves = []
+        for dx, dy in MOVES:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and self.distances[ny * width + nx] == distance - 1:
+                moves.append((dx, dy))
+        return moves
@@ -1,6 +1,9 @@
 class GameItem:
+    __slots__ = ("alive", "orientation", "position", "previous_position", "tile")
+
     def __init__(self, position: tuple[int, int], tile: tuple[int, int]) -> None:
         self.alive = True
         self.position = position
+        self.previous_position = position
         self.tile = tile
         self.orientation = 0.0
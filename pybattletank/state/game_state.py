@@ -1,21 +1,44 @@
-from typing import Optional
+import math
+import struct
+import sys
+from array import array
+from typing import Any, Optional
 
 from .bullet import Bullet
 from .game_state_observer import IGameStateObserver
+from .raycast_hit import RaycastHit
 from .unit import Unit
 
+SNAPSHOT_HEADER = struct.Struct("<qII")
+UNIT_FIELDS = 9
+BULLET_FIELDS = 9
+
+
+class SnapshotError(ValueError):
+    def __init__(self, message: str, *args: Any) -> None:
+        self.message = message.format(*args)
+        super().__init__(self.message)
+
 
 class GameState:
     def __init__(self) -> None:
         self.world_size = (1, 1)
         self.ground: list[list[Optional[tuple[int, int]]]] = []
         self.walls: list[list[Optional[tuple[int, int]]]] = []
+        self.wall_mask = bytearray(1)
+        self.occupancy: list[list[Optional[Unit]]] = []
+        self.stacked_units: list[Unit] = []
         self.units: list[Unit] = []
+        self.unit_order: dict[Unit, int] = {}
+        self.moved_units: list[Unit] = []
         self.bullets: list[Bullet] = []
         self.bullet_speed = 0.1
         self.bullet_range = 4
+        self.targeting_range = 8
         self.bullet_delay = 10
+        self.tank_move_delay = 20
         self.epoch = 0
+        self.collision_candidates = 0
         self.observers: list[IGameStateObserver] = []
 
     def is_inside(self, position: tuple[float, float]) -> bool:
@@ -26,11 +49,64 @@ class GameState:
             and position[1] < self.world_size[1]
         )
 
-    def find_unit(self, position: tuple[float, float]) -> Optional[Unit]:
+    def is_wall(self, position: tuple[int, int]) -> bool:
+        return self.wall_mask[position[1] * self.world_size[0] + position[0]] != 0
+
+    def build_wall_mask(self) -> None:
+        width, height = self.world_size
+        self.wall_mask = bytearray(width * height)
+        for y, row in enumerate(self.walls[:height]):
+            for x, tile in enumerate(row[:width]):
+                if tile is not None:
+                    self.wall_mask[y * width + x] = 1
+
+    def build_occupancy(self) -> None:
+        self.build_wall_mask()
+        width, height = self.world_size
+        self.occupancy = [[None for _ in range(width)] for _ in range(height)]
+        self.stacked_units = []
+        self.unit_order = {unit: index for index, unit in enumerate(self.units)}
         for unit in self.units:
-            if int(unit.position[0]) == int(position[0]) and int(unit.position[1]) == int(position[1]):
-                return unit
-        return None
+            self.place_unit(unit)
+
+    def place_unit(self, unit: Unit) -> None:
+        x, y = unit.position
+        if self.occupancy[y][x] is None:
+            self.occupancy[y][x] = unit
+        else:
+            self.stacked_units.append(unit)
+
+    def unplace_unit(self, unit: Unit) -> None:
+        x, y = unit.position
+        if self.occupancy[y][x] is not unit:
+            if unit in self.stacked_units:
+                self.stacked_units.remove(unit)
+            return
+        self.occupancy[y][x] = None
+        for index, other in enumerate(self.stacked_units):
+            if other.position == unit.position:
+                self.occupancy[y][x] = self.stacked_units.pop(index)
+                break
+
+    def move_unit(self, unit: Unit, position: tuple[int, int]) -> None:
+        self.unplace_unit(unit)
+        unit.previous_position = unit.position
+        unit.position = position
+        self.place_unit(unit)
+        self.moved_units.append(unit)
+
+    def settle_moved_units(self) -> None:
+        for unit in self.moved_units:
+            unit.previous_position = unit.position
+        self.moved_units.clear()
+
+    def find_unit(self, position: tuple[float, float]) -> Optional[Unit]:
+        x, y = int(position[0]), int(position[1])
+        if x < 0 or x >= self.world_size[0] or y < 0 or y >= self.world_size[1]:
+            return None
+        if y >= len(self.occupancy):
+            return None
+        return self.occupancy[y][x]
 
     def find_live_unit(self, position: tuple[float, float]) -> Optional[Unit]:
         unit = self.find_unit(position)
@@ -38,9 +114,234 @@ class GameState:
             return None
         return unit
 
+    def units_in_box(self, min_cell: tuple[int, int], max_cell: tuple[int, int]) -> list[Unit]:
+        width, height = self.world_size
+        min_x, min_y = max(min_cell[0], 0), max(min_cell[1], 0)
+        max_x, max_y = min(max_cell[0], width - 1), min(max_cell[1], height - 1)
+        if min_x > max_x or min_y > max_y:
+            return []
+
+        def is_inside_box(unit: Unit) -> bool:
+            x, y = unit.position
+            return min_x <= x <= max_x and min_y <= y <= max_y
+
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self.units):
+            return [unit for unit in self.units if is_inside_box(unit)]
+        units = [
+            unit for row in self.occupancy[min_y : max_y + 1] for unit in row[min_x : max_x + 1] if unit is not None
+        ]
+        units.extend(unit for unit in self.stacked_units if is_inside_box(unit))
+        units.sort(key=self.unit_order.__getitem__)
+        return units
+
+    def units_in_range(self, position: tuple[float, float], radius: float, alive_only: bool = True) -> list[Unit]:
+        x, y = position
+        candidates = self.units_in_box(
+            (math.ceil(x - radius), math.ceil(y - radius)), (math.floor(x + radius), math.floor(y + radius))
+        )
+        max_distance = radius * radius
+        found = []
+        for unit in candidates:
+            if alive_only and not unit.alive:
+                continue
+            dx = unit.position[0] - x
+            dy = unit.position[1] - y
+            if dx * dx + dy * dy <= max_distance:
+                found.append(unit)
+        return found
+
+    def nearest_units(
+        self,
+        position: tuple[float, float],
+        count: int,
+        alive_only: bool = True,
+        exclude: Optional[Unit] = None,
+    ) -> list[Unit]:
+        x, y = position
+        max_radius = math.hypot(*self.world_size)
+        radius = 1.0
+        while True:
+            found = [unit for unit in self.units_in_range(position, radius, alive_only) if unit is not exclude]
+            if len(found) >= count or radius >= max_radius:
+                break
+            radius *= 2
+
+        def distance(unit: Unit) -> tuple[float, int]:
+            dx = unit.position[0] - x
+            dy = unit.position[1] - y
+            return dx * dx + dy * dy, self.unit_order[unit]
+
+        found.sort(key=distance)
+        return found[:count]
+
+    def raycast(
+        self,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        ignore: Optional[Unit] = None,
+        units: bool = True,
+    ) -> Optional[RaycastHit]:
+        width, height = self.world_size
+        start_x, start_y = start
+        dx = end[0] - start_x
+        dy = end[1] - start_y
+        origin_x = start_x + 0.5
+        origin_y = start_y + 0.5
+        cell_x = math.floor(origin_x)
+        cell_y = math.floor(origin_y)
+        end_cell = (math.floor(end[0] + 0.5), math.floor(end[1] + 0.5))
+
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        delta_x = abs(1 / dx) if dx != 0 else math.inf
+        delta_y = abs(1 / dy) if dy != 0 else math.inf
+        if dx > 0:
+            next_x = (cell_x + 1 - origin_x) / dx
+        elif dx < 0:
+            next_x = (cell_x - origin_x) / dx
+        else:
+            next_x = math.inf
+        if dy > 0:
+            next_y = (cell_y + 1 - origin_y) / dy
+        elif dy < 0:
+            next_y = (cell_y - origin_y) / dy
+        else:
+            next_y = math.inf
+
+        wall_mask = self.wall_mask
+        occupancy = self.occupancy
+        distance = 0.0
+        while 0 <= cell_x < width and 0 <= cell_y < height:
+            unit = occupancy[cell_y][cell_x] if units else None
+            if wall_mask[cell_y * width + cell_x] or (unit is not None and unit.alive and unit is not ignore):
+                position = (start_x + dx * distance, start_y + dy * distance)
+                return RaycastHit(position, (cell_x, cell_y), None if wall_mask[cell_y * width + cell_x] else unit)
+            if (cell_x, cell_y) == end_cell:
+                break
+            if next_x < next_y:
+                distance = next_x
+                next_x += delta_x
+                cell_x += step_x
+            else:
+                distance = next_y
+                next_y += delta_y
+                cell_y += step_y
+            if distance > 1:
+                break
+        return None
+
+    def can_see(self, unit: Unit, target: Unit) -> bool:
+        hit = self.raycast(unit.position, target.position, ignore=unit)
+        return hit is not None and hit.unit is target
+
+    def is_ready_to_fire(self, unit: Unit) -> bool:
+        return unit.alive and self.epoch - unit.last_bullet_epoch >= self.bullet_delay
+
+    def fire_bullet(self, unit: Unit) -> None:
+        if not self.is_ready_to_fire(unit):
+            return
+
+        unit.last_bullet_epoch = self.epoch
+        bullet = Bullet(unit)
+        start_x, start_y = bullet.start_position
+        end_x, end_y = bullet.end_position
+        length = math.hypot(end_x - start_x, end_y - start_y)
+        if length > self.bullet_range:
+            scale = self.bullet_range / length
+            end_x = start_x + (end_x - start_x) * scale
+            end_y = start_y + (end_y - start_y) * scale
+        hit = self.raycast(bullet.start_position, (end_x, end_y), units=False)
+        if hit is not None:
+            bullet.end_position = hit.position
+        self.bullets.append(bullet)
+        self.notify_bullet_fired(unit)
+
+    def snapshot(self) -> bytes:
+        values = array("d")
+        for unit in self.units:
+            values.extend((
+                unit.position[0],
+                unit.position[1],
+                unit.previous_position[0],
+                unit.previous_position[1],
+                unit.weapon_target[0],
+                unit.weapon_target[1],
+                unit.last_bullet_epoch,
+                unit.alive,
+                unit.orientation,
+            ))
+        index = {id(unit): number for number, unit in enumerate(self.units)}
+        for bullet in self.bullets:
+            values.extend((
+                index[id(bullet.unit)],
+                bullet.position[0],
+                bullet.position[1],
+                bullet.previous_position[0],
+                bullet.previous_position[1],
+                bullet.start_position[0],
+                bullet.start_position[1],
+                bullet.end_position[0],
+                bullet.end_position[1],
+            ))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return SNAPSHOT_HEADER.pack(self.epoch, len(self.units), len(self.bullets)) + values.tobytes()
+
+    def restore(self, snapshot: bytes) -> None:
+        epoch, units_count, bullets_count = SNAPSHOT_HEADER.unpack_from(snapshot)
+        if units_count != len(self.units):
+            msg = "Snapshot has {} units, expected {}"
+            raise SnapshotError(msg, units_count, len(self.units))
+        values = array("d")
+        values.frombytes(snapshot[SNAPSHOT_HEADER.size :])
+        if len(values) != units_count * UNIT_FIELDS + bullets_count * BULLET_FIELDS:
+            msg = "Invalid snapshot size"
+            raise SnapshotError(msg)
+        if sys.byteorder == "big":
+            values.byteswap()
+
+        occupancy = self.occupancy
+        for unit in self.units:
+            cell_x, cell_y = unit.position
+            if occupancy[cell_y][cell_x] is unit:
+                occupancy[cell_y][cell_x] = None
+        self.stacked_units.clear()
+        offset = 0
+        for unit in self.units:
+            x, y, previous_x, previous_y, target_x, target_y, last_bullet_epoch, alive, orientation = values[
+                offset : offset + UNIT_FIELDS
+            ]
+            offset += UNIT_FIELDS
+            unit.position = (int(x), int(y))
+            unit.previous_position = (int(previous_x), int(previous_y))
+            unit.weapon_target = (target_x, target_y)
+            unit.last_bullet_epoch = int(last_bullet_epoch)
+            unit.alive = bool(alive)
+            unit.orientation = orientation
+            self.place_unit(unit)
+
+        bullets = []
+        for _ in range(bullets_count):
+            owner, x, y, previous_x, previous_y, start_x, start_y, end_x, end_y = values[
+                offset : offset + BULLET_FIELDS
+            ]
+            offset += BULLET_FIELDS
+            bullet = Bullet(self.units[int(owner)])
+            bullet.position = (x, y)  # type: ignore[assignment]
+            bullet.previous_position = (previous_x, previous_y)  # type: ignore[assignment]
+            bullet.start_position = (start_x, start_y)  # type: ignore[assignment]
+            bullet.end_position = (end_x, end_y)
+            bullets.append(bullet)
+        self.bullets[:] = bullets
+        self.moved_units[:] = [unit for unit in self.units if unit.previous_position != unit.position]
+        self.epoch = epoch
+
     def add_observer(self, observer: IGameStateObserver) -> None:
         self.observers.append(observer)
 
+    def remove_observer(self, observer: IGameStateObserver) -> None:
+        self.observers.remove(observer)
+
     def notify_unit_destroyed(self, unit: Unit) -> None:
         for observer in self.observers:
             observer.unit_destroyed(unit)
@@ -0,0 +1,204 @@
+import hashlib
+import os
+import pathlib
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Optional, Union
+
+from .game_state import GameState
+from .unit import Unit
+
+if TYPE_CHECKING:
+    from .level_loader import LevelLoader
+
+Grid = list[list[Optional[tuple[int, int]]]]
+
+HEADER = struct.Struct("<4sHqq32s")
+DIMENSIONS = struct.Struct("<IIHHII")
+LENGTH = struct.Struct("<H")
+
+
+class LevelCache:
+    magic = b"PBTL"
+    version = 1
+
+    def __init__(self, directory: Union[str, os.PathLike]) -> None:
+        self.directory = pathlib.Path(directory)
+
+    @staticmethod
+    def default_directory() -> pathlib.Path:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return pathlib.Path(cache_home) / "pybattletank" / "levels"
+
+    def cache_path(self, filename: str) -> pathlib.Path:
+        key = hashlib.sha256(os.path.abspath(filename).encode("utf-8")).hexdigest()
+        return self.directory / f"{key[:32]}.pbl"
+
+    def read(self, loader: "LevelLoader") -> bool:
+        path = self.cache_path(loader.filename)
+        try:
+            stat = os.stat(loader.filename)
+            with open(path, "rb") as file:
+                data = file.read()
+            magic, version, mtime_ns, size, digest = HEADER.unpack_from(data)
+            if magic != self.magic or version != self.version:
+                return False
+            if mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+                if size != stat.st_size or digest != self.digest(loader.filename):
+                    return False
+                self.refresh(path, HEADER.pack(magic, version, stat.st_mtime_ns, size, digest) + data[HEADER.size :])
+            self.decode(loader, memoryview(data)[HEADER.size :])
+        except (OSError, ValueError, struct.error, IndexError):
+            return False
+        return True
+
+    def write(self, loader: "LevelLoader") -> None:
+        try:
+            stat = os.stat(loader.filename)
+            header = HEADER.pack(self.magic, self.version, stat.st_mtime_ns, stat.st_size, self.digest(loader.filename))
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.write_file(self.cache_path(loader.filename), header + self.encode(loader))
+        except OSError:
+            return
+
+    def refresh(self, path: pathlib.Path, data: bytes) -> None:
+        try:
+            self.write_file(path, data)
+        except OSError:
+            return
+
+    @staticmethod
+    def digest(filename: str) -> bytes:
+        with open(filename, "rb") as file:
+            return hashlib.sha256(file.read()).digest()
+
+    @staticmethod
+    def write_file(path: pathlib.Path, data: bytes) -> None:
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def encode_string(value: str) -> bytes:
+        encoded = value.encode("utf-8")
+        return LENGTH.pack(len(encoded)) + encoded
+
+    @staticmethod
+    def encode_grid(grid: Grid) -> bytes:
+        palette: dict[tuple[int, int], int] = {}
+        indices = array("H")
+        for row in grid:
+            for tile in row:
+                if tile is None:
+                    indices.append(0)
+                    continue
+                if tile not in palette:
+                    palette[tile] = len(palette) + 1
+                indices.append(palette[tile])
+        tiles = array("h", [coord for tile in palette for coord in tile])
+        if sys.byteorder == "big":
+            tiles.byteswap()
+            indices.byteswap()
+        return LENGTH.pack(len(palette)) + tiles.tobytes() + indices.tobytes()
+
+    @staticmethod
+    def encode_units(units: list[Unit]) -> array:
+        values = array("i")
+        for unit in units:
+            values.extend((unit.position[0], unit.position[1], unit.tile[0], unit.tile[1]))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    def encode(self, loader: "LevelLoader") -> bytes:
+        state = loader.state
+        tanks = state.units[: loader.tanks_count]
+        towers = state.units[loader.tanks_count :]
+        parts = [
+            DIMENSIONS.pack(
+                state.world_size[0],
+                state.world_size[1],
+                loader.tile_size[0],
+                loader.tile_size[1],
+                len(tanks),
+                len(towers),
+            ),
+            self.encode_string(loader.ground_tileset),
+            self.encode_string(loader.walls_tileset),
+            self.encode_string(loader.units_tileset),
+            self.encode_string(loader.explosions_tileset),
+            self.encode_grid(state.ground),
+            self.encode_grid(state.walls),
+            self.encode_units(tanks).tobytes(),
+            self.encode_units(towers).tobytes(),
+        ]
+        return b"".join(parts)
+
+    def decode(self, loader: "LevelLoader", data: memoryview) -> None:
+        offset = 0
+
+        def read_string() -> str:
+            nonlocal offset
+            (length,) = LENGTH.unpack_from(data, offset)
+            offset += LENGTH.size
+            value = bytes(data[offset : offset + length]).decode("utf-8")
+            offset += length
+            return value
+
+        def read_array(typecode: str, count: int) -> array:
+            nonlocal offset
+            values = array(typecode)
+            values.frombytes(data[offset : offset + count * values.itemsize])
+            if len(values) != count:
+                raise ValueError
+            if sys.byteorder == "big":
+                values.byteswap()
+            offset += count * values.itemsize
+            return values
+
+        def read_grid(width: int, height: int) -> Grid:
+            nonlocal offset
+            (count,) = LENGTH.unpack_from(data, offset)
+            offset += LENGTH.size
+            coords = read_array("h", count * 2)
+            lookup = [None] + [(coords[2 * i], coords[2 * i + 1]) for i in range(count)]
+            indices = read_array("H", width * height)
+            return [list(map(lookup.__getitem__, indices[y * width : (y + 1) * width])) for y in range(height)]
+
+        def read_units(count: int) -> list[Unit]:
+            values = read_array("i", count * 4)
+            tiles: dict[tuple[int, int], tuple[int, int]] = {}
+            units = []
+            for i in range(0, len(values), 4):
+                tile = (values[i + 2], values[i + 3])
+                units.append(Unit((values[i], values[i + 1]), tiles.setdefault(tile, tile)))
+            return units
+
+        width, height, tile_width, tile_height, tanks_count, towers_count = DIMENSIONS.unpack_from(data, offset)
+        offset += DIMENSIONS.size
+        ground_tileset = read_string()
+        walls_tileset = read_string()
+        units_tileset = read_string()
+        explosions_tileset = read_string()
+        ground = read_grid(width, height)
+        walls = read_grid(width, height)
+        tanks = read_units(tanks_count)
+        for unit in tanks:
+            unit.mobile = True
+        towers = read_units(towers_count)
+
+        loader.state = state = GameState()
+        state.world_size = (width, height)
+        state.ground[:] = ground
+        state.walls[:] = walls
+        state.units = tanks + towers
+        state.build_occupancy()
+        loader.tile_size = (tile_width, tile_height)
+        loader.tanks_count = tanks_count
+        loader.ground_tileset = ground_tileset
+        loader.walls_tileset = walls_tileset
+        loader.units_tileset = units_tileset
+        loader.bullets_tileset = explosions_tileset
+        loader.explosions_tileset = explosions_tileset
@@ -4,6 +4,7 @@ from typing import Optional
 import tmx
 
 from .game_state import GameState
+from .level_cache import LevelCache
 from .unit import Unit
 
 
@@ -15,8 +16,11 @@ class LoadLevelError(RuntimeError):
 
 
 class LevelLoader:
-    def __init__(self, filename: str) -> None:
+    def __init__(self, filename: str, cache: Optional[LevelCache] = None) -> None:
         self.filename = filename
+        self.cache = cache
+        self.from_cache = False
+        self.progress = 0.0
         self.state = GameState()
 
     def decode_layer_header(self, tilemap: tmx.TileMap, layer: tmx.Layer) -> tmx.Tileset:
@@ -47,11 +51,23 @@ class LevelLoader:
 
         return tileset
 
+    def decode_tile(self, tileset: tmx.Tileset, gid: int, tiles: dict[int, tuple[int, int]]) -> tuple[int, int]:
+        tile = tiles.get(gid)
+        if tile is not None:
+            return tile
+        lid = gid - tileset.firstgid
+        if lid < 0 or lid >= tileset.tilecount:
+            raise LoadLevelError(self.filename, "invalid tile id")
+        tile = (lid % tileset.columns, lid // tileset.columns)
+        tiles[gid] = tile
+        return tile
+
     def decode_array_layer(
         self, tilemap: tmx.TileMap, layer: tmx.Layer
     ) -> tuple[tmx.Tileset, list[list[Optional[tuple[int, int]]]]]:
         tileset = self.decode_layer_header(tilemap, layer)
 
+        tiles: dict[int, tuple[int, int]] = {}
         array: list[list[Optional[tuple[int, int]]]] = [
             [None for _ in range(tilemap.width)] for _ in range(tilemap.height)
         ]
@@ -61,13 +77,7 @@ class LevelLoader:
                 tile = layer.tiles[x + y * tilemap.width]
                 if tile.gid == 0:
                     continue
-                lid = tile.gid - tileset.firstgid
-                if lid < 0 or lid >= tileset.tilecount:
-                    raise LoadLevelError(self.filename, "invalid tile id")
-
-                tile_x = lid % tileset.columns
-                tile_y = lid // tileset.columns
-                array[y][x] = (tile_x, tile_y)
+                array[y][x] = self.decode_tile(tileset, tile.gid, tiles)
 
         return tileset, array
 
@@ -76,6 +86,7 @@ class LevelLoader:
     ) -> tuple[tmx.Tileset, list[Unit]]:
         tileset = self.decode_layer_header(tilemap, layer)
 
+        tiles: dict[int, tuple[int, int]] = {}
         units = []
 
         for y in range(tilemap.height):
@@ -83,13 +94,7 @@ class LevelLoader:
                 tile = layer.tiles[x + y * tilemap.width]
                 if tile.gid == 0:
                     continue
-                lid = tile.gid - tileset.firstgid
-                if lid < 0 or lid >= tileset.tilecount:
-                    raise LoadLevelError(self.filename, "invalid tile id")
-
-                tile_x = lid % tileset.columns
-                tile_y = lid // tileset.columns
-                unit = Unit((x, y), (tile_x, tile_y))
+                unit = Unit((x, y), self.decode_tile(tileset, tile.gid, tiles))
                 units.append(unit)
 
         return tileset, units
@@ -98,7 +103,16 @@ class LevelLoader:
         if not os.path.exists(self.filename):
             raise LoadLevelError(self.filename, "file not exist")
 
+        self.from_cache = self.cache is not None and self.cache.read(self)
+        if not self.from_cache:
+            self.decode_tilemap()
+            if self.cache is not None:
+                self.cache.write(self)
+        self.progress = 1.0
+
+    def decode_tilemap(self) -> None:
         tilemap = tmx.TileMap.load(self.filename)
+        self.progress = 0.5
         if tilemap.orientation != "orthogonal":
             raise LoadLevelError(self.filename, "invalid orientation")
 
@@ -112,12 +126,14 @@ class LevelLoader:
         self.tile_size = tile_size = (tileset.tilewidth, tileset.tileheight)
         state.ground[:] = array
         self.ground_tileset = tileset.image.source
+        self.progress = 0.6
 
         tileset, array = self.decode_array_layer(tilemap, tilemap.layers[1])
         if tileset.tilewidth != tile_size[0] or tileset.tileheight != tile_size[1]:
             raise LoadLevelError(self.filename, "tile size must be consistent for all layers")
         state.walls[:] = array
         self.walls_tileset = tileset.image.source
+        self.progress = 0.7
 
         tanks_tileset, tanks = self.decode_units_layer(state, tilemap, tilemap.layers[2])
         towers_tileset, towers = self.decode_units_layer(state, tilemap, tilemap.layers[3])
@@ -125,8 +141,13 @@ class LevelLoader:
             raise LoadLevelError(self.filename, "tanks and towers tilesets must be the same")
         if tanks_tileset.tilewidth != tile_size[0] or tanks_tileset.tileheight != tile_size[1]:
             raise LoadLevelError(self.filename, "tile size must be consistent for all layers")
+        for unit in tanks:
+            unit.mobile = True
         state.units = tanks + towers
+        state.build_occupancy()
+        self.tanks_count = len(tanks)
         self.units_tileset = tanks_tileset.image.source
+        self.progress = 0.9
 
         tileset, array = self.decode_array_layer(tilemap, tilemap.layers[4])
         if tileset.tilewidth != tile_size[0] or tileset.tileheight != tile_size[1]:
@@ -0,0 +1,9 @@
+from typing import NamedTuple, Optional
+
+from .unit import Unit
+
+
+class RaycastHit(NamedTuple):
+    position: tuple[float, float]
+    cell: tuple[int, int]
+    unit: Optional[Unit]
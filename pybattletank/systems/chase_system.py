@@ -0,0 +1,28 @@
+from pybattletank.command.move_command import MoveCommand
+from pybattletank.state.flow_field import FlowField
+from pybattletank.state.game_state import GameState
+from pybattletank.state.unit import Unit
+
+from .system import System
+
+
+class ChaseSystem(System):
+    def __init__(self, player_unit: Unit, flow_field: FlowField) -> None:
+        self.player_unit = player_unit
+        self.flow_field = flow_field
+
+    def run(self, state: GameState) -> None:
+        if state.epoch % state.tank_move_delay != 0:
+            return
+        player_unit = self.player_unit
+        tanks = [unit for unit in state.units if unit.mobile and unit.alive and unit is not player_unit]
+        if len(tanks) == 0:
+            return
+        flow_field = self.flow_field
+        flow_field.update(player_unit.position)
+        for unit in tanks:
+            x, y = unit.position
+            for dx, dy in flow_field.moves(unit.position):
+                if state.find_unit((x + dx, y + dy)) is None:
+                    MoveCommand(state, unit, (dx, dy)).run()
+                    break
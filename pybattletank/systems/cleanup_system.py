@@ -0,0 +1,10 @@
+from pybattletank.state.game_state import GameState
+
+from .system import System
+
+
+class CleanupSystem(System):
+    def run(self, state: GameState) -> None:
+        bullets = state.bullets
+        if any(not bullet.alive for bullet in bullets):
+            bullets[:] = [bullet for bullet in bullets if bullet.alive]
@@ -0,0 +1,15 @@
+from pybattletank.state.game_state import GameState
+from pybattletank.state.unit import Unit
+
+from .system import System
+
+
+class FiringSystem(System):
+    def __init__(self, player_unit: Unit) -> None:
+        self.player_unit = player_unit
+
+    def run(self, state: GameState) -> None:
+        player_unit = self.player_unit
+        for unit in state.units_in_range(player_unit.position, state.bullet_range):
+            if unit is not player_unit and state.is_ready_to_fire(unit) and state.can_see(unit, player_unit):
+                state.fire_bullet(unit)
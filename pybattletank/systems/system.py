@@ -0,0 +1,6 @@
+from pybattletank.state.game_state import GameState
+
+
+class System:
+    def run(self, state: GameState) -> None:
+        raise NotImplementedError()
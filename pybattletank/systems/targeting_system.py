@@ -0,0 +1,16 @@
+from pybattletank.state.game_state import GameState
+from pybattletank.state.unit import Unit
+
+from .system import System
+
+
+class TargetingSystem(System):
+    def __init__(self, player_unit: Unit) -> None:
+        self.player_unit = player_unit
+
+    def run(self, state: GameState) -> None:
+        player_unit = self.player_unit
+        target = player_unit.position
+        for unit in state.units_in_range(target, state.targeting_range, alive_only=False):
+            if unit is not player_unit:
+                unit.weapon_target = target
@@ -0,0 +1,36 @@
+from typing import Any
+
+
+class FixedTimestepError(ValueError):
+    def __init__(self, message: str, *args: Any) -> None:
+        self.message = message.format(*args)
+        super().__init__(self.message)
+
+
+class FixedTimestep:
+    def __init__(self, rate: float = 60.0, max_ticks_per_frame: int = 5) -> None:
+        if rate <= 0:
+            msg = "Invalid simulation rate {}"
+            raise FixedTimestepError(msg, rate)
+        self.rate = rate
+        self.tick_duration = 1.0 / rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.accumulator = 0.0
+        self.dropped_ticks = 0
+
+    def reset(self) -> None:
+        self.accumulator = 0.0
+
+    def advance(self, elapsed: float) -> int:
+        self.accumulator += max(elapsed, 0.0)
+        ticks = int(self.accumulator / self.tick_duration)
+        if ticks > self.max_ticks_per_frame:
+            self.dropped_ticks += ticks - self.max_ticks_per_frame
+            ticks = self.max_ticks_per_frame
+            self.accumulator = ticks * self.tick_duration + self.accumulator % self.tick_duration
+        self.accumulator -= ticks * self.tick_duration
+        return ticks
+
+    @property
+    def alpha(self) -> float:
+        return min(self.accumulator / self.tick_duration, 1.0)
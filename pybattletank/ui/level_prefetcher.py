@@ -0,0 +1,67 @@
+import sys
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+from pybattletank.state.level_cache import LevelCache
+
+if TYPE_CHECKING:
+    from pybattletank.state.level_loader import LevelLoader
+
+
+class LevelLoad(NamedTuple):
+    loader: "LevelLoader"
+    future: "Future[None]"
+
+
+class LevelPrefetcher:
+    def __init__(
+        self,
+        level_cache: Optional[LevelCache] = None,
+        capacity: int = 2,
+        threaded: Optional[bool] = None,
+    ) -> None:
+        self.level_cache = level_cache
+        self.capacity = capacity
+        if threaded is None:
+            threaded = sys.platform != "emscripten"
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-loader") if threaded else None
+        self.loads: OrderedDict[str, LevelLoad] = OrderedDict()
+
+    def start(self, filename: str) -> LevelLoad:
+        from pybattletank.state.level_loader import LevelLoader
+
+        loader = LevelLoader(filename, self.level_cache)
+        if self.executor is not None:
+            return LevelLoad(loader, self.executor.submit(loader.run))
+
+        future: Future[None] = Future()
+        try:
+            loader.run()
+        except Exception as ex:
+            future.set_exception(ex)
+        else:
+            future.set_result(None)
+        return LevelLoad(loader, future)
+
+    def prefetch(self, filename: str) -> None:
+        if self.executor is None:
+            return
+        if filename in self.loads:
+            self.loads.move_to_end(filename)
+            return
+        self.loads[filename] = self.start(filename)
+        while len(self.loads) > self.capacity:
+            _, load = self.loads.popitem(last=False)
+            load.future.cancel()
+
+    def take(self, filename: str) -> LevelLoad:
+        load = self.loads.pop(filename, None)
+        if load is None or load.future.cancelled():
+            return self.start(filename)
+        return load
+
+    def shutdown(self) -> None:
+        self.loads.clear()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
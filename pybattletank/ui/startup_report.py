@@ -0,0 +1,24 @@
+import time
+from typing import Optional
+
+
+class StartupReport:
+    def __init__(self, started: Optional[float] = None) -> None:
+        self.started = started if started is not None else time.perf_counter()
+        self.last = self.started
+        self.phases: list[tuple[str, float]] = []
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    @property
+    def total(self) -> float:
+        return self.last - self.started
+
+    def format(self) -> str:
+        width = max((len(phase) for phase, _ in self.phases), default=0)
+        lines = [f"{phase:<{width}} {seconds * 1000:8.1f}ms" for phase, seconds in self.phases]
+        lines.append(f"{'total':<{width}} {self.total * 1000:8.1f}ms")
+        return "\n".join(lines)
@@ -1,33 +1,79 @@
 import asyncio
-from typing import Optional
+import datetime
+import math
+import os
+import time
+from typing import TYPE_CHECKING, Optional
 
 import pygame
 
 from pybattletank.finders.level_finder import LevelFinder
+from pybattletank.layers.asset_manager import AssetManager
 from pybattletank.layers.theme import Theme
+from pybattletank.layers.theme_assets import ThemeAssets
+from pybattletank.layers.theme_library import ThemeLibrary
 from pybattletank.locators.asset_locator import AssetLocator
 from pybattletank.modes.game_mode import GameMode
 from pybattletank.modes.game_mode_observer import IGameModeObserver
+from pybattletank.modes.loading_game_mode import LoadingGameMode
 from pybattletank.modes.main_menu_game_mode import MainMenuGameMode
 from pybattletank.modes.message_game_mode import MessageGameMode
-from pybattletank.modes.play_game_mode import PlayGameMode
 from pybattletank.modes.play_menu_game_mode import PlayMenuGameMode
 from pybattletank.modes.theme_menu_game_mode import ThemeMenuGameMode
+from pybattletank.replay.replay_header import ReplayHeader
+from pybattletank.replay.replay_recorder import ReplayRecorder
+from pybattletank.state.level_cache import LevelCache
+
+from .fixed_timestep import FixedTimestep
+from .level_prefetcher import LevelLoad, LevelPrefetcher
+from .startup_report import StartupReport
+
+if TYPE_CHECKING:
+    from pybattletank.modes.play_game_mode import PlayGameMode
 
 
 class UserInterface(IGameModeObserver):
-    def __init__(self, theme: Theme, locator: AssetLocator, level_finder: LevelFinder) -> None:
-        pygame.init()
+    def __init__(
+        self,
+        theme: Theme,
+        locator: AssetLocator,
+        level_finder: LevelFinder,
+        dirty_rendering: bool = False,
+        level_cache: Optional[LevelCache] = None,
+        sim_rate: float = 60.0,
+        frame_rate: int = 60,
+        record_dir: Optional[str] = None,
+        assets: Optional[AssetManager] = None,
+        startup_report: Optional[StartupReport] = None,
+    ) -> None:
+        pygame.display.init()
+        pygame.font.init()
+        self.startup_report = startup_report
+        self.assets = assets if assets is not None else AssetManager()
 
         self.theme = theme
         self.locator = locator
         self.level_finder = level_finder
+        self.level_cache = level_cache
+        self.record_dir = record_dir
+        self.recorder: Optional[ReplayRecorder] = None
+        self.prefetcher = LevelPrefetcher(level_cache)
+        self.pending_level: Optional[tuple[str, LevelLoad]] = None
         self.render_width = theme.default_window_width
         self.render_height = theme.default_window_height
         self.rescaled_x = 0
         self.rescaled_y = 0
         self.rescaled_scale_x = 1.0
         self.rescaled_scale_y = 1.0
+        self.rescaled_width = self.render_width
+        self.rescaled_height = self.render_height
+
+        self.dirty_rendering = dirty_rendering
+        self.max_dirty_rects = 64
+        self.redraw_all = True
+        self.render_surface: Optional[pygame.Surface] = None
+        self.dark_surface = pygame.Surface((0, 0))
+        self.window_size = (0, 0)
 
         self.window = pygame.display.set_mode(
             (self.render_width, self.render_height),
@@ -36,52 +82,117 @@ class UserInterface(IGameModeObserver):
 
         pygame.display.set_caption("pybattletank")
         icon_path = locator.locate("icon.png")
-        icon = pygame.image.load(icon_path)
+        icon = self.assets.image(icon_path)
         pygame.display.set_icon(icon)
+        if startup_report is not None:
+            startup_report.mark("display")
+        self.assets.warm_up_menus(theme)
+        if startup_report is not None:
+            startup_report.mark("menu assets")
+        self.themes = ThemeLibrary(locator, ThemeAssets(theme, self.assets), self.assets.cache.budget)
 
         self.play_game_mode: Optional[PlayGameMode] = None
-        self.overlay_game_mode: GameMode = MainMenuGameMode(theme)
+        self.overlay_game_mode: GameMode = MainMenuGameMode(theme, self.assets)
         self.overlay_game_mode.add_observer(self)
         self.active_mode = "Overlay"
 
-        if theme.start_music is not None:
-            pygame.mixer.music.load(theme.locate_resource(theme.start_music))
-            pygame.mixer.music.play(loops=-1)
-
         self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep(sim_rate)
+        self.last_time = time.perf_counter()
+        self.frame_rate = frame_rate
         self.running = True
 
+    def init_audio(self) -> bool:
+        if pygame.mixer.get_init() is None:
+            try:
+                pygame.mixer.init()
+            except pygame.error as ex:
+                print(ex)
+                return False
+        return True
+
+    def play_music(self, music: Optional[str]) -> None:
+        if music is None or not self.init_audio():
+            return
+        pygame.mixer.music.load(self.theme.locate_resource(music))
+        pygame.mixer.music.play(loops=-1)
+
+    def start_recording(self, play_game_mode: "PlayGameMode", filename: str) -> None:
+        self.stop_recording()
+        if self.record_dir is None:
+            return
+        level = os.path.splitext(os.path.basename(filename))[0]
+        timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        try:
+            os.makedirs(self.record_dir, exist_ok=True)
+            file = open(os.path.join(self.record_dir, f"{level}-{timestamp}.pbr"), "wb")  # noqa: SIM115
+        except OSError as ex:
+            print(ex)
+            return
+        self.recorder = ReplayRecorder(file, ReplayHeader.for_level(filename))
+        play_game_mode.recorder = self.recorder
+
+    def stop_recording(self) -> None:
+        if self.play_game_mode is not None:
+            self.play_game_mode.recorder = None
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
     def game_won(self) -> None:
+        self.stop_recording()
         self.show_message("Victory!")
-        if self.theme.victory_music is not None:
-            pygame.mixer.music.load(self.theme.locate_resource(self.theme.victory_music))
-            pygame.mixer.music.play(loops=-1)
+        self.play_music(self.theme.victory_music)
 
     def game_lost(self) -> None:
+        self.stop_recording()
         self.show_message("GAME OVER")
-        if self.theme.fail_music is not None:
-            pygame.mixer.music.load(self.theme.locate_resource(self.theme.fail_music))
-            pygame.mixer.music.play(loops=-1)
+        self.play_music(self.theme.fail_music)
 
     def load_level_requested(self, filename: str) -> None:
+        load = self.prefetcher.take(filename)
+        self.pending_level = (filename, load)
+        title = os.path.splitext(os.path.basename(filename))[0]
+        self.overlay_game_mode = LoadingGameMode(self.theme, title, load.loader, self.assets)
+        self.overlay_game_mode.add_observer(self)
+        self.active_mode = "Overlay"
+        self.redraw_all = True
+
+    def prefetch_level_requested(self, filename: str) -> None:
+        self.prefetcher.prefetch(filename)
+
+    def poll_pending_level(self) -> None:
+        if self.pending_level is None:
+            return
+        filename, load = self.pending_level
+        if not load.future.done():
+            return
+        self.pending_level = None
+
         if self.play_game_mode is None:
-            self.play_game_mode = PlayGameMode()
+            from pybattletank.modes.play_game_mode import PlayGameMode
+
+            self.init_audio()
+            self.play_game_mode = PlayGameMode(level_cache=self.level_cache, assets=self.assets)
             self.play_game_mode.add_observer(self)
 
         try:
-            self.play_game_mode.load_level(self.theme, filename)
+            load.future.result()
+            self.play_game_mode.load_level(self.theme, filename, load.loader.state)
+            self.start_recording(self.play_game_mode, filename)
             self.render_width = self.play_game_mode.render_width
             self.render_height = self.play_game_mode.render_height
             self.play_game_mode.update()
             self.active_mode = "Play"
+            self.redraw_all = True
+            self.reset_timestep()
         except Exception as ex:
             print(ex)
+            self.stop_recording()
             self.play_game_mode = None
             self.show_message("Level loading failed!")
 
-        if self.theme.play_music is not None:
-            pygame.mixer.music.load(self.theme.locate_resource(self.theme.play_music))
-            pygame.mixer.music.play(loops=-1)
+        self.play_music(self.theme.play_music)
 
     def get_mouse_pos(self) -> tuple[float, float]:
         mouse_pos = pygame.mouse.get_pos()
@@ -93,98 +204,226 @@ class UserInterface(IGameModeObserver):
         if self.play_game_mode is None:
             return
         self.active_mode = "Play"
+        self.redraw_all = True
+        self.reset_timestep()
 
     def show_menu_requested(self, menu_name: str) -> None:
+        self.pending_level = None
         if menu_name == "play":
-            self.overlay_game_mode = PlayMenuGameMode(self.theme, self.level_finder)
+            self.overlay_game_mode = PlayMenuGameMode(self.theme, self.level_finder, self.assets)
         elif menu_name == "theme":
-            self.overlay_game_mode = ThemeMenuGameMode(self.theme)
+            self.overlay_game_mode = ThemeMenuGameMode(self.theme, self.assets)
         else:
-            self.overlay_game_mode = MainMenuGameMode(self.theme)
+            self.overlay_game_mode = MainMenuGameMode(self.theme, self.assets)
 
         self.overlay_game_mode.add_observer(self)
         self.active_mode = "Overlay"
+        self.redraw_all = True
 
     def show_message(self, message: str) -> None:
-        self.overlay_game_mode = MessageGameMode(self.theme, message)
+        self.pending_level = None
+        self.overlay_game_mode = MessageGameMode(self.theme, message, self.assets)
         self.overlay_game_mode.add_observer(self)
         self.active_mode = "Overlay"
+        self.redraw_all = True
 
     def show_message_requested(self, message: str) -> None:
         self.show_message(message)
 
-        if self.theme.start_music is not None:
-            pygame.mixer.music.load(self.theme.locate_resource(self.theme.start_music))
-            pygame.mixer.music.play(loops=-1)
+        self.play_music(self.theme.start_music)
 
     def change_theme_requested(self, theme_file: str) -> None:
         try:
-            theme = Theme(self.locator, theme_file)
+            theme, assets = self.themes.get(theme_file)
         except Exception as ex:
             print(ex)
             self.show_message(str(ex))
             return
 
         self.theme = theme
-        self.render_width = theme.default_window_width
-        self.render_height = theme.default_window_height
-        self.play_game_mode = None
+        self.assets = assets
+        if self.play_game_mode is None:
+            self.render_width = theme.default_window_width
+            self.render_height = theme.default_window_height
+        else:
+            self.play_game_mode.set_theme(theme, assets)
+            self.render_width = self.play_game_mode.render_width
+            self.render_height = self.play_game_mode.render_height
         self.show_menu_requested("main")
 
+    def prefetch_theme_requested(self, theme_file: str) -> None:
+        self.themes.prefetch(theme_file)
+
     def quit_requested(self) -> None:
         self.running = False
 
-    def render(self) -> None:
-        render_width = self.render_width
-        render_height = self.render_height
-        render_surface = pygame.Surface((render_width, render_height))
-
-        if self.play_game_mode is not None:
-            self.play_game_mode.render(render_surface)
+    def compose(self, surface: pygame.Surface, region: Optional[pygame.Rect] = None) -> None:
+        if self.play_game_mode is None:
+            surface.fill(pygame.Color(0, 0, 0))
+        elif region is None:
+            self.play_game_mode.render(surface)
         else:
-            render_surface.fill(pygame.Color(0, 0, 0))
+            self.play_game_mode.render_region(surface, region)
 
         if self.active_mode == "Overlay":
-            dark_surface = pygame.Surface((render_width, render_height), flags=pygame.SRCALPHA)
-            dark_surface.fill(pygame.Color(0, 0, 0, 150))
-            render_surface.blit(dark_surface, (0, 0))
-            self.overlay_game_mode.render(render_surface)
-
+            surface.blit(self.dark_surface, (0, 0))
+            if region is None:
+                self.overlay_game_mode.render(surface)
+            else:
+                self.overlay_game_mode.render_region(surface, region)
+
+    def merge_rects(self, rects: list[pygame.Rect], bounds: pygame.Rect) -> list[pygame.Rect]:
+        merged: list[pygame.Rect] = []
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if rect.width == 0 or rect.height == 0:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+
+        area = sum(rect.width * rect.height for rect in merged)
+        if len(merged) > self.max_dirty_rects or area * 2 > bounds.width * bounds.height:
+            return [bounds]
+        return merged
+
+    def update_rescale(self) -> None:
+        render_width = self.render_width
+        render_height = self.render_height
         window_width, window_height = self.window.get_size()
         render_ratio = render_width / render_height
         window_ratio = window_width / window_height
         if window_ratio <= render_ratio:
-            rescaled_width = window_width
-            rescaled_height = int(window_width / render_ratio)
+            self.rescaled_width = window_width
+            self.rescaled_height = int(window_width / render_ratio)
             self.rescaled_x = 0
-            self.rescaled_y = (window_height - rescaled_height) // 2
+            self.rescaled_y = (window_height - self.rescaled_height) // 2
         else:
-            rescaled_width = int(window_height * render_ratio)
-            rescaled_height = window_height
-            self.rescaled_x = (window_width - rescaled_width) // 2
+            self.rescaled_width = int(window_height * render_ratio)
+            self.rescaled_height = window_height
+            self.rescaled_x = (window_width - self.rescaled_width) // 2
             self.rescaled_y = 0
+        self.rescaled_scale_x = self.rescaled_width / render_width
+        self.rescaled_scale_y = self.rescaled_height / render_height
+
+    def present(self, surface: pygame.Surface, rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        scale_x = self.rescaled_scale_x
+        scale_y = self.rescaled_scale_y
+        window_rects = []
+        for rect in rects:
+            left = math.floor(rect.left * scale_x)
+            top = math.floor(rect.top * scale_y)
+            right = min(math.ceil(rect.right * scale_x), self.rescaled_width)
+            bottom = min(math.ceil(rect.bottom * scale_y), self.rescaled_height)
+            if right <= left or bottom <= top:
+                continue
+            window_rect = pygame.Rect(self.rescaled_x + left, self.rescaled_y + top, right - left, bottom - top)
+            if window_rect.size == rect.size:
+                self.window.blit(surface, window_rect, rect)
+            else:
+                region_surface = pygame.transform.scale(surface.subsurface(rect), window_rect.size)
+                self.window.blit(region_surface, window_rect)
+            window_rects.append(window_rect)
+        return window_rects
 
-        rescaled_surface = pygame.transform.scale(render_surface, (rescaled_width, rescaled_height))
-        self.rescaled_scale_x = rescaled_surface.get_width() / render_surface.get_width()
-        self.rescaled_scale_y = rescaled_surface.get_height() / render_surface.get_height()
-        self.window.blit(rescaled_surface, (self.rescaled_x, self.rescaled_y))
+    def render(self) -> None:
+        render_size = (self.render_width, self.render_height)
+        if self.render_surface is None or self.render_surface.get_size() != render_size:
+            self.render_surface = pygame.Surface(render_size)
+            self.dark_surface = pygame.Surface(render_size, flags=pygame.SRCALPHA)
+            self.dark_surface.fill(pygame.Color(0, 0, 0, 150))
+            self.redraw_all = True
+        render_surface = self.render_surface
+
+        window_size = self.window.get_size()
+        if window_size != self.window_size:
+            self.window_size = window_size
+            self.redraw_all = True
+        self.update_rescale()
+
+        if not self.dirty_rendering:
+            self.compose(render_surface)
+            rescaled_surface = pygame.transform.scale(render_surface, (self.rescaled_width, self.rescaled_height))
+            self.window.blit(rescaled_surface, (self.rescaled_x, self.rescaled_y))
+            pygame.display.update()
+            return
 
-        pygame.display.update()
+        rects = []
+        if self.play_game_mode is not None:
+            rects.extend(self.play_game_mode.dirty_rects())
+        if self.active_mode == "Overlay":
+            rects.extend(self.overlay_game_mode.dirty_rects())
+
+        bounds = render_surface.get_rect()
+        if self.redraw_all:
+            self.window.fill(pygame.Color(0, 0, 0))
+            rects = [bounds]
+        else:
+            rects = self.merge_rects(rects, bounds)
+        if len(rects) == 0:
+            return
+
+        for rect in rects:
+            render_surface.set_clip(rect)
+            self.compose(render_surface, rect)
+        render_surface.set_clip(None)
+
+        window_rects = self.present(render_surface, rects)
+        if self.redraw_all:
+            self.redraw_all = False
+            pygame.display.update()
+        else:
+            pygame.display.update(window_rects)
+
+    def reset_timestep(self) -> None:
+        self.timestep.reset()
+        self.last_time = time.perf_counter()
+
+    def update_play(self, play_game_mode: "PlayGameMode", elapsed: float) -> None:
+        ticks = self.timestep.advance(elapsed)
+        try:
+            for _ in range(ticks):
+                play_game_mode.update()
+                if self.active_mode != "Play":
+                    return
+        except Exception as ex:
+            print(ex)
+            self.stop_recording()
+            self.play_game_mode = None
+            self.show_message("Error during game update...")
+            return
+        play_game_mode.set_interpolation(self.timestep.alpha)
 
     async def run(self) -> None:
+        self.last_time = time.perf_counter()
+        first_frame = True
         while self.running:
+            now = time.perf_counter()
+            elapsed = now - self.last_time
+            self.last_time = now
+
+            self.poll_pending_level()
+            self.themes.poll()
             mouse_x, mouse_y = self.get_mouse_pos()
             if self.active_mode == "Overlay":
                 self.overlay_game_mode.process_input(mouse_x, mouse_y)
                 self.overlay_game_mode.update()
             elif self.play_game_mode is not None:
                 self.play_game_mode.process_input(mouse_x, mouse_y)
-                try:
-                    self.play_game_mode.update()
-                except Exception as ex:
-                    print(ex)
-                    self.play_game_mode = None
-                    self.show_message("Error during game update...")
+                self.update_play(self.play_game_mode, elapsed)
             self.render()
-            self.clock.tick(60)
+            if first_frame:
+                first_frame = False
+                if self.startup_report is not None:
+                    self.startup_report.mark("first frame")
+                    print(self.startup_report.format())
+                self.assets.warm_up(self.theme)
+                if self.play_game_mode is None and self.pending_level is None:
+                    self.play_music(self.theme.start_music)
+            self.clock.tick(self.frame_rate)
             await asyncio.sleep(0)
+        self.prefetcher.shutdown()
+        self.themes.shutdown()
+        self.stop_recording()
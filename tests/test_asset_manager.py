@@ -0,0 +1,65 @@
+import pygame
+
+from pybattletank.layers.asset_manager import AssetManager
+from pybattletank.layers.theme import Theme
+from pybattletank.locators.packaged_asset_locator import PackagedAssetLocator
+from pybattletank.modes.main_menu_game_mode import MainMenuGameMode
+from pybattletank.modes.message_game_mode import MessageGameMode
+
+
+def test_assets_are_shared_by_path_and_parameters() -> None:
+    pygame.font.init()
+    theme = Theme(PackagedAssetLocator("pybattletank.assets"), "theme.json")
+    assets = AssetManager()
+    font = assets.font(theme.menu_font, 20)
+    assert assets.font(theme.menu_font, 20) is font
+    assert assets.font(theme.menu_font, 30) is not font
+    assert assets.image(theme.cursor_image) is assets.image(theme.cursor_image)
+    assert (assets.cache.hits, assets.cache.misses) == (2, 3)
+    assert assets.cache.hit_rate == 0.4
+
+
+def test_least_recently_used_assets_are_evicted() -> None:
+    assets = AssetManager(budget=30)
+
+    def load(name: str) -> str:
+        return assets.get(("text", name, None), lambda: name.upper(), lambda _: 10)
+
+    for name in ("a", "b", "c"):
+        load(name)
+    assert load("a") == "A"
+    load("d")
+    assert list(assets.cache.entries) == [("text", "c", None), ("text", "a", None), ("text", "d", None)]
+    assert (assets.cache.memory, assets.cache.evictions) == (30, 1)
+
+    assets.get(("text", "big", None), lambda: "BIG", lambda _: 100)
+    assert list(assets.cache.entries) == [("text", "big", None)]
+    assert assets.cache.evictions == 4
+
+
+def test_warm_up_preloads_menu_assets() -> None:
+    pygame.font.init()
+    theme = Theme(PackagedAssetLocator("pybattletank.assets"), "theme.json")
+    assets = AssetManager()
+    assets.warm_up(theme)
+    misses = assets.cache.misses
+    MainMenuGameMode(theme, assets)
+    MessageGameMode(theme, "Level loading failed!", assets)
+    assert assets.cache.misses == misses
+
+
+def test_rendered_text_is_cached() -> None:
+    pygame.font.init()
+    theme = Theme(PackagedAssetLocator("pybattletank.assets"), "theme.json")
+    assets = AssetManager()
+    menu = MainMenuGameMode(theme, assets)
+    surface = pygame.Surface((640, 480))
+    menu.render(surface)
+    texts = assets.text_cache.misses
+    menu.render(surface)
+    MainMenuGameMode(theme, assets).render(surface)
+    assert assets.text_cache.misses == texts
+
+    title = assets.text(theme.title_font, theme.title_size, "TANK BATTLEGROUNDS !!!", (200, 0, 0))
+    assert assets.text(theme.title_font, theme.title_size, "TANK BATTLEGROUNDS !!!", pygame.Color(200, 0, 0)) is title
+    assert assets.text(theme.title_font, theme.title_size, "TANK BATTLEGROUNDS !!!", (0, 200, 0)) is not title
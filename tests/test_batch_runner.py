@@ -0,0 +1,56 @@
+import csv
+import json
+import pathlib
+
+from pybattletank.finders.directory_level_finder import DirectoryLevelFinder
+from pybattletank.simulation.batch_runner import BatchRunner
+
+
+def test_batch_runner_aggregates_matches(tmp_path: pathlib.Path) -> None:
+    levels = sorted(DirectoryLevelFinder("pybattletank/assets").all(), key=lambda level: level["name"])
+    runner = BatchRunner("idle", range(3), 40, workers=2)
+    matches = runner.run(levels)
+    assert [(match.level, match.seed) for match in matches] == [
+        (level["name"], seed) for level in levels for seed in range(3)
+    ]
+
+    summaries = runner.summarize(matches)
+    assert [summary.level for summary in summaries] == ["level1", "level2"]
+    for summary in summaries:
+        assert summary.matches == 3
+        assert summary.wins + summary.losses + summary.timeouts == 3
+        assert summary.mean_ticks <= 40
+
+    csv_file = tmp_path / "matches.csv"
+    runner.write_csv(str(csv_file), matches)
+    with open(csv_file, encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 6
+    assert rows[0]["level"] == "level1"
+
+    json_file = tmp_path / "matches.json"
+    runner.write_json(str(json_file), matches)
+    with open(json_file, encoding="utf-8") as file:
+        report = json.load(file)
+    assert report["policy"] == "idle"
+    assert len(report["levels"]) == 2
+    assert len(report["matches"]) == 6
+
+
+def test_batch_runner_reports_broken_levels(tmp_path: pathlib.Path) -> None:
+    bad_file = tmp_path / "bad.tmx"
+    bad_file.write_text("not a map", encoding="utf-8")
+    levels = [
+        {"name": "bad", "path": bad_file},
+        {"name": "level1", "path": pathlib.Path("pybattletank/assets/level1.tmx")},
+    ]
+    for workers in (1, 2):
+        runner = BatchRunner("idle", range(2), 20, workers=workers)
+        matches = runner.run(levels)
+        assert [match.outcome for match in matches[:2]] == ["error", "error"]
+        assert all(match.error != "" for match in matches[:2])
+        assert all(match.outcome != "error" and match.error == "" for match in matches[2:])
+
+        bad, good = runner.summarize(matches)
+        assert (bad.level, bad.matches, bad.errors) == ("bad", 2, 2)
+        assert (good.level, good.errors) == ("level1", 0)
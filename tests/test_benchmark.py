@@ -0,0 +1,78 @@
+import json
+import pathlib
+
+import pygame
+import pytest
+
+from pybattletank.benchmark.benchmark_case import BenchmarkCase, BenchmarkCaseError
+from pybattletank.benchmark.benchmark_suite import BenchmarkSuite
+from pybattletank.benchmark.level_generator import LevelGenerator, LevelGeneratorError
+from pybattletank.layers.theme import Theme
+from pybattletank.locators.packaged_asset_locator import PackagedAssetLocator
+from pybattletank.state.level_loader import LevelLoader
+
+
+def test_generated_level_loads(tmp_path: pathlib.Path) -> None:
+    filename = str(tmp_path / "generated.tmx")
+    LevelGenerator(40, 30, 25, seed=3).write(filename)
+    loader = LevelLoader(filename)
+    loader.run()
+    state = loader.state
+    assert state.world_size == (40, 30)
+    assert loader.tanks_count == 1
+    assert len(state.units) == 25
+    assert len({unit.position for unit in state.units}) == 25
+    assert all(state.walls[int(unit.position[1])][int(unit.position[0])] is None for unit in state.units)
+
+
+def test_generator_rejects_too_many_units() -> None:
+    with pytest.raises(LevelGeneratorError):
+        LevelGenerator(2, 2, 5)
+
+
+def test_benchmark_case_parse() -> None:
+    assert BenchmarkCase.parse("64x32:100") == BenchmarkCase(64, 32, 100)
+    with pytest.raises(BenchmarkCaseError):
+        BenchmarkCase.parse("64x32")
+
+
+def test_benchmark_suite_writes_json(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.init()
+    theme = Theme(PackagedAssetLocator("pybattletank.assets"), "theme.json")
+    suite = BenchmarkSuite(theme, str(tmp_path), ticks=20, frames=2, memory_ticks=5)
+    results = suite.run([BenchmarkCase(16, 10, 10)])
+    output = str(tmp_path / "benchmark.json")
+    suite.write_json(output, results, "test")
+
+    with open(output, encoding="utf-8") as file:
+        report = json.load(file)
+    assert report["label"] == "test"
+    (result,) = report["results"]
+    assert result["case"] == "16x10:10"
+    assert result["ticks"] == 20
+    assert [layer["layer"] for layer in result["layers"]][:2] == ["ArrayLayer", "ArrayLayer"]
+    assert result["peak_memory"] > 0
+    pygame.mixer.quit()
+
+
+def test_generated_maze_level_loads(tmp_path: pathlib.Path) -> None:
+    filename = str(tmp_path / "maze.tmx")
+    LevelGenerator(31, 21, 10, seed=2, tanks=20, maze=True).write(filename)
+    loader = LevelLoader(filename)
+    loader.run()
+    state = loader.state
+    assert loader.tanks_count == 21
+    assert len(state.units) == 30
+    assert all(unit.mobile for unit in state.units[:21])
+    assert not any(unit.mobile for unit in state.units[21:])
+    assert not any(state.is_wall(unit.position) for unit in state.units)
+
+
+def test_benchmark_case_parse_maze() -> None:
+    case = BenchmarkCase.parse("127x127:50:200:maze")
+    assert case == BenchmarkCase(127, 127, 50, 200, True)
+    assert case.name == "127x127:50:200:maze"
+    assert BenchmarkCase.parse("64x64:10:maze") == BenchmarkCase(64, 64, 10, 0, True)
+    with pytest.raises(BenchmarkCaseError):
+        BenchmarkCase.parse("64x64:10:5:6")
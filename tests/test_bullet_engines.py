@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from pybattletank.engines.bullet_engines import create_bullet_engine
+from pybattletank.state.game_state import GameState
+from pybattletank.state.game_state_observer import IGameStateObserver
+from pybattletank.state.unit import Unit
+from pybattletank.systems.cleanup_system import CleanupSystem
+
+
+class DestroyedRecorder(IGameStateObserver):
+    def __init__(self, state: GameState) -> None:
+        self.state = state
+        self.destroyed: list[int] = []
+
+    def unit_destroyed(self, unit: Unit) -> None:
+        self.destroyed.append(self.state.units.index(unit))
+
+
+def build_state(seed: int) -> GameState:
+    rng = random.Random(seed)
+    state = GameState()
+    state.world_size = (24, 16)
+    cells = [(x, y) for y in range(16) for x in range(24)]
+    picked = rng.sample(cells, 90)
+    state.units = [Unit(cell, (0, 0)) for cell in picked[:60]]
+    state.walls = [[None] * 24 for _ in range(16)]
+    for x, y in picked[60:]:
+        state.walls[y][x] = (0, 0)
+    state.build_occupancy()
+    state.bullet_delay = 3
+    return state
+
+
+def simulate(engine_name: str, seed: int, ticks: int) -> list[tuple]:
+    rng = random.Random(seed)
+    state = build_state(seed)
+    recorder = DestroyedRecorder(state)
+    state.add_observer(recorder)
+    engine = create_bullet_engine(engine_name)
+    history = []
+    for _ in range(ticks):
+        count = len(state.bullets)
+        for unit in rng.sample(state.units, 8):
+            unit.weapon_target = (rng.uniform(-2, 25), rng.uniform(-2, 17))
+            state.fire_bullet(unit)
+        engine.move(state, count)
+        CleanupSystem().run(state)
+        state.epoch += 1
+        history.append((
+            [(bullet.previous_position, bullet.position) for bullet in state.bullets],
+            [unit.alive for unit in state.units],
+            list(recorder.destroyed),
+            state.collision_candidates,
+        ))
+    return history
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_numpy_engine_matches_python_engine(seed: int) -> None:
+    pytest.importorskip("numpy")
+    assert simulate("numpy", seed, 200) == simulate("python", seed, 200)
+
+
+def test_cleanup_compacts_in_place() -> None:
+    state = build_state(0)
+    bullets = state.bullets
+    state.fire_bullet(state.units[0])
+    state.fire_bullet(state.units[1])
+    bullets[0].alive = False
+    CleanupSystem().run(state)
+    assert state.bullets is bullets
+    assert len(bullets) == 1
+
+
+@pytest.mark.parametrize("engine_name", ["python", "numpy"])
+def test_only_occupied_cells_are_collision_candidates(engine_name: str) -> None:
+    if engine_name == "numpy":
+        pytest.importorskip("numpy")
+    state = GameState()
+    state.world_size = (8, 3)
+    shooter = Unit((0, 1), (0, 0))
+    target = Unit((3, 1), (0, 0))
+    state.units = [shooter, target, Unit((5, 0), (0, 0))]
+    state.build_occupancy()
+    shooter.weapon_target = (3.0, 1.0)
+    state.fire_bullet(shooter)
+
+    engine = create_bullet_engine(engine_name)
+    candidates = []
+    while state.bullets:
+        state.collision_candidates = 0
+        engine.move(state, len(state.bullets))
+        CleanupSystem().run(state)
+        candidates.append(state.collision_candidates)
+
+    assert not target.alive
+    assert candidates[:4] == [1, 1, 1, 1]
+    assert candidates[-1] == 1
+    assert sum(candidates) == 5
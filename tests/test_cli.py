@@ -0,0 +1,46 @@
+import pathlib
+
+import pytest
+
+from pybattletank.benchmark.benchmark_case import BenchmarkCase
+from pybattletank.cli import build_parser, replay, simulate
+
+
+def test_game_settings_are_validated() -> None:
+    args = build_parser().parse_args(["--sim-rate", "30", "--fps", "0", "--asset-budget", "16"])
+    assert (args.sim_rate, args.fps, args.asset_budget) == (30.0, 0, 16)
+    for argv in (
+        ["--sim-rate", "0"],
+        ["--sim-rate", "-5"],
+        ["--sim-rate", "nan"],
+        ["--sim-rate", "inf"],
+        ["--fps", "-1"],
+        ["--asset-budget", "0"],
+        ["--asset-budget", "-64"],
+    ):
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(argv)
+
+
+def test_benchmark_cases_are_validated(capsys: pytest.CaptureFixture[str]) -> None:
+    args = build_parser().parse_args(["benchmark", "--case", "64x32:100", "--case", "127x127:50:200:maze"])
+    assert args.cases == [BenchmarkCase(64, 32, 100), BenchmarkCase(127, 127, 50, 200, True)]
+    assert build_parser().parse_args(["benchmark"]).cases is None
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["benchmark", "--case", "64x32"])
+    assert "Invalid benchmark case 64x32" in capsys.readouterr().err
+
+
+def test_replay_reports_corrupt_files(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]) -> None:
+    replay_file = tmp_path / "game.pbr"
+    replay_file.write_bytes(b"not a replay")
+    assert replay(build_parser().parse_args(["replay", str(replay_file)])) == 1
+    assert capsys.readouterr().out != ""
+    assert replay(build_parser().parse_args(["replay", str(tmp_path / "missing.pbr")])) == 1
+    assert "missing.pbr" in capsys.readouterr().out
+
+
+def test_simulate_reports_missing_levels(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]) -> None:
+    level = str(tmp_path / "missing.tmx")
+    assert simulate(build_parser().parse_args(["simulate", level, "--policy", "idle"])) == 1
+    assert "file not exist" in capsys.readouterr().out
@@ -0,0 +1,25 @@
+import pytest
+
+from pybattletank.ui.fixed_timestep import FixedTimestep, FixedTimestepError
+
+
+def test_runs_whole_ticks_and_keeps_remainder() -> None:
+    timestep = FixedTimestep(50.0)
+    assert timestep.advance(0.01) == 0
+    assert timestep.alpha == pytest.approx(0.5)
+    assert timestep.advance(0.035) == 2
+    assert timestep.alpha == pytest.approx(0.25)
+
+
+def test_catch_up_is_capped() -> None:
+    timestep = FixedTimestep(60.0, max_ticks_per_frame=3)
+    assert timestep.advance(1.0) == 3
+    assert timestep.dropped_ticks == 57
+    assert 0.0 <= timestep.alpha < 1.0
+    timestep.reset()
+    assert timestep.alpha == 0.0
+
+
+def test_rejects_invalid_rate() -> None:
+    with pytest.raises(FixedTimestepError):
+        FixedTimestep(0)
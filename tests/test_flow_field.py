@@ -0,0 +1,52 @@
+from pybattletank.modes.play_game_mode import PlayGameMode
+from pybattletank.state.flow_field import FlowField
+from pybattletank.state.game_state import GameState
+from pybattletank.state.unit import Unit
+
+
+def build_state() -> GameState:
+    state = GameState()
+    state.world_size = (5, 3)
+    state.walls = [[None] * 5 for _ in range(3)]
+    state.walls[0][2] = (0, 0)
+    state.walls[1][2] = (0, 0)
+    player = Unit((0, 0), (0, 0))
+    tank = Unit((4, 0), (0, 0))
+    tank.mobile = True
+    state.units = [player, tank]
+    state.build_occupancy()
+    return state
+
+
+def test_flow_field_distances_go_around_walls() -> None:
+    state = build_state()
+    field = FlowField(state)
+    assert field.update((0, 0))
+    assert not field.update((0, 0))
+    assert field.computations == 1
+    assert field.distance((4, 0)) == 8
+    assert field.distance((2, 0)) == -1
+    assert field.moves((4, 0)) == [(-1, 0), (0, 1)]
+    assert field.moves((2, 2)) == [(-1, 0)]
+    assert field.moves((0, 0)) == []
+
+
+def test_tanks_chase_player() -> None:
+    state = build_state()
+    state.tank_move_delay = 1
+    mode = PlayGameMode()
+    mode.load_state(state)
+    tank = state.units[1]
+    for _ in range(7):
+        mode.update()
+    assert tank.position == (0, 1)
+    assert mode.flow_field.computations == 1
+
+
+def test_flow_field_is_not_computed_without_tanks() -> None:
+    state = build_state()
+    state.units[1].mobile = False
+    mode = PlayGameMode()
+    mode.load_state(state)
+    mode.update()
+    assert mode.flow_field.computations == 0
@@ -1,4 +1,7 @@
+from pybattletank.command.move_command import MoveCommand
+from pybattletank.state.bullet import Bullet
 from pybattletank.state.game_state import GameState
+from pybattletank.state.unit import Unit
 
 
 def test_is_inside() -> None:
@@ -7,3 +10,122 @@ def test_is_inside() -> None:
     assert state.is_inside((0, 0))
     assert state.is_inside((15, 9))
     assert not state.is_inside((16, 10))
+
+
+def test_find_unit_uses_occupancy() -> None:
+    state = GameState()
+    state.world_size = (4, 3)
+    tank = Unit((1, 2), (0, 0))
+    tower = Unit((3, 0), (0, 1))
+    state.units = [tank, tower]
+    state.build_occupancy()
+    assert state.find_unit((1.7, 2.2)) is tank
+    assert state.find_unit((3, 0)) is tower
+    assert state.find_unit((0, 0)) is None
+    assert state.find_unit((4.5, 0)) is None
+
+    tower.alive = False
+    assert state.find_unit((3, 0)) is tower
+    assert state.find_live_unit((3, 0)) is None
+
+
+def test_move_command_updates_occupancy() -> None:
+    state = GameState()
+    state.world_size = (3, 1)
+    state.walls = [[None, None, None]]
+    tank = Unit((0, 0), (0, 0))
+    wreck = Unit((2, 0), (0, 1))
+    wreck.alive = False
+    state.units = [tank, wreck]
+    state.build_occupancy()
+
+    MoveCommand(state, tank, (1, 0)).run()
+    assert tank.position == (1, 0)
+    assert state.find_unit((0, 0)) is None
+    assert state.find_unit((1, 0)) is tank
+
+    MoveCommand(state, tank, (1, 0)).run()
+    assert tank.position == (1, 0)
+
+
+def test_game_items_have_no_instance_dict() -> None:
+    unit = Unit((1, 2), (0, 0))
+    assert not hasattr(unit, "__dict__")
+    assert not hasattr(Bullet(unit), "__dict__")
+
+
+def test_units_in_range() -> None:
+    state = GameState()
+    state.world_size = (10, 10)
+    state.units = [Unit((5, 5), (0, 0)), Unit((8, 5), (0, 0)), Unit((5, 2), (0, 0)), Unit((1, 1), (0, 0))]
+    state.units[2].alive = False
+    state.build_occupancy()
+    assert state.units_in_range((5, 5), 3) == state.units[:2]
+    assert state.units_in_range((5, 5), 3, alive_only=False) == state.units[:3]
+    assert state.units_in_range((5.5, 5), 2.5) == [state.units[0], state.units[1]]
+    assert state.units_in_range((20, 20), 3) == []
+    assert state.units_in_range((5, 5), 20) == [state.units[0], state.units[1], state.units[3]]
+
+
+def test_nearest_units() -> None:
+    state = GameState()
+    state.world_size = (20, 20)
+    state.units = [Unit((0, 0), (0, 0)), Unit((19, 19), (0, 0)), Unit((3, 0), (0, 0)), Unit((0, 3), (0, 0))]
+    state.build_occupancy()
+    player = state.units[0]
+    assert state.nearest_units(player.position, 1, exclude=player) == [state.units[2]]
+    assert state.nearest_units(player.position, 3, exclude=player) == [state.units[2], state.units[3], state.units[1]]
+    state.units[2].alive = False
+    state.units[3].alive = False
+    assert state.nearest_units(player.position, 1, exclude=player) == [state.units[1]]
+
+
+def test_stacked_units_are_promoted() -> None:
+    state = GameState()
+    state.world_size = (3, 1)
+    state.walls = [[None, None, None]]
+    tank = Unit((1, 0), (0, 0))
+    tower = Unit((1, 0), (0, 1))
+    state.units = [tank, tower]
+    state.build_occupancy()
+    assert state.find_unit((1, 0)) is tank
+    assert state.units_in_range((0, 0), 1) == [tank, tower]
+
+    state.move_unit(tank, (2, 0))
+    assert state.find_unit((1, 0)) is tower
+    assert state.find_unit((2, 0)) is tank
+    assert state.stacked_units == []
+
+
+def build_walled_state() -> GameState:
+    state = GameState()
+    state.world_size = (8, 3)
+    state.walls = [[None] * 8 for _ in range(3)]
+    state.walls[1][4] = (0, 0)
+    state.units = [Unit((1, 1), (0, 0)), Unit((6, 1), (0, 0)), Unit((3, 0), (0, 0))]
+    state.build_occupancy()
+    return state
+
+
+def test_raycast_stops_at_first_wall_or_unit() -> None:
+    state = build_walled_state()
+    player, hidden, visible = state.units
+    assert state.is_wall((4, 1))
+    assert not state.is_wall((3, 1))
+
+    hit = state.raycast(player.position, hidden.position, ignore=player)
+    assert hit is not None
+    assert hit.cell == (4, 1)
+    assert hit.unit is None
+    assert hit.position == (3.5, 1.0)
+    assert not state.can_see(player, hidden)
+    assert state.can_see(player, visible)
+    assert state.raycast((0, 2), (7, 2)) is None
+
+
+def test_bullets_stop_at_walls() -> None:
+    state = build_walled_state()
+    player = state.units[0]
+    player.weapon_target = (6.0, 1.0)
+    state.fire_bullet(player)
+    assert state.bullets[0].end_position == (3.5, 1.0)
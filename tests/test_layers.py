@@ -0,0 +1,121 @@
+import pygame
+
+from pybattletank.layers.array_layer import ArrayLayer
+from pybattletank.layers.asset_manager import AssetManager
+from pybattletank.layers.bullets_layer import BulletsLayer
+from pybattletank.layers.camera import Camera
+from pybattletank.layers.theme import Theme
+from pybattletank.layers.units_layer import UnitsLayer
+from pybattletank.locators.packaged_asset_locator import PackagedAssetLocator
+from pybattletank.state.bullet import Bullet
+from pybattletank.state.game_state import GameState
+from pybattletank.state.unit import Unit
+
+
+def test_bullets_layer_reports_moved_bullets() -> None:
+    theme = Theme(PackagedAssetLocator("pybattletank.assets"), "theme.json")
+    state = GameState()
+    unit = Unit((1, 1), (0, 0))
+    state.bullets.append(Bullet(unit))
+    layer = BulletsLayer(theme, theme.bullets_tileset, state, state.bullets)
+
+    first = layer.dirty_rects()
+    assert len(first) == 1
+    assert first[0].collidepoint(64, 64)
+    assert layer.dirty_rects() == []
+
+    state.bullets[0].position = (3, 1)
+    moved = layer.dirty_rects()
+    assert len(moved) == 2
+    assert moved[0] == first[0]
+    assert moved[1].collidepoint(3 * 64, 64)
+
+    state.bullets[0].alive = False
+    assert layer.dirty_rects() == [moved[1]]
+
+    surface = pygame.Surface((320, 320))
+    layer.render_region(surface, pygame.Rect(0, 0, 320, 320))
+
+
+def test_bullets_layer_interpolates_positions() -> None:
+    theme = Theme(PackagedAssetLocator("pybattletank.assets"), "theme.json")
+    state = GameState()
+    bullet = Bullet(Unit((1, 1), (0, 0)))
+    state.bullets.append(bullet)
+    layer = BulletsLayer(theme, theme.bullets_tileset, state, state.bullets)
+
+    bullet.position = (2, 1)
+    assert layer.sprites()[0][0] == (2, 1)
+    layer.interpolation = 0.25
+    assert layer.sprites()[0][0] == (1.25, 1)
+
+
+def test_camera_follows_and_clamps() -> None:
+    camera = Camera((100, 50), (64, 64), (640, 320))
+    assert not camera.follow((2, 2))
+    assert (camera.x, camera.y) == (0, 0)
+    assert camera.follow((50, 25))
+    assert (camera.x, camera.y) == (50 * 64 + 32 - 320, 25 * 64 + 32 - 160)
+    camera.follow((99, 49))
+    assert camera.rect == pygame.Rect(100 * 64 - 640, 50 * 64 - 320, 640, 320)
+    assert camera.visible_cells() == ((90, 45), (99, 49))
+    assert camera.is_visible((95, 47))
+    assert not camera.is_visible((80, 47))
+    assert camera.to_world((10, 20)) == (camera.x + 10, camera.y + 20)
+
+
+def test_array_layer_renders_visible_chunks() -> None:
+    theme = Theme(PackagedAssetLocator("pybattletank.assets"), "theme.json")
+    state = GameState()
+    state.world_size = (100, 100)
+    ground = [[(0, 0)] * 100 for _ in range(100)]
+    layer = ArrayLayer(theme, theme.ground_tileset, state, ground, 0, chunk_tiles=4)
+    layer.camera = Camera(state.world_size, theme.tile_size, (512, 256))
+    surface = pygame.Surface((512, 256))
+
+    layer.render(surface)
+    assert len(layer.chunks) == 2
+    layer.render(surface)
+    assert layer.chunks_created == 2
+
+    capacity = layer.chunk_capacity((512, 256))
+    for x in range(0, 100, 2):
+        layer.camera.follow((x, x))
+        layer.render(surface)
+        assert len(layer.chunks) <= capacity
+
+    small_surface = pygame.Surface((128, 128))
+    layer.render(small_surface)
+    assert len(layer.chunks) <= layer.chunk_capacity((128, 128)) < capacity
+
+
+def test_units_layer_culls_units_outside_camera() -> None:
+    theme = Theme(PackagedAssetLocator("pybattletank.assets"), "theme.json")
+    state = GameState()
+    state.world_size = (100, 100)
+    state.units = [Unit((1, 1), (0, 0)), Unit((50, 50), (0, 0)), Unit((3, 2), (0, 0))]
+    state.build_occupancy()
+    layer = UnitsLayer(theme, theme.units_tileset, state, state.units)
+    assert len(layer.sprites()) == 6
+
+    layer.camera = Camera(state.world_size, theme.tile_size, (640, 320))
+    assert layer.visible_units() == [state.units[0], state.units[2]]
+    layer.camera.follow((50, 50))
+    assert layer.visible_units() == [state.units[1]]
+    assert layer.dirty_rects()[0].collidepoint(320, 160)
+
+
+def test_layers_share_sliced_tilesets() -> None:
+    theme = Theme(PackagedAssetLocator("pybattletank.assets"), "theme.json")
+    state = GameState()
+    assets = AssetManager()
+    bullets = BulletsLayer(theme, theme.bullets_tileset, state, state.bullets, assets=assets)
+    units = UnitsLayer(theme, theme.explosions_tileset, state, state.units, assets=assets)
+    assert bullets.tileset is units.tileset
+
+    tileset = bullets.tileset
+    assert (tileset.columns, tileset.rows) == (32, 32)
+    tile = tileset.tile((2, 1))
+    assert tile.get_size() == theme.tile_size
+    assert tile.get_offset() == (128, 64)
+    assert tileset.rect((2, 1)) == pygame.Rect(128, 64, 64, 64)
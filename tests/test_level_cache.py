@@ -0,0 +1,56 @@
+import os
+import pathlib
+import shutil
+
+from pybattletank.state.level_cache import LevelCache
+from pybattletank.state.level_loader import LevelLoader
+
+LEVEL = pathlib.Path("pybattletank/assets/level2.tmx")
+
+
+def load(filename: pathlib.Path, cache: LevelCache) -> LevelLoader:
+    loader = LevelLoader(str(filename), cache)
+    loader.run()
+    return loader
+
+
+def test_compiled_level_matches_tmx(tmp_path: pathlib.Path) -> None:
+    level = tmp_path / "level.tmx"
+    shutil.copy(LEVEL, level)
+    cache = LevelCache(tmp_path / "cache")
+
+    parsed = load(level, cache)
+    assert not parsed.from_cache
+    assert cache.cache_path(str(level)).exists()
+
+    cached = load(level, cache)
+    assert cached.from_cache
+    assert cached.state.world_size == parsed.state.world_size
+    assert cached.state.ground == parsed.state.ground
+    assert cached.state.walls == parsed.state.walls
+    assert [(unit.position, unit.tile) for unit in cached.state.units] == [
+        (unit.position, unit.tile) for unit in parsed.state.units
+    ]
+    assert cached.tanks_count == parsed.tanks_count
+    assert cached.tile_size == parsed.tile_size
+    assert cached.units_tileset == parsed.units_tileset
+    assert cached.explosions_tileset == parsed.explosions_tileset
+    assert cached.state.find_unit(parsed.state.units[-1].position) is cached.state.units[-1]
+
+
+def test_stale_compiled_level_is_rebuilt(tmp_path: pathlib.Path) -> None:
+    level = tmp_path / "level.tmx"
+    shutil.copy(LEVEL, level)
+    cache = LevelCache(tmp_path / "cache")
+    load(level, cache)
+
+    stat = os.stat(level)
+    os.utime(level, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load(level, cache).from_cache
+
+    level.write_text(level.read_text().replace('width="19"', 'width="19" ', 1))
+    assert not load(level, cache).from_cache
+    assert load(level, cache).from_cache
+
+    cache.cache_path(str(level)).write_bytes(b"PBTL")
+    assert not load(level, cache).from_cache
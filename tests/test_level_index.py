@@ -0,0 +1,45 @@
+import os
+import pathlib
+import shutil
+
+from pybattletank.finders.directory_level_finder import DirectoryLevelFinder
+from pybattletank.finders.level_index import LevelIndex
+
+LEVEL = pathlib.Path("pybattletank/assets/level2.tmx")
+
+
+def test_level_metadata_is_persisted(tmp_path: pathlib.Path) -> None:
+    levels_dir = tmp_path / "levels"
+    levels_dir.mkdir()
+    shutil.copy(LEVEL, levels_dir / "level2.tmx")
+    index = LevelIndex(tmp_path / "index.json")
+
+    (level,) = DirectoryLevelFinder(levels_dir, index).all()
+    assert level["name"] == "level2"
+    assert level["path"] == (levels_dir / "level2.tmx").resolve()
+    assert level["world_size"] == (19, 11)
+    assert level["tanks"] == 1
+    assert pathlib.Path(level["tilesets"]["units"]).name == "units.png"
+    assert index.extractions == 1
+
+    reloaded = LevelIndex(tmp_path / "index.json")
+    assert DirectoryLevelFinder(levels_dir, reloaded).all() == [level]
+    assert reloaded.extractions == 0
+
+
+def test_changed_levels_are_extracted_again(tmp_path: pathlib.Path) -> None:
+    shutil.copy(LEVEL, tmp_path / "a.tmx")
+    shutil.copy(LEVEL, tmp_path / "b.tmx")
+    index = LevelIndex(tmp_path / "index" / "index.json")
+    assert [level["name"] for level in index.levels(tmp_path)] == ["a", "b"]
+    assert index.extractions == 2
+
+    (tmp_path / "b.tmx").write_text("broken", encoding="utf-8")
+    shutil.copy(LEVEL, tmp_path / "c.tmx")
+    os.remove(tmp_path / "a.tmx")
+    index = LevelIndex(tmp_path / "index" / "index.json")
+    levels = index.levels(tmp_path)
+    assert [level["name"] for level in levels] == ["b", "c"]
+    assert "world_size" not in levels[0]
+    assert levels[1]["world_size"] == (19, 11)
+    assert index.extractions == 2
@@ -0,0 +1,36 @@
+from pybattletank.ui.level_prefetcher import LevelPrefetcher
+
+LEVEL = "pybattletank/assets/level2.tmx"
+
+
+def test_prefetched_level_is_taken_from_the_worker() -> None:
+    prefetcher = LevelPrefetcher(threaded=True)
+    prefetcher.prefetch(LEVEL)
+    prefetched = prefetcher.loads[LEVEL]
+    load = prefetcher.take(LEVEL)
+    assert load is prefetched
+    load.future.result(timeout=10)
+    assert load.loader.progress == 1.0
+    assert load.loader.state.world_size[0] > 0
+    assert prefetcher.take(LEVEL) is not load
+    prefetcher.shutdown()
+
+
+def test_prefetch_keeps_only_the_latest_levels() -> None:
+    prefetcher = LevelPrefetcher(capacity=1, threaded=True)
+    prefetcher.prefetch(LEVEL)
+    prefetcher.prefetch("pybattletank/assets/level1.tmx")
+    assert list(prefetcher.loads) == ["pybattletank/assets/level1.tmx"]
+    prefetcher.shutdown()
+
+
+def test_unthreaded_loads_complete_immediately() -> None:
+    prefetcher = LevelPrefetcher(threaded=False)
+    prefetcher.prefetch(LEVEL)
+    assert len(prefetcher.loads) == 0
+    load = prefetcher.take(LEVEL)
+    assert load.future.done()
+    assert load.loader.progress == 1.0
+
+    missing = prefetcher.take("missing.tmx")
+    assert missing.future.exception() is not None
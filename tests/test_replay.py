@@ -0,0 +1,76 @@
+import io
+import pathlib
+import shutil
+
+import pytest
+
+from pybattletank.modes.player_input import PlayerInput
+from pybattletank.replay.replay_error import ReplayError
+from pybattletank.replay.replay_header import ReplayHeader
+from pybattletank.replay.replay_player import ReplayPlayer
+from pybattletank.replay.replay_record import ReplayRecord
+from pybattletank.replay.replay_recorder import ReplayRecorder
+from pybattletank.simulation.random_policy import RandomPolicy
+from pybattletank.simulation.simulator import Simulator
+
+LEVEL = "pybattletank/assets/level1.tmx"
+
+
+def record(filename: pathlib.Path, hash_interval: int = 10) -> str:
+    with open(filename, "wb") as file:
+        recorder = ReplayRecorder(file, ReplayHeader.for_level(LEVEL, hash_interval))
+        result = Simulator(LEVEL, RandomPolicy(4), 2000, recorder=recorder).run()
+    return result.outcome
+
+
+def test_replay_reproduces_recorded_game(tmp_path: pathlib.Path) -> None:
+    replay_file = tmp_path / "game.pbr"
+    outcome = record(replay_file)
+
+    result = ReplayPlayer(str(replay_file), LEVEL).run()
+    assert result.level == "level1"
+    assert result.outcome == outcome
+    assert result.hashes_checked > 0
+    assert result.divergence_epoch is None
+
+
+def test_replay_detects_divergence(tmp_path: pathlib.Path) -> None:
+    replay_file = tmp_path / "game.pbr"
+    record(replay_file, hash_interval=1)
+    data = bytearray(replay_file.read_bytes())
+    data[-1] ^= 0xFF
+    replay_file.write_bytes(bytes(data))
+
+    result = ReplayPlayer(str(replay_file), LEVEL).run()
+    assert result.divergence_epoch is not None
+
+
+def test_replay_rejects_other_level(tmp_path: pathlib.Path) -> None:
+    replay_file = tmp_path / "game.pbr"
+    record(replay_file)
+    other_level = tmp_path / "level1.tmx"
+    shutil.copy("pybattletank/assets/level2.tmx", other_level)
+    with pytest.raises(ReplayError):
+        ReplayPlayer(str(replay_file), str(other_level)).run()
+
+
+def test_records_round_trip() -> None:
+    records = [
+        ReplayRecord(PlayerInput((1, 0), (2.5, 3.25), True), end_of_tick=False),
+        ReplayRecord(PlayerInput((0, -1), (2.5, 3.25)), state_hash=b"12345678"),
+        ReplayRecord(None),
+        ReplayRecord(PlayerInput(target=(-1.0, 0.5))),
+    ]
+    file = io.BytesIO()
+    last_target = None
+    for record in records:
+        last_target = record.write(file, last_target)
+    assert len(file.getvalue()) == 1 + 16 + 1 + 8 + 1 + 1 + 16
+
+    file.seek(0)
+    decoded = []
+    target = (0.0, 0.0)
+    while (entry := ReplayRecord.read(file, target)) is not None:
+        record, target = entry
+        decoded.append(record)
+    assert decoded == records
@@ -0,0 +1,32 @@
+import pygame
+
+from pybattletank.layers.rotated_tile_cache import RotatedTileCache
+
+
+def test_rotated_tiles_are_cached_per_quantized_angle() -> None:
+    tileset = pygame.Surface((128, 64), pygame.SRCALPHA)
+    tile_rect = pygame.Rect(64, 0, 64, 64)
+    cache = RotatedTileCache(angle_step=5)
+
+    rotated, offset = cache.get("units.png", tileset, tile_rect, 44)
+    assert rotated.get_size() == pygame.transform.rotate(pygame.Surface((64, 64)), 45).get_size()
+    assert offset == ((rotated.get_width() - 64) // 2, (rotated.get_height() - 64) // 2)
+    assert cache.get("units.png", tileset, tile_rect, 46)[0] is rotated
+    assert cache.get("units.png", tileset, tile_rect, 405)[0] is rotated
+    assert cache.hits == 2
+    assert cache.misses == 1
+    assert cache.hit_rate == 2 / 3
+
+
+def test_least_recently_used_tile_is_evicted() -> None:
+    tileset = pygame.Surface((64, 64), pygame.SRCALPHA)
+    tile_rect = pygame.Rect(0, 0, 64, 64)
+    cache = RotatedTileCache(capacity=2)
+
+    first = cache.get("a.png", tileset, tile_rect, 10)[0]
+    cache.get("a.png", tileset, tile_rect, 20)
+    cache.get("a.png", tileset, tile_rect, 10)
+    cache.get("a.png", tileset, tile_rect, 30)
+    assert len(cache.tiles) == 2
+    assert cache.get("a.png", tileset, tile_rect, 10)[0] is first
+    assert cache.misses == 3
@@ -0,0 +1,18 @@
+from pybattletank.simulation.idle_policy import IdlePolicy
+from pybattletank.simulation.policies import create_policy
+from pybattletank.simulation.simulator import Simulator
+
+LEVEL = "pybattletank/assets/level1.tmx"
+
+
+def test_simulator_times_out() -> None:
+    result = Simulator(LEVEL, IdlePolicy(), 50).run()
+    assert result.level == "level1"
+    assert result.outcome == "timeout"
+    assert result.ticks == 50
+
+
+def test_simulator_reports_outcome() -> None:
+    result = Simulator(LEVEL, create_policy("hunter"), 10000).run()
+    assert result.outcome in ("won", "lost")
+    assert result.ticks < 10000
@@ -0,0 +1,56 @@
+import pytest
+
+from pybattletank.modes.play_game_mode import PlayGameMode
+from pybattletank.replay.state_hash import state_hash
+from pybattletank.simulation.random_policy import RandomPolicy
+from pybattletank.state.game_state import SnapshotError
+from pybattletank.state.level_loader import LevelLoader
+
+
+def test_restore_rolls_back_the_game() -> None:
+    loader = LevelLoader("pybattletank/assets/level1.tmx")
+    loader.run()
+    mode = PlayGameMode()
+    mode.load_state(loader.state)
+    state = mode.game_state
+    policy = RandomPolicy(7, fire_probability=0.3)
+
+    for _ in range(61):
+        mode.apply_input(policy.next_input(state, mode.player_unit))
+        mode.update()
+    assert len(state.moved_units) > 0
+    snapshot = state.snapshot()
+    snapshot_hash = state_hash(state)
+
+    inputs = []
+    previous_positions = []
+    for _ in range(40):
+        player_input = policy.next_input(state, mode.player_unit)
+        inputs.append(player_input)
+        mode.apply_input(player_input)
+        mode.update()
+        previous_positions.append([unit.previous_position for unit in state.units])
+    final_hash = state_hash(state)
+    assert final_hash != snapshot_hash
+
+    bullets = state.bullets
+    state.restore(snapshot)
+    mode.game_over = False
+    assert state.bullets is bullets
+    assert state_hash(state) == snapshot_hash
+    assert all(state.find_unit(unit.position) is unit for unit in state.units if unit.alive)
+
+    for player_input, positions in zip(inputs, previous_positions):
+        mode.apply_input(player_input)
+        mode.update()
+        assert [unit.previous_position for unit in state.units] == positions
+    assert state_hash(state) == final_hash
+
+
+def test_restore_rejects_other_level() -> None:
+    loader = LevelLoader("pybattletank/assets/level1.tmx")
+    loader.run()
+    other = LevelLoader("pybattletank/assets/level2.tmx")
+    other.run()
+    with pytest.raises(SnapshotError):
+        other.state.restore(loader.state.snapshot())
@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+from pybattletank.cli import build_parser
+from pybattletank.ui.startup_report import StartupReport
+
+
+def test_report_lists_phases_and_total() -> None:
+    report = StartupReport(started=10.0)
+    report.phases = [("imports", 0.25), ("first frame", 0.05)]
+    report.last = 10.3
+    lines = report.format().splitlines()
+    assert lines == ["imports        250.0ms", "first frame     50.0ms", "total          300.0ms"]
+    assert build_parser().parse_args(["--startup-report"]).startup_report
+
+
+def test_game_entry_point_defers_level_loading_imports() -> None:
+    deferred = "{'tmx', 'pybattletank.modes.play_game_mode'}"
+    code = f"import sys, pybattletank.__main__, pybattletank.main; print(sorted({deferred} & set(sys.modules)))"
+    command = [sys.executable, "-c", code]
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout  # noqa: S603
+    assert output.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,39 @@
+from pybattletank.state.game_state import GameState
+from pybattletank.state.unit import Unit
+from pybattletank.systems.cleanup_system import CleanupSystem
+from pybattletank.systems.firing_system import FiringSystem
+from pybattletank.systems.targeting_system import TargetingSystem
+
+
+def build_state() -> GameState:
+    state = GameState()
+    state.world_size = (16, 4)
+    state.units = [Unit((1, 1), (0, 0)), Unit((4, 1), (0, 0)), Unit((12, 1), (0, 0)), Unit((2, 2), (0, 0))]
+    state.units[3].alive = False
+    state.build_occupancy()
+    return state
+
+
+def test_enemies_in_range_target_player() -> None:
+    state = build_state()
+    TargetingSystem(state.units[0]).run(state)
+    assert state.units[0].weapon_target == (0.0, 0.0)
+    assert [unit.weapon_target for unit in state.units[1:]] == [(1, 1), (0.0, 0.0), (1, 1)]
+
+
+def test_live_enemies_in_range_fire() -> None:
+    state = build_state()
+    player_unit = state.units[0]
+    TargetingSystem(player_unit).run(state)
+    firing = FiringSystem(player_unit)
+
+    firing.run(state)
+    assert [bullet.unit for bullet in state.bullets] == [state.units[1]]
+
+    state.epoch += 1
+    firing.run(state)
+    assert len(state.bullets) == 1
+
+    state.bullets[0].alive = False
+    CleanupSystem().run(state)
+    assert state.bullets == []
@@ -0,0 +1,88 @@
+import json
+import pathlib
+import shutil
+
+import pygame
+import pytest
+
+from pybattletank.layers.asset_manager import AssetManager
+from pybattletank.layers.theme import LoadThemeError, Theme
+from pybattletank.layers.theme_assets import ThemeAssets
+from pybattletank.layers.theme_library import ThemeLibrary
+from pybattletank.locators.directory_asset_locator import DirectoryAssetLocator
+from pybattletank.locators.packaged_asset_locator import PackagedAssetLocator
+from pybattletank.modes.play_game_mode import PlayGameMode
+
+
+def create_library(tmp_path: pathlib.Path, budget: int = 64 * 1024 * 1024) -> ThemeLibrary:
+    pygame.font.init()
+    shutil.copytree("pybattletank/assets", tmp_path, dirs_exist_ok=True)
+    data = json.loads((tmp_path / "theme.json").read_text(encoding="utf-8"))
+    data["tile"]["ground"] = "walls.png"
+    (tmp_path / "walls_theme.json").write_text(json.dumps(data), encoding="utf-8")
+    locator = DirectoryAssetLocator(tmp_path)
+    theme = Theme(locator, "theme.json")
+    assets = AssetManager()
+    assets.warm_up(theme)
+    return ThemeLibrary(locator, ThemeAssets(theme, assets), budget, threaded=True)
+
+
+def test_prefetched_theme_is_switched_without_decoding(tmp_path: pathlib.Path) -> None:
+    library = create_library(tmp_path)
+    library.prefetch("walls_theme.json")
+    library.pending[library.key("walls_theme.json")].result(timeout=10)
+    library.poll()
+    prefetched = library.sets[library.key("walls_theme.json")]
+
+    theme, assets = library.get("walls_theme.json")
+    assert assets is prefetched.assets
+    assert library.current is prefetched
+    assert theme.ground_tileset.endswith("walls.png")
+    assert assets.cache.misses == len(assets.cache.entries)
+    library.shutdown()
+
+
+def test_inactive_theme_sets_are_evicted_over_budget(tmp_path: pathlib.Path) -> None:
+    library = create_library(tmp_path, budget=0)
+    first = library.current
+    library.get("walls_theme.json")
+    assert list(library.sets.values()) == [library.current]
+    assert library.get("theme.json") is not first
+    library.shutdown()
+
+
+def test_invalid_theme_is_reported(tmp_path: pathlib.Path) -> None:
+    library = create_library(tmp_path)
+    (tmp_path / "broken.json").write_text('{"defaultWindowWidth": 1, "defaultWindowHeight": 1}', encoding="utf-8")
+    library.prefetch("broken.json")
+    with pytest.raises(LoadThemeError):
+        library.get("broken.json")
+    library.shutdown()
+
+
+def test_optional_sounds_are_set_only_when_they_exist() -> None:
+    theme = Theme(PackagedAssetLocator("pybattletank.assets"), "theme.json")
+    assert theme.fire_sound == "bullet_fire.wav"
+    assert theme.fail_music == "deadly_talk.mp3"
+    assert theme.start_music is None
+
+
+def test_level_is_reskinned_in_place(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame.font.init()
+    pygame.mixer.init()
+    theme = Theme(PackagedAssetLocator("pybattletank.assets"), "theme.json")
+    mode = PlayGameMode()
+    mode.load_level(theme, "pybattletank/assets/level1.tmx")
+    state = mode.game_state
+    state.epoch = 10
+    old_layers = mode.layers
+
+    assets = AssetManager()
+    mode.set_theme(theme, assets)
+    assert mode.game_state is state
+    assert state.epoch == 10
+    assert mode.assets is assets
+    assert state.observers == mode.layers
+    assert not any(layer in old_layers for layer in mode.layers)
+    pygame.mixer.quit()
@@ -0,0 +1,61 @@
+import asyncio
+import pathlib
+
+import pygame
+import pytest
+
+from pybattletank.finders.packaged_level_finder import PackagedLevelFinder
+from pybattletank.layers.theme import Theme
+from pybattletank.locators.packaged_asset_locator import PackagedAssetLocator
+from pybattletank.modes.message_game_mode import MessageGameMode
+from pybattletank.ui.user_interface import UserInterface
+
+
+def test_game_resumed_after_game_over_stops_recording(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    locator = PackagedAssetLocator("pybattletank.assets")
+    theme = Theme(locator, "theme.json")
+    theme.fail_music = None
+    ui = UserInterface(theme, locator, PackagedLevelFinder("pybattletank.assets"), record_dir=str(tmp_path))
+    ui.load_level_requested("pybattletank/assets/level1.tmx")
+    assert ui.pending_level is not None
+    ui.pending_level[1].future.result(timeout=10)
+    ui.poll_pending_level()
+    play_game_mode = ui.play_game_mode
+    assert play_game_mode is not None
+    assert play_game_mode.recorder is not None
+
+    play_game_mode.player_unit.alive = False
+    play_game_mode.update()
+    assert ui.recorder is None
+    assert play_game_mode.recorder is None
+
+    ui.show_menu_requested("main")
+    ui.show_game_requested()
+    ui.update_play(play_game_mode, ui.timestep.tick_duration)
+    assert ui.play_game_mode is play_game_mode
+    assert isinstance(ui.overlay_game_mode, MessageGameMode)
+    ui.prefetcher.shutdown()
+    ui.themes.shutdown()
+    pygame.mixer.quit()
+
+
+def test_audio_starts_after_the_first_frame(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.quit()
+    locator = PackagedAssetLocator("pybattletank.assets")
+    theme = Theme(locator, "theme.json")
+    theme.start_music = "deadly_talk.mp3"
+    ui = UserInterface(theme, locator, PackagedLevelFinder("pybattletank.assets"))
+    assert pygame.mixer.get_init() is None
+
+    def render() -> None:
+        ui.running = False
+
+    monkeypatch.setattr(ui, "render", render)
+    asyncio.run(ui.run())
+    assert pygame.mixer.get_init() is not None
+    assert pygame.mixer.music.get_busy()
+    pygame.mixer.quit()